@@ -9,9 +9,11 @@ setup(
         "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
         "pdfplumber>=0.10.0",
+        "pypdfium2>=4.18.0",
         "openpyxl>=3.1.0",
+        "numpy>=1.24.0",
         "pandas>=2.1.0",
-        "rapidfuzz>=3.5.0",
+        "rapidfuzz>=3.6.0",
         "click>=8.1.0",
         "pyyaml>=6.0",
         "python-dateutil>=2.8.0",
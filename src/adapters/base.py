@@ -5,13 +5,106 @@ Adding a new fund means writing a new adapter, not modifying core pipeline code.
 """
 
 import hashlib
+import io
+import json
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Optional
+from pathlib import Path
+from typing import Container, Optional
+
+import numpy as np
+import pandas as pd
+import pdfplumber
+
+from src.utils.normalization import join_number_tokens
 
 logger = logging.getLogger(__name__)
 
 
+def rows_from_words(
+    words: list[dict],
+    col_boundaries: list[float],
+    row_tolerance: float = 3,
+    require: Optional[re.Pattern] = None,
+    number_columns: Container[int] = (),
+) -> list[list[str]]:
+    """Group PDF words into table rows and split each row into column texts.
+
+    Words are bucketed into rows by rounding ``top`` to ``row_tolerance``
+    and assigned to columns by binary search of their ``x0`` in the sorted
+    ``col_boundaries``, both vectorized over the whole page with numpy.
+    This is the word-position table parsing shared by the PDF adapters.
+
+    Args:
+        words: Word dicts with ``text``, ``x0`` and ``top`` keys.
+        col_boundaries: Sorted x-positions separating the columns.
+        row_tolerance: Vertical bucket size for grouping words into rows.
+        require: If given, rows with no word matching it are skipped before
+            column assignment (a cheap filter for headers and footnotes).
+        number_columns: Indices of columns joined with join_number_tokens(),
+            rejoining numbers that were split into separate words.
+
+    Returns:
+        One list of ``len(col_boundaries) + 1`` column texts per kept row,
+        top to bottom.
+    """
+    n = len(words)
+    if not n:
+        return []
+
+    # Row keys and column indices for all words in a few array operations.
+    # np.rint rounds half to even like round(), so rows match exactly.
+    x0 = np.fromiter((w["x0"] for w in words), dtype=np.float64, count=n)
+    top = np.fromiter((w["top"] for w in words), dtype=np.float64, count=n)
+    row_keys = np.rint(top / row_tolerance)
+    col_idx = np.searchsorted(col_boundaries, x0, side="right").tolist()
+
+    # Stable sort by (row, x0); each run of equal row keys is one row
+    order = np.lexsort((x0, row_keys))
+    breaks = (np.flatnonzero(np.diff(row_keys[order])) + 1).tolist()
+    order = order.tolist()
+    texts = [w["text"] for w in words]
+
+    num_cols = len(col_boundaries) + 1
+    joiners = [
+        join_number_tokens if i in number_columns else " ".join
+        for i in range(num_cols)
+    ]
+
+    # Per-column word buffers, reused across rows
+    columns: list[list[str]] = [[] for _ in range(num_cols)]
+
+    rows = []
+    for start, end in zip([0, *breaks], [*breaks, n]):
+        row = order[start:end]
+        if require is not None and not any(require.search(texts[i]) for i in row):
+            continue
+
+        for col in columns:
+            col.clear()
+        for i in row:
+            columns[col_idx[i]].append(texts[i])
+
+        rows.append([join(col) for join, col in zip(joiners, columns)])
+    return rows
+
+
+def frame_to_records(frame: pd.DataFrame) -> list[dict]:
+    """Convert a DataFrame of parsed rows into commitment record dicts.
+
+    NaN cells become None and numpy scalars become plain Python values, so
+    the records match what a row-by-row parser would have produced.
+
+    Args:
+        frame: One row per record, columns named after record keys.
+
+    Returns:
+        List of record dicts in row order.
+    """
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
 class PensionFundAdapter(ABC):
     """Abstract base class for pension fund data adapters.
 
@@ -33,6 +126,18 @@ class PensionFundAdapter(ABC):
     data_source_type: str = ""        # "html", "pdf", "csv", "api"
     disclosure_quality: str = ""       # "excellent", "good", "limited", "none"
 
+    # Directory for caching parsed records keyed by source hash. Adapters with
+    # slow parsers (multi-page PDFs) set this so unchanged sources skip parsing.
+    parse_cache_dir: Optional[Path] = None
+
+    # Part of the parse cache key. Bump it when parse() changes its output so
+    # records cached by the old parser are not reused.
+    parser_version: int = 1
+
+    # Open pdfplumber document for the last PDF parsed, see get_pdf()
+    _pdf: Optional[pdfplumber.PDF] = None
+    _pdf_source: Optional[bytes] = None
+
     @abstractmethod
     def fetch_source(self) -> bytes | str:
         """Download the source data.
@@ -78,10 +183,79 @@ class PensionFundAdapter(ABC):
         raw_data = self.fetch_source()
         logger.info(f"Fetched source data for {self.pension_fund_name} "
                      f"({len(raw_data) if raw_data else 0} bytes/chars)")
-        records = self.parse(raw_data)
+        records = self.parse_cached(raw_data)
         logger.info(f"Parsed {len(records)} records from {self.pension_fund_name}")
         return records
 
+    def parse_cached(self, raw_data, force: bool = False) -> list[dict]:
+        """Parse raw data, reusing records from a previous parse of identical bytes.
+
+        Records are stored as JSON in ``parse_cache_dir`` under the adapter's
+        ``parser_version`` and the SHA256 of the source, so a changed source
+        document or a bumped parser version invalidates the cache automatically.
+        Adapters without a ``parse_cache_dir`` always parse.
+
+        Args:
+            raw_data: The raw content (bytes or str) returned by fetch_source().
+            force: Parse even if cached records exist, and replace them.
+
+        Returns:
+            List of parsed commitment dicts.
+        """
+        if self.parse_cache_dir is None:
+            return self.parse(raw_data)
+
+        cache_path = Path(self.parse_cache_dir) / (
+            f"parsed_v{self.parser_version}_{self.get_source_hash(raw_data)}.json"
+        )
+        if not force and cache_path.exists():
+            try:
+                records = json.loads(cache_path.read_bytes())
+                logger.info(f"Loaded {len(records)} parsed records from cache: {cache_path}")
+                return records
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable parse cache {cache_path}: {e}")
+
+        records = self.parse(raw_data)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(records), encoding="utf-8")
+        logger.info(f"Cached {len(records)} parsed records to {cache_path}")
+        return records
+
+    def get_pdf(self, raw_data: bytes) -> pdfplumber.PDF:
+        """Return an open pdfplumber document for raw_data.
+
+        The document stays open on the adapter and is reused while the same
+        bytes are parsed again, so pdfplumber's per-page caches (chars, words,
+        layout) survive across parse() calls. Call close_pdf() to release it.
+
+        Args:
+            raw_data: Raw PDF bytes.
+
+        Returns:
+            The open pdfplumber.PDF.
+        """
+        if self._pdf is None or self._pdf_source != raw_data:
+            self.close_pdf()
+            self._pdf = pdfplumber.open(io.BytesIO(raw_data))
+            self._pdf_source = raw_data
+        return self._pdf
+
+    def close_pdf(self) -> None:
+        """Close the document opened by get_pdf(), if any."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+            self._pdf_source = None
+
+    def __getstate__(self) -> dict:
+        # Adapters are pickled to parse pages in worker processes; the open
+        # document can't be pickled and workers open their own copy.
+        state = self.__dict__.copy()
+        state.pop("_pdf", None)
+        state.pop("_pdf_source", None)
+        return state
+
     def get_source_hash(self, raw_data) -> str:
         """Compute SHA256 hash of source data for change detection.
 
@@ -54,13 +54,17 @@ class CalPERSAdapter(PensionFundAdapter):
     disclosure_quality = "excellent"
     source_url = CALPERS_URL
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         """Initialize the adapter.
 
         Args:
             use_cache: If True, read from cached HTML instead of fetching live.
+            workers: Worker processes for PDF page parsing. Accepted so every
+                adapter takes the same arguments; the HTML page is parsed in
+                a single pass.
         """
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "pep_fund_performance_print.html"
 
     def fetch_source(self) -> str:
@@ -12,26 +12,52 @@ row (y-coordinate) and assign to columns by x-coordinate ranges, since
 the text extraction joins fields without proper spacing.
 """
 
-import io
 import logging
 import re
 from pathlib import Path
 from typing import Optional
 
-import pdfplumber
-import requests
+import pandas as pd
 
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, frame_to_records, rows_from_words
 from src.utils.normalization import (
-    parse_dollar_amount, parse_percentage, rejoin_split_number,
-    extract_as_of_date_from_text,
+    PLAIN_NUMBER_RE, extract_as_of_date_from_text, parse_dollar_column,
 )
+from src.utils.http import get_session
+from src.utils.pdf_parser import extract_row_words
 
 logger = logging.getLogger(__name__)
 
 CALSTRS_URL = "https://www.calstrs.com/private-equity-portfolio-performance-table"
 CACHE_DIR = Path("data/cache/calstrs")
 
+# Data rows carry a 4-digit vintage year in the VY column
+_VY_RE = re.compile(r"^(19|20)\d{2}$")
+
+# Footnote markers and thousands separators stripped from IRR cells
+_IRR_STRIP = str.maketrans("", "", "*,")
+
+# IRR cells reported as "not meaningful"
+_IRR_NOT_MEANINGFUL = ("N/M", "NM", "N/M*", "*")
+
+# Record fields with the same value on every row
+_CONST_FIELDS = {
+    "general_partner": None,
+    "asset_class": "Private Equity",
+    "sub_strategy": None,
+    "dpi": None,
+    "source_url": CALSTRS_URL,
+    "source_document": "CalSTRS Private Equity Portfolio Performance",
+    "extraction_method": "deterministic_pdf",
+    "extraction_confidence": 0.95,
+}
+
+# Column texts collected per data row, in col_boundaries order
+_ROW_COLUMNS = [
+    "fund_name_raw", "vintage_year", "committed", "contributed",
+    "distributed", "market_value", "irr",
+]
+
 
 class CalSTRSAdapter(PensionFundAdapter):
     """Adapter for CalSTRS Private Equity Portfolio Performance data."""
@@ -44,9 +70,11 @@ class CalSTRSAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "excellent"
     source_url = CALSTRS_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "pe_performance_table.pdf"
 
     def fetch_source(self) -> bytes:
@@ -56,7 +84,7 @@ class CalSTRSAdapter(PensionFundAdapter):
             return self._cache_path.read_bytes()
 
         logger.info(f"Fetching CalSTRS PE data from {CALSTRS_URL}")
-        resp = requests.get(CALSTRS_URL, timeout=30)
+        resp = get_session().get(CALSTRS_URL, timeout=30)
         resp.raise_for_status()
         data = resp.content
 
@@ -73,38 +101,25 @@ class CalSTRSAdapter(PensionFundAdapter):
         issues with text extraction concatenating adjacent fields.
         """
         records = []
-        as_of_date = None
+        pdf = self.get_pdf(raw_data)
 
-        with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
-            # Extract as-of date from first page text
-            first_text = pdf.pages[0].extract_text() or ""
-            as_of_date = extract_as_of_date_from_text(first_text)
+        # Extract as-of date from first page text
+        first_text = pdf.pages[0].extract_text() or ""
+        as_of_date = extract_as_of_date_from_text(first_text)
 
-            for page in pdf.pages:
-                page_records = self._parse_page_by_words(page, as_of_date)
-                records.extend(page_records)
+        for page in pdf.pages:
+            page_records = self._parse_page_by_words(page, as_of_date)
+            records.extend(page_records)
 
         logger.info(f"Parsed {len(records)} CalSTRS PE commitment records")
         return records
 
     def _parse_page_by_words(self, page, as_of_date: Optional[str]) -> list[dict]:
         """Parse a single PDF page by extracting words and grouping by row."""
-        words = page.extract_words()
+        words = extract_row_words(page)
         if not words:
             return []
 
-        # Group words by their vertical position (row)
-        row_tolerance = 3  # words within 3 units are on the same row
-        rows_dict = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        # Sort rows by vertical position
-        sorted_rows = sorted(rows_dict.items())
-
         # Determine column boundaries from header row or data patterns
         # CalSTRS columns (approximate x-positions from inspection):
         # Fund name: 0 - 240
@@ -116,94 +131,99 @@ class CalSTRSAdapter(PensionFundAdapter):
         # IRR: 560+
         col_boundaries = [240, 290, 360, 430, 500, 560]
 
-        records = []
-        for top, row_words in sorted_rows:
-            # Sort words in row by x position
-            row_words.sort(key=lambda w: w["x0"])
-
-            # Assign words to columns
-            columns = [[] for _ in range(7)]  # 7 columns
-            for w in row_words:
-                x = w["x0"]
-                col_idx = 0
-                for i, boundary in enumerate(col_boundaries):
-                    if x >= boundary:
-                        col_idx = i + 1
-                columns[col_idx].append(w["text"])
-
-            # Join words within each column
-            col_texts = [" ".join(words_list).strip() for words_list in columns]
-
+        # Only rows with a vintage-year word are assigned to columns; dollar
+        # columns rejoin numbers that pdfplumber split into separate words
+        rows = []
+        for col_texts in rows_from_words(
+            words, col_boundaries, require=_VY_RE, number_columns=range(2, 6),
+        ):
             fund_name = col_texts[0]
             vy_text = col_texts[1]
-            committed_text = col_texts[2]
-            contributed_text = col_texts[3]
-            distributed_text = col_texts[4]
-            market_value_text = col_texts[5]
-            irr_text = col_texts[6]
 
             # Skip non-data rows
             if not fund_name or not vy_text:
                 continue
-            if not re.match(r'^(19|20)\d{2}$', vy_text):
+            if not _VY_RE.match(vy_text):
                 continue
 
-            # Reconstruct dollar amounts from words that may have been split
-            committed_text = rejoin_split_number(committed_text)
-            contributed_text = rejoin_split_number(contributed_text)
-            distributed_text = rejoin_split_number(distributed_text)
-            market_value_text = rejoin_split_number(market_value_text)
-
-            vintage_year = int(vy_text)
-            commitment_mm = parse_dollar_amount(committed_text)
-            capital_called_mm = parse_dollar_amount(contributed_text)
-            capital_distributed_mm = parse_dollar_amount(distributed_text)
-            remaining_value_mm = parse_dollar_amount(market_value_text)
-
-            # Parse IRR — CalSTRS PDF always lists IRR as a percentage number
-            # without a % sign (e.g., "23.51" = 23.51%, "0.84" = 0.84%).
-            # We always divide by 100 rather than using parse_percentage's
-            # heuristic, which misinterprets values between -1 and 1.
-            net_irr = None
-            if irr_text and irr_text not in ("N/M", "NM", "N/M*", "*"):
-                irr_clean = irr_text.replace("*", "").replace(",", "").strip()
-                negative = False
-                if irr_clean.startswith("(") and irr_clean.endswith(")"):
-                    negative = True
-                    irr_clean = irr_clean[1:-1].strip()
-                try:
-                    net_irr = float(irr_clean) / 100.0
-                    if negative:
-                        net_irr = -net_irr
-                except ValueError:
-                    pass
-
-            # Compute net multiple
-            net_multiple = None
-            if capital_called_mm and capital_called_mm > 0:
-                total_value = (capital_distributed_mm or 0) + (remaining_value_mm or 0)
-                if total_value > 0:
-                    net_multiple = round(total_value / capital_called_mm, 4)
-
-            records.append({
-                "fund_name_raw": fund_name,
-                "general_partner": None,
-                "vintage_year": vintage_year,
-                "asset_class": "Private Equity",
-                "sub_strategy": None,
-                "commitment_mm": commitment_mm,
-                "capital_called_mm": capital_called_mm,
-                "capital_distributed_mm": capital_distributed_mm,
-                "remaining_value_mm": remaining_value_mm,
-                "net_irr": net_irr,
-                "net_multiple": net_multiple,
-                "dpi": None,
-                "as_of_date": as_of_date,
-                "source_url": CALSTRS_URL,
-                "source_document": "CalSTRS Private Equity Portfolio Performance",
-                "extraction_method": "deterministic_pdf",
-                "extraction_confidence": 0.95,
-            })
+            col_texts[1] = int(vy_text)
+            rows.append(col_texts)
+
+        if not rows:
+            return []
 
+        # Numeric conversion runs column-wise over the whole page
+        df = pd.DataFrame(rows, columns=_ROW_COLUMNS)
+        capital_called_mm = parse_dollar_column(df["contributed"])
+        capital_distributed_mm = parse_dollar_column(df["distributed"])
+        remaining_value_mm = parse_dollar_column(df["market_value"])
+
+        # Net multiple = (distributed + market value) / contributed
+        total_value = capital_distributed_mm.fillna(0) + remaining_value_mm.fillna(0)
+        has_multiple = (capital_called_mm > 0) & (total_value > 0)
+        net_multiple = (total_value / capital_called_mm)[has_multiple].map(
+            lambda v: round(v, 4)
+        )
+
+        records = frame_to_records(pd.DataFrame({
+            "fund_name_raw": df["fund_name_raw"],
+            "vintage_year": df["vintage_year"],
+            "commitment_mm": parse_dollar_column(df["committed"]),
+            "capital_called_mm": capital_called_mm,
+            "capital_distributed_mm": capital_distributed_mm,
+            "remaining_value_mm": remaining_value_mm,
+            "net_irr": self._parse_irr_column(df["irr"]),
+            "net_multiple": net_multiple,
+        }))
+        const_fields = {**_CONST_FIELDS, "as_of_date": as_of_date}
+        for record in records:
+            record |= const_fields
         return records
 
+    @classmethod
+    def _parse_irr_column(cls, irr_texts: pd.Series) -> pd.Series:
+        """Convert a column of IRR texts to decimals.
+
+        Plain numbers are converted in one pass; other cells fall back to
+        _parse_irr().
+        """
+        cleaned = (
+            irr_texts.str.translate(_IRR_STRIP)
+            .str.strip()
+            .str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+        )
+        plain = cleaned.str.fullmatch(PLAIN_NUMBER_RE).fillna(False).astype(bool)
+
+        net_irr = pd.Series(float("nan"), index=irr_texts.index)
+        net_irr[plain] = cleaned[plain].astype(float) / 100.0
+
+        other = ~plain
+        if other.any():
+            net_irr[other] = pd.Series(
+                [cls._parse_irr(text) for text in irr_texts[other]],
+                index=irr_texts.index[other],
+                dtype=float,
+            )
+        return net_irr
+
+    @staticmethod
+    def _parse_irr(irr_text: str) -> Optional[float]:
+        """Parse one IRR cell into a decimal.
+
+        CalSTRS PDF always lists IRR as a percentage number without a %
+        sign (e.g., "23.51" = 23.51%, "0.84" = 0.84%). We always divide by
+        100 rather than using parse_percentage's heuristic, which
+        misinterprets values between -1 and 1.
+        """
+        if not irr_text or irr_text in _IRR_NOT_MEANINGFUL:
+            return None
+        irr_clean = irr_text.translate(_IRR_STRIP).strip()
+        negative = False
+        if irr_clean.startswith("(") and irr_clean.endswith(")"):
+            negative = True
+            irr_clean = irr_clean[1:-1].strip()
+        try:
+            net_irr = float(irr_clean) / 100.0
+        except ValueError:
+            return None
+        return -net_irr if negative else net_irr
@@ -20,19 +20,17 @@ Parsing strategy: Word-level pdfplumber extraction with column assignment by
 x-position, following the same pattern as the other PDF-based adapters.
 """
 
-import io
 import logging
 import re
 from pathlib import Path
 from typing import Optional
 
-import pdfplumber
-
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, rows_from_words
 from src.utils.normalization import (
     parse_percentage, parse_multiple,
     rejoin_split_number, extract_as_of_date_from_text,
 )
+from src.utils.pdf_parser import extract_row_words, map_pdf_pages
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +39,54 @@ FL_SBA_SOURCE_URL = (
 )
 CACHE_DIR = Path("data/cache/florida_sba")
 
+# Data rows carry at least one digit (vintage year, amounts)
+_HAS_DIGIT_RE = re.compile(r"\d")
+
+# Amount cells meaning "no value", and characters stripped before float()
+_EMPTY_AMOUNTS = frozenset(("-", "—", "", "N/A"))
+_AMOUNT_STRIP = str.maketrans("", "", "$, ")
+
+# Record fields with the same value on every row
+_CONST_FIELDS = {
+    "general_partner": None,
+    "asset_class": "Private Equity",
+    "sub_strategy": None,
+    "dpi": None,
+    "source_url": FL_SBA_SOURCE_URL,
+    "source_document": "FL SBA PE Performance Report",
+    "extraction_method": "deterministic_pdf",
+    "extraction_confidence": 0.90,
+}
+
+# Header words mapped to the column they label
+_HEADER_KEYWORDS = {
+    "vintage": "vintage",
+    "year": "vintage",
+    "commitment": "commitment",
+    "committed": "commitment",
+    "paid": "paid_in",
+    "paid-in": "paid_in",
+    "contributed": "paid_in",
+    "called": "paid_in",
+    "distribution": "distributed",
+    "distributed": "distributed",
+    "value": "value",
+    "valuation": "value",
+    "market": "value",
+    "nav": "value",
+    "tvpi": "tvpi",
+    "multiple": "tvpi",
+    "irr": "irr",
+}
+_NUM_HEADER_COLUMNS = len(set(_HEADER_KEYWORDS.values()))
+
+# Fund-name substrings that mark header/total/summary rows rather than funds
+_SKIP_ROW_RE = re.compile(
+    r"total|subtotal|summary|fund name|benchmark|reporting|currency|"
+    r"private equity|cash flow|page|as of",
+    re.IGNORECASE,
+)
+
 
 class FloridaSBAAdapter(PensionFundAdapter):
     """Adapter for Florida SBA Private Equity Performance data.
@@ -56,9 +102,11 @@ class FloridaSBAAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "none"
     source_url = FL_SBA_SOURCE_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "pe_performance_latest.pdf"
 
     def fetch_source(self) -> bytes:
@@ -98,38 +146,32 @@ class FloridaSBAAdapter(PensionFundAdapter):
 
     def parse(self, raw_data: bytes) -> list[dict]:
         """Parse Florida SBA PE performance PDF."""
-        records = []
-        as_of_date = None
-
-        with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
-            # Extract as-of date from first page
-            first_text = pdf.pages[0].extract_text() or ""
-            as_of_date = extract_as_of_date_from_text(first_text)
-
-            # Detect column boundaries from the first data page
-            col_boundaries = None
-
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-
-                # Skip non-data pages
-                if not self._is_pe_data_page(text):
-                    continue
-
-                words = page.extract_words()
-                if not words:
-                    continue
-
-                # Auto-detect column boundaries from header row on first data page
-                if col_boundaries is None:
-                    col_boundaries = self._detect_column_boundaries(words)
-                    if col_boundaries is None:
-                        continue
-
-                page_records = self._parse_page_by_words(
-                    words, col_boundaries, as_of_date
-                )
-                records.extend(page_records)
+        pdf = self.get_pdf(raw_data)
+
+        # Extract as-of date from first page
+        first_text = pdf.pages[0].extract_text() or ""
+        as_of_date = extract_as_of_date_from_text(first_text)
+
+        # Skip non-data pages
+        data_pages = [
+            i for i, page in enumerate(pdf.pages)
+            if self._is_pe_data_page(page.extract_text() or "")
+        ]
+
+        # Auto-detect column boundaries from header row on first data page
+        col_boundaries = None
+        while data_pages and col_boundaries is None:
+            words = extract_row_words(pdf.pages[data_pages[0]])
+            if words:
+                col_boundaries = self._detect_column_boundaries(words)
+            if col_boundaries is None:
+                data_pages.pop(0)
+
+        page_records = map_pdf_pages(
+            self._parse_page, raw_data, data_pages, col_boundaries, as_of_date,
+            workers=self.workers, pdf=pdf,
+        )
+        records = [r for recs in page_records for r in recs]
 
         logger.info(f"Parsed {len(records)} FL SBA PE commitment records")
         return records
@@ -151,34 +193,20 @@ class FloridaSBAAdapter(PensionFundAdapter):
 
         Returns list of x-position boundaries, or None if can't detect.
         """
-        header_keywords = {
-            "vintage": "vintage",
-            "year": "vintage",
-            "commitment": "commitment",
-            "committed": "commitment",
-            "paid": "paid_in",
-            "paid-in": "paid_in",
-            "contributed": "paid_in",
-            "called": "paid_in",
-            "distribution": "distributed",
-            "distributed": "distributed",
-            "value": "value",
-            "valuation": "value",
-            "market": "value",
-            "nav": "value",
-            "tvpi": "tvpi",
-            "multiple": "tvpi",
-            "irr": "irr",
-        }
-
         # Find header words
         header_positions: dict[str, float] = {}
         for w in words:
-            text_lower = w["text"].lower().strip()
-            if text_lower in header_keywords:
-                col_name = header_keywords[text_lower]
-                if col_name not in header_positions:
-                    header_positions[col_name] = w["x0"]
+            text = w["text"]
+            # Every keyword is 3+ letters; skip numbers and short tokens
+            # without lower-casing them
+            if len(text) < 3 or text[0].isdigit():
+                continue
+            col_name = _HEADER_KEYWORDS.get(text.lower())
+            if col_name is not None and col_name not in header_positions:
+                header_positions[col_name] = w["x0"]
+                # The header row comes first; stop once every column is seen
+                if len(header_positions) == _NUM_HEADER_COLUMNS:
+                    break
 
         # Need at least vintage + commitment + one more to form columns
         if "vintage" not in header_positions or "commitment" not in header_positions:
@@ -205,6 +233,18 @@ class FloridaSBAAdapter(PensionFundAdapter):
 
         return boundaries
 
+    def _parse_page(
+        self,
+        page,
+        col_boundaries: list[float],
+        as_of_date: Optional[str],
+    ) -> list[dict]:
+        """Extract words from a data page and parse them into records."""
+        words = extract_row_words(page)
+        if not words:
+            return []
+        return self._parse_page_by_words(words, col_boundaries, as_of_date)
+
     def _parse_page_by_words(
         self,
         words: list[dict],
@@ -212,34 +252,12 @@ class FloridaSBAAdapter(PensionFundAdapter):
         as_of_date: Optional[str],
     ) -> list[dict]:
         """Parse a page using word positions and detected column boundaries."""
-        # Group words by row
-        row_tolerance = 3
-        rows_dict: dict[float, list] = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        num_cols = len(col_boundaries) + 1
         col_names = getattr(self, "_col_names", [])
 
+        # Only rows with a digit (vintage year, amounts) are assigned to
+        # columns; headers, blank rows and section titles are skipped
         records = []
-        for _top, row_words in sorted(rows_dict.items()):
-            row_words.sort(key=lambda w: w["x0"])
-
-            # Assign words to columns
-            columns: list[list[str]] = [[] for _ in range(num_cols)]
-            for w in row_words:
-                x = w["x0"]
-                col_idx = 0
-                for i, boundary in enumerate(col_boundaries):
-                    if x >= boundary:
-                        col_idx = i + 1
-                columns[col_idx].append(w["text"])
-
-            col_texts = [" ".join(wl).strip() for wl in columns]
-
+        for col_texts in rows_from_words(words, col_boundaries, require=_HAS_DIGIT_RE):
             # The first column (before first boundary) is the fund name
             fund_name = col_texts[0]
 
@@ -247,14 +265,7 @@ class FloridaSBAAdapter(PensionFundAdapter):
                 continue
 
             # Skip header/total/summary rows
-            if any(
-                kw in fund_name.lower()
-                for kw in [
-                    "total", "subtotal", "summary", "fund name", "benchmark",
-                    "reporting", "currency", "private equity", "cash flow",
-                    "page", "as of",
-                ]
-            ):
+            if _SKIP_ROW_RE.search(fund_name):
                 continue
 
             # Map column texts to fields based on detected column order
@@ -289,25 +300,20 @@ class FloridaSBAAdapter(PensionFundAdapter):
             records.append(
                 {
                     "fund_name_raw": fund_name,
-                    "general_partner": None,
                     "vintage_year": vintage_year,
-                    "asset_class": "Private Equity",
-                    "sub_strategy": None,
                     "commitment_mm": commitment_mm,
                     "capital_called_mm": capital_called_mm,
                     "capital_distributed_mm": capital_distributed_mm,
                     "remaining_value_mm": remaining_value_mm,
                     "net_irr": net_irr,
                     "net_multiple": net_multiple,
-                    "dpi": None,
-                    "as_of_date": as_of_date,
-                    "source_url": FL_SBA_SOURCE_URL,
-                    "source_document": "FL SBA PE Performance Report",
-                    "extraction_method": "deterministic_pdf",
-                    "extraction_confidence": 0.90,
                 }
             )
 
+        # Fields shared by every row are merged in once per record
+        const_fields = {**_CONST_FIELDS, "as_of_date": as_of_date}
+        for record in records:
+            record |= const_fields
         return records
 
 
@@ -319,10 +325,10 @@ class FloridaSBAAdapter(PensionFundAdapter):
         - Values > 100,000 are likely raw dollars -> convert to millions
         - Values < 100,000 are likely already in millions
         """
-        if not text or text.strip() in ("-", "—", "", "N/A"):
+        if not text or text.strip() in _EMPTY_AMOUNTS:
             return None
 
-        cleaned = text.replace("$", "").replace(",", "").replace(" ", "").strip()
+        cleaned = text.translate(_AMOUNT_STRIP).strip()
 
         # Handle parentheses (negative)
         negative = False
@@ -11,19 +11,19 @@ All amounts in raw dollars.
 Parsing strategy: Word-level extraction with column assignment by x-position.
 """
 
-import io
 import logging
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterable
 
-import pdfplumber
-import requests
+import pandas as pd
 
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, frame_to_records, rows_from_words
 from src.utils.normalization import (
-    parse_dollar_amount, rejoin_split_number, extract_as_of_date_from_text,
+    extract_as_of_date_from_text, parse_dollar_column,
 )
+from src.utils.http import download_to_file
+from src.utils.pdf_parser import extract_row_words, iter_page_text, map_pdf_pages
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,33 @@ CACHE_DIR = Path("data/cache/ny_common")
 #   Total Value:   x >= 530
 NY_COL_BOUNDARIES = [250, 295, 355, 415, 472, 530]
 
+# Data rows carry a commitment date in MM/DD/YY format
+_DATE_RE = re.compile(r"^\d{2}/\d{2}/\d{2}$")
+
+# Fund-name substrings that mark total/summary rows rather than funds
+_SKIP_ROW_RE = re.compile(
+    r"total|subtotal|summary|private equity investments", re.IGNORECASE
+)
+
+# Record fields with the same value on every row
+_CONST_FIELDS = {
+    "general_partner": None,
+    "asset_class": "Private Equity",
+    "sub_strategy": None,
+    "net_irr": None,  # Not provided in this source
+    "dpi": None,
+    "source_url": NY_COMMON_PDF_URL,
+    "source_document": "NY Common Retirement Fund Asset Listing 2025",
+    "extraction_method": "deterministic_pdf",
+    "extraction_confidence": 0.95,
+}
+
+# Column texts collected per data row, in NY_COL_BOUNDARIES order
+_ROW_COLUMNS = [
+    "fund_name_raw", "vintage_year", "committed", "contributed",
+    "distributed", "fair_value", "total_value",
+]
+
 
 class NYCommonAdapter(PensionFundAdapter):
     """Adapter for NY State Common Retirement Fund Private Equity data."""
@@ -58,9 +85,11 @@ class NYCommonAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "good"
     source_url = NY_COMMON_PDF_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "asset_listing_2025.pdf"
 
     def fetch_source(self) -> bytes:
@@ -70,8 +99,11 @@ class NYCommonAdapter(PensionFundAdapter):
             return self._cache_path.read_bytes()
 
         logger.info(f"Fetching NY Common data from {NY_COMMON_PDF_URL}")
-        resp = requests.get(
+        # Stream straight to the cache file rather than buffering the
+        # multi-MB listing in memory and then writing a copy of it.
+        download_to_file(
             NY_COMMON_PDF_URL,
+            self._cache_path,
             timeout=120,
             headers={
                 "User-Agent": (
@@ -80,43 +112,65 @@ class NYCommonAdapter(PensionFundAdapter):
                     "Chrome/120.0.0.0 Safari/537.36"
                 ),
             },
+            expected_prefix=b"%PDF-",
         )
-        resp.raise_for_status()
-        data = resp.content
-
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._cache_path.write_bytes(data)
         logger.info(f"Cached NY Common data to {self._cache_path}")
 
-        return data
+        return self._cache_path.read_bytes()
 
     def parse(self, raw_data: bytes) -> list[dict]:
-        """Parse NY Common asset listing PDF for Private Equity Investments."""
-        records = []
+        """Parse NY Common asset listing PDF for Private Equity Investments.
 
-        with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
-            in_pe_section = False
+        A fast pdfium text pass locates the PE section first, so pdfminer
+        layout analysis only runs on the handful of PE pages of the several
+        hundred page listing. Those pages are then parsed by word position
+        (in parallel when ``workers > 1``).
+        """
+        pe_pages = self._find_pe_pages(iter_page_text(raw_data))
+
+        pdf = self.get_pdf(raw_data)
+        # Extract as_of_date from early pages of the PDF
+        as_of_date = self._extract_as_of_date(pdf)
+        if not pe_pages:
+            # pdfium's text layout can differ from pdfplumber's; rescan
+            # with pdfplumber before concluding there is no PE section
+            pe_pages = self._find_pe_pages(
+                page.extract_text() or "" for page in pdf.pages
+            )
 
-            # Extract as_of_date from early pages of the PDF
-            as_of_date = self._extract_as_of_date(pdf)
+        page_records = map_pdf_pages(
+            self._parse_page_by_words, raw_data, pe_pages, as_of_date,
+            workers=self.workers, pdf=pdf,
+        )
+        records = [r for recs in page_records for r in recs]
 
-            for page in pdf.pages:
-                text = page.extract_text() or ""
+        logger.info(f"Parsed {len(records)} NY Common PE commitment records")
+        return records
 
-                # Detect PE section start/end
-                if "PRIVATE EQUITY INVESTMENTS" in text:
-                    in_pe_section = True
-                if in_pe_section and "FUND OF FUNDS" in text.upper():
-                    # Stop at Fund of Funds section
-                    break
-                if not in_pe_section:
-                    continue
+    def _find_pe_pages(self, page_texts: Iterable[str]) -> list[int]:
+        """Return 0-based indices of the pages in the Private Equity section.
 
-                page_records = self._parse_page_by_words(page, as_of_date)
-                records.extend(page_records)
+        The section starts at the "PRIVATE EQUITY INVESTMENTS" heading and
+        ends where the Fund of Funds section begins.
 
-        logger.info(f"Parsed {len(records)} NY Common PE commitment records")
-        return records
+        Args:
+            page_texts: Text of each page, in page order.
+        """
+        pe_pages = []
+        in_pe_section = False
+        for i, text in enumerate(page_texts):
+            # Collapse whitespace so headings match across text extractors
+            text = " ".join(text.split())
+
+            # Detect PE section start/end
+            if "PRIVATE EQUITY INVESTMENTS" in text:
+                in_pe_section = True
+            if in_pe_section and "FUND OF FUNDS" in text.upper():
+                # Stop at Fund of Funds section
+                break
+            if in_pe_section:
+                pe_pages.append(i)
+        return pe_pages
 
     def _extract_as_of_date(self, pdf) -> str:
         """Extract the as-of date from the PDF document text.
@@ -139,7 +193,7 @@ class NYCommonAdapter(PensionFundAdapter):
 
     def _parse_page_by_words(self, page, as_of_date: str = "2025-03-31") -> list[dict]:
         """Parse a single PDF page by extracting words and grouping by row."""
-        words = page.extract_words()
+        words = extract_row_words(page)
         if not words:
             return []
 
@@ -148,109 +202,64 @@ class NYCommonAdapter(PensionFundAdapter):
         scale = page_width / 612.0
         col_boundaries = [int(b * scale) for b in NY_COL_BOUNDARIES]
 
-        # Group words by vertical position (row)
-        row_tolerance = int(3 * scale)
-        rows_dict: dict[float, list] = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        records = []
-        for _top, row_words in sorted(rows_dict.items()):
-            row_words.sort(key=lambda w: w["x0"])
-
-            # Assign words to 7 columns
-            columns: list[list[str]] = [[] for _ in range(7)]
-            for w in row_words:
-                x = w["x0"]
-                col_idx = 0
-                for i, boundary in enumerate(col_boundaries):
-                    if x >= boundary:
-                        col_idx = i + 1
-                columns[col_idx].append(w["text"])
-
-            col_texts = [" ".join(wl).strip() for wl in columns]
-
+        # Only rows with a date word are assigned to columns; dollar
+        # columns rejoin numbers that pdfplumber split into words
+        rows = []
+        for col_texts in rows_from_words(
+            words,
+            col_boundaries,
+            row_tolerance=int(3 * scale),
+            require=_DATE_RE,
+            number_columns=range(2, 7),
+        ):
             fund_name = col_texts[0]
             date_text = col_texts[1]
-            committed_text = col_texts[2]
-            contributed_text = col_texts[3]
-            distributed_text = col_texts[4]
-            fair_value_text = col_texts[5]
-            total_value_text = col_texts[6]
 
             # Skip non-data rows: must have a date in MM/DD/YY format
-            if not date_text or not re.match(r"^\d{2}/\d{2}/\d{2}$", date_text):
+            if not date_text or not _DATE_RE.match(date_text):
                 continue
 
             if not fund_name:
                 continue
 
             # Skip total/summary rows
-            if any(
-                x in fund_name.lower()
-                for x in ["total", "subtotal", "summary", "private equity investments"]
-            ):
+            if _SKIP_ROW_RE.search(fund_name):
                 continue
 
-            # Parse the commitment date to extract vintage year
-            vintage_year = self._extract_vintage_year(date_text)
-
-            # Parse dollar amounts (raw dollars -> millions)
-            committed_text = rejoin_split_number(committed_text)
-            contributed_text = rejoin_split_number(contributed_text)
-            distributed_text = rejoin_split_number(distributed_text)
-            fair_value_text = rejoin_split_number(fair_value_text)
-            total_value_text = rejoin_split_number(total_value_text)
-
-            commitment_mm = parse_dollar_amount(committed_text)
-            capital_called_mm = parse_dollar_amount(contributed_text)
-            capital_distributed_mm = parse_dollar_amount(distributed_text)
-            remaining_value_mm = parse_dollar_amount(fair_value_text)
-
-            # Compute net multiple from contributed and total value
-            net_multiple = None
-            if capital_called_mm and capital_called_mm > 0:
-                total_value = parse_dollar_amount(total_value_text)
-                if total_value and total_value > 0:
-                    net_multiple = round(total_value / capital_called_mm, 4)
-
-            records.append(
+            # Vintage year from the MM/DD/YY commitment date (validated by
+            # _DATE_RE above): 00-30 -> 2000-2030, 31-99 -> 1931-1999
+            yy = int(date_text[6:8])
+            col_texts[1] = 2000 + yy if yy <= 30 else 1900 + yy
+            rows.append(col_texts)
+
+        if not rows:
+            return []
+
+        # Dollar amounts (raw dollars -> millions) convert column-wise
+        df = pd.DataFrame(rows, columns=_ROW_COLUMNS)
+        capital_called_mm = parse_dollar_column(df["contributed"])
+
+        # Compute net multiple from contributed and total value
+        total_value = parse_dollar_column(df["total_value"])
+        has_multiple = (capital_called_mm > 0) & (total_value > 0)
+        net_multiple = (total_value / capital_called_mm)[has_multiple].map(
+            lambda v: round(v, 4)
+        )
+
+        records = frame_to_records(
+            pd.DataFrame(
                 {
-                    "fund_name_raw": fund_name,
-                    "general_partner": None,
-                    "vintage_year": vintage_year,
-                    "asset_class": "Private Equity",
-                    "sub_strategy": None,
-                    "commitment_mm": commitment_mm,
+                    "fund_name_raw": df["fund_name_raw"],
+                    "vintage_year": df["vintage_year"],
+                    "commitment_mm": parse_dollar_column(df["committed"]),
                     "capital_called_mm": capital_called_mm,
-                    "capital_distributed_mm": capital_distributed_mm,
-                    "remaining_value_mm": remaining_value_mm,
-                    "net_irr": None,  # Not provided in this source
+                    "capital_distributed_mm": parse_dollar_column(df["distributed"]),
+                    "remaining_value_mm": parse_dollar_column(df["fair_value"]),
                     "net_multiple": net_multiple,
-                    "dpi": None,
-                    "as_of_date": as_of_date,
-                    "source_url": NY_COMMON_PDF_URL,
-                    "source_document": "NY Common Retirement Fund Asset Listing 2025",
-                    "extraction_method": "deterministic_pdf",
-                    "extraction_confidence": 0.95,
                 }
             )
-
+        )
+        const_fields = {**_CONST_FIELDS, "as_of_date": as_of_date}
+        for record in records:
+            record |= const_fields
         return records
-
-    @staticmethod
-    def _extract_vintage_year(date_text: str) -> Optional[int]:
-        """Extract vintage year from MM/DD/YY date format.
-
-        Converts 2-digit year: 00-30 -> 2000-2030, 31-99 -> 1931-1999.
-        """
-        match = re.match(r"(\d{2})/(\d{2})/(\d{2})", date_text)
-        if not match:
-            return None
-        yy = int(match.group(3))
-        year = 2000 + yy if yy <= 30 else 1900 + yy
-        return year
-
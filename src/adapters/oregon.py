@@ -14,17 +14,20 @@ Parsing strategy: Word-level extraction with column assignment by x-position.
 import io
 import logging
 import re
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import pdfplumber
-import requests
 
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, rows_from_words
+from src.adapters.record import PEFundRecord
 from src.utils.normalization import (
     parse_dollar_amount, parse_percentage, parse_multiple,
     extract_as_of_date_from_text,
 )
+from src.utils.http import download_to_file
+from src.utils.pdf_parser import extract_row_words, find_pages, map_pdf_pages
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,18 @@ CACHE_DIR = Path("data/cache/oregon")
 # Multiple: 465-510, IRR: 510+
 OREGON_COL_BOUNDARIES = [70, 245, 305, 365, 420, 465, 510]
 
+# Data rows start with a 4-digit vintage year
+_VY_RE = re.compile(r"^(19|20)\d{2}$")
+
+# Pages without any year anywhere in their text have no fund rows
+_TABLE_PAGE_RE = re.compile(r"(?:19|20)\d{2}")
+
+# Total/summary rows ("total" also covers subtotals)
+_SKIP_ROW_RE = re.compile(r"total|summary", re.IGNORECASE)
+
+# Characters dropped from amount cells before float()
+_AMOUNT_STRIP = str.maketrans("", "", "$,")
+
 
 class OregonAdapter(PensionFundAdapter):
     """Adapter for Oregon PERS Private Equity Portfolio data."""
@@ -54,9 +69,11 @@ class OregonAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "excellent"
     source_url = OREGON_PDF_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "pe_portfolio_q3_2025.pdf"
 
     def fetch_source(self) -> bytes:
@@ -66,64 +83,44 @@ class OregonAdapter(PensionFundAdapter):
             return self._cache_path.read_bytes()
 
         logger.info(f"Fetching Oregon PE data from {OREGON_PDF_URL}")
-        resp = requests.get(OREGON_PDF_URL, timeout=30)
-        resp.raise_for_status()
-        data = resp.content
-
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._cache_path.write_bytes(data)
+        # Stream into the cache file; an unchanged report answers 304 and
+        # the cached copy is reused without re-downloading it
+        download_to_file(OREGON_PDF_URL, self._cache_path, timeout=30, conditional=True)
         logger.info(f"Cached Oregon data to {self._cache_path}")
 
-        return data
+        return self._cache_path.read_bytes()
 
     def parse(self, raw_data: bytes) -> list[dict]:
-        """Parse Oregon PERS PE portfolio PDF."""
-        records = []
-        as_of_date = None
+        """Parse Oregon PERS PE portfolio PDF.
+
+        A fast pdfium text pass skips pages without fund rows; the rest are
+        parsed independently (in parallel when ``workers > 1``).
+        """
+        table_pages = find_pages(raw_data, _TABLE_PAGE_RE)
 
         with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
             # Get as-of date
             first_text = pdf.pages[0].extract_text() or ""
             as_of_date = extract_as_of_date_from_text(first_text)
 
-            for page in pdf.pages:
-                page_records = self._parse_page_by_words(page, as_of_date)
-                records.extend(page_records)
+            page_records = map_pdf_pages(
+                self._parse_page_by_words, raw_data, table_pages,
+                as_of_date, workers=self.workers, pdf=pdf, close_pages=True,
+            )
+        records = [r.to_dict() for r in chain.from_iterable(page_records)]
 
         logger.info(f"Parsed {len(records)} Oregon PERS PE commitment records")
         return records
 
-    def _parse_page_by_words(self, page, as_of_date: Optional[str]) -> list[dict]:
+    def _parse_page_by_words(self, page, as_of_date: Optional[str]) -> Iterator[PEFundRecord]:
         """Parse a page using word positions."""
-        words = page.extract_words()
+        words = extract_row_words(page)
         if not words:
-            return []
-
-        # Group words by row
-        row_tolerance = 3
-        rows_dict = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        records = []
-        for top, row_words in sorted(rows_dict.items()):
-            row_words.sort(key=lambda w: w["x0"])
-
-            # Assign words to columns (8 columns)
-            columns = [[] for _ in range(8)]
-            for w in row_words:
-                x = w["x0"]
-                col_idx = 0
-                for i, boundary in enumerate(OREGON_COL_BOUNDARIES):
-                    if x >= boundary:
-                        col_idx = i + 1
-                columns[col_idx].append(w["text"])
-
-            col_texts = [" ".join(wl).strip() for wl in columns]
+            return
 
+        # Group words into rows and assign them to the 8 columns; rows
+        # without a vintage-year word are dropped before column assignment
+        for col_texts in rows_from_words(words, OREGON_COL_BOUNDARIES, require=_VY_RE):
             vintage_text = col_texts[0]
             fund_name = col_texts[1]
             commitment_text = col_texts[2]
@@ -134,14 +131,14 @@ class OregonAdapter(PensionFundAdapter):
             irr_text = col_texts[7]
 
             # Must have a vintage year (4-digit year) to be a data row
-            if not vintage_text or not re.match(r'^(19|20)\d{2}$', vintage_text):
+            if not vintage_text or not _VY_RE.match(vintage_text):
                 continue
 
             if not fund_name:
                 continue
 
             # Skip total/summary rows
-            if any(x in fund_name.lower() for x in ["total", "subtotal", "summary"]):
+            if _SKIP_ROW_RE.search(fund_name):
                 continue
 
             vintage_year = int(vintage_text)
@@ -159,27 +156,21 @@ class OregonAdapter(PensionFundAdapter):
             if irr_text and irr_text.lower() not in ("n.m.", "n.m", "n/m", ""):
                 net_irr = parse_percentage(irr_text)
 
-            records.append({
-                "fund_name_raw": fund_name,
-                "general_partner": None,
-                "vintage_year": vintage_year,
-                "asset_class": "Private Equity",
-                "sub_strategy": None,
-                "commitment_mm": commitment_mm,
-                "capital_called_mm": capital_called_mm,
-                "capital_distributed_mm": capital_distributed_mm,
-                "remaining_value_mm": remaining_value_mm,
-                "net_irr": net_irr,
-                "net_multiple": net_multiple,
-                "dpi": None,
-                "as_of_date": as_of_date,
-                "source_url": OREGON_PDF_URL,
-                "source_document": "OPERF Private Equity Portfolio Q3 2025",
-                "extraction_method": "deterministic_pdf",
-                "extraction_confidence": 0.95,
-            })
-
-        return records
+            yield PEFundRecord(
+                fund_name_raw=fund_name,
+                vintage_year=vintage_year,
+                commitment_mm=commitment_mm,
+                capital_called_mm=capital_called_mm,
+                capital_distributed_mm=capital_distributed_mm,
+                remaining_value_mm=remaining_value_mm,
+                net_irr=net_irr,
+                net_multiple=net_multiple,
+                as_of_date=as_of_date,
+                source_url=OREGON_PDF_URL,
+                source_document="OPERF Private Equity Portfolio Q3 2025",
+                extraction_method="deterministic_pdf",
+                extraction_confidence=0.95,
+            )
 
     @staticmethod
     def _parse_oregon_amount(text: str) -> Optional[float]:
@@ -190,7 +181,7 @@ class OregonAdapter(PensionFundAdapter):
         if not text or text.strip() in ("-", "—", ""):
             return None
         # Remove $ and commas, parse as float (already in millions)
-        cleaned = text.replace("$", "").replace(",", "").strip()
+        cleaned = text.translate(_AMOUNT_STRIP).strip()
         if not cleaned or cleaned in ("-", "—"):
             return None
         try:
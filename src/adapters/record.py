@@ -0,0 +1,46 @@
+"""Compact record type for fund commitments parsed by the PDF adapters.
+
+Adapters return commitment records as plain dicts (see
+PensionFundAdapter.parse()). Page parsers that emit many rows build
+PEFundRecord instances instead: a slotted dataclass is roughly a third the
+size of the equivalent 17-key dict and cheaper to construct and to pickle
+back from parsing worker processes. Convert with to_dict() at the parse()
+boundary.
+"""
+
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Optional
+
+
+@dataclass(slots=True)
+class PEFundRecord:
+    """A single fund commitment row, with the fields of a parse() record dict."""
+    fund_name_raw: str
+    general_partner: Optional[str] = None
+    vintage_year: Optional[int] = None
+    asset_class: str = "Private Equity"
+    sub_strategy: Optional[str] = None
+    commitment_mm: Optional[float] = None
+    capital_called_mm: Optional[float] = None
+    capital_distributed_mm: Optional[float] = None
+    remaining_value_mm: Optional[float] = None
+    net_irr: Optional[float] = None
+    net_multiple: Optional[float] = None
+    dpi: Optional[float] = None
+    as_of_date: Optional[str] = None
+    source_url: Optional[str] = None
+    source_document: Optional[str] = None
+    extraction_method: Optional[str] = None
+    extraction_confidence: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """Return the record as a parse() dict, keys in field order.
+
+        Much faster than dataclasses.asdict(), which deep-copies every value.
+        """
+        return dict(zip(_FIELD_NAMES, _get_fields(self)))
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(PEFundRecord))
+_get_fields = attrgetter(*_FIELD_NAMES)
@@ -28,14 +28,17 @@ x-position, following the same pattern as the other PDF-based adapters.
 import io
 import logging
 import re
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 import pdfplumber
-import requests
 
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, rows_from_words
+from src.adapters.record import PEFundRecord
 from src.utils.normalization import parse_dollar_amount, parse_percentage, parse_multiple
+from src.utils.http import download_to_file, get_session
+from src.utils.pdf_parser import extract_row_words, find_pages, map_pdf_pages, words_to_text
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,25 @@ TRS_ACFR_URL = (
 )
 CACHE_DIR = Path("data/cache/texas_trs")
 
+# IMC book pages with fund tables: a vintage year followed by an amount
+_TABLE_HINT_RE = re.compile(r"20[012]\d.*[$]?\d+[\.,]\d+")
+_VINTAGE_WORD_RE = re.compile(r"\b(19|20)\d{2}\b")
+# Pages with no year anywhere in their pdfium text (no word boundaries, as
+# pdfium may drop spaces) cannot hold a fund table
+_TABLE_PAGE_RE = re.compile(r"(?:19|20)\d{2}")
+# Numbers in the cells after the vintage year; a leading "$" is simply
+# skipped by findall, so it needs no optional prefix or capture group
+_AMOUNT_RE = re.compile(r"[\d,]+\.?\d*")
+
+# Summary/total and benchmark rows ("total" also covers subtotals)
+_SKIP_ROW_RE = re.compile(r"total|summary|benchmark", re.IGNORECASE)
+
+# Characters dropped from amount cells before float()
+_AMOUNT_STRIP = str.maketrans("", "", "$,")
+
+# ACFR NAV / unfunded commitments table row for private equity
+_ACFR_PE_RE = re.compile(r"Private\s+Equity\s+[$]?\s*([\d,]+)\s+[$]?\s*([\d,]+)")
+
 # Texas TRS ACFR external manager names (pages 129-130)
 # These are the PE/alternative managers as listed in the 2024 ACFR.
 # Used for entity resolution seeding when fund-level data isn't available.
@@ -79,9 +101,11 @@ class TexasTRSAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "limited"
     source_url = TRS_SOURCE_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._imc_cache_path = CACHE_DIR / "imc_book_latest.pdf"
         self._acfr_cache_path = CACHE_DIR / "acfr_2024.pdf"
 
@@ -110,32 +134,33 @@ class TexasTRSAdapter(PensionFundAdapter):
             return self._acfr_cache_path.read_bytes()
 
         logger.info(f"Downloading TRS ACFR from {TRS_ACFR_URL}")
-        session = requests.Session()
-        session.headers.update({
+        headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
             ),
-        })
+        }
         # Visit main page first for session cookies
-        session.get("https://www.trs.texas.gov/", timeout=30)
-        resp = session.get(TRS_ACFR_URL, timeout=120)
-        resp.raise_for_status()
-        data = resp.content
-
-        if data[:5] != b"%PDF-":
+        get_session().get("https://www.trs.texas.gov/", timeout=30, headers=headers)
+        try:
+            download_to_file(
+                TRS_ACFR_URL,
+                self._acfr_cache_path,
+                timeout=120,
+                headers=headers,
+                expected_prefix=b"%PDF-",
+            )
+        except ValueError as e:
             raise ValueError(
                 "TRS ACFR download did not return a valid PDF. "
                 "The site may be blocking programmatic access. "
                 "Please manually download the IMC board book and save to "
                 f"{self._imc_cache_path}"
-            )
+            ) from e
 
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._acfr_cache_path.write_bytes(data)
         logger.info(f"Cached TRS ACFR to {self._acfr_cache_path}")
-        return data
+        return self._acfr_cache_path.read_bytes()
 
     def parse(self, raw_data: bytes) -> list[dict]:
         """Parse TRS data.
@@ -151,7 +176,7 @@ class TexasTRSAdapter(PensionFundAdapter):
 
             if "investment management" in first_text and len(pdf.pages) < 150:
                 # IMC board book - look for PE fund-level tables
-                records = self._parse_imc_book(pdf)
+                records = self._parse_imc_book(pdf, raw_data)
             else:
                 # ACFR - extract summary data only
                 records = self._parse_acfr_summary(pdf)
@@ -159,54 +184,51 @@ class TexasTRSAdapter(PensionFundAdapter):
         logger.info(f"Parsed {len(records)} Texas TRS records")
         return records
 
-    def _parse_imc_book(self, pdf) -> list[dict]:
-        """Parse PE fund-level data from IMC board book."""
-        records = []
-
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            text_lower = text.lower()
+    def _parse_imc_book(self, pdf, raw_data: bytes) -> list[dict]:
+        """Parse PE fund-level data from IMC board book.
 
-            # Look for pages with PE fund-level tabular data
-            if not ("private" in text_lower and ("equity" in text_lower or "markets" in text_lower)):
-                continue
-
-            # Check if this page has tabular fund data (vintage years + dollar amounts)
-            if not re.search(r"20[012]\d.*[$]?\d+[\.,]\d+", text):
-                continue
-
-            words = page.extract_words()
-            if not words:
-                continue
-
-            page_records = self._parse_pe_fund_table(words, text)
-            records.extend(page_records)
-
-        return records
-
-    def _parse_pe_fund_table(self, words: list[dict], full_text: str) -> list[dict]:
+        A fast pdfium text pass skips pages without any year before pdfminer
+        layout analysis; the rest are parsed independently (in parallel when
+        ``workers > 1``).
+        """
+        page_records = map_pdf_pages(
+            self._parse_imc_page, raw_data, find_pages(raw_data, _TABLE_PAGE_RE),
+            workers=self.workers, pdf=pdf, close_pages=True,
+        )
+        return [r.to_dict() for r in chain.from_iterable(page_records)]
+
+    def _parse_imc_page(self, page) -> Iterable[PEFundRecord]:
+        """Parse one IMC board book page, skipping pages without PE fund tables."""
+        # The words are needed for the table anyway; rebuilding the text from
+        # them avoids a second layout pass through extract_text()
+        words = extract_row_words(page)
+        if not words:
+            return []
+        text = words_to_text(words)
+        text_lower = text.lower()
+
+        # Look for pages with PE fund-level tabular data
+        if not ("private" in text_lower and ("equity" in text_lower or "markets" in text_lower)):
+            return []
+
+        # Check if this page has tabular fund data (vintage years + dollar amounts)
+        if not _TABLE_HINT_RE.search(text):
+            return []
+
+        return self._parse_pe_fund_table(words, text)
+
+    def _parse_pe_fund_table(self, words: list[dict], full_text: str) -> Iterator[PEFundRecord]:
         """Parse a PE fund table from word positions.
 
         TRS board books typically have columns:
         Fund Name, Vintage, Commitment ($M), Called ($M), Distributed ($M),
         Remaining Value ($M), Net IRR, TVPI
         """
-        # Group words by row
-        row_tolerance = 3
-        rows_dict: dict[float, list] = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        records = []
-        for _top, row_words in sorted(rows_dict.items()):
-            row_words.sort(key=lambda w: w["x0"])
-            row_text = " ".join(w["text"] for w in row_words)
-
-            # Look for rows with a vintage year (20XX or 19XX)
-            vintage_match = re.search(r"\b(19|20)\d{2}\b", row_text)
+        # Group words into x-sorted row texts; the table has no fixed column
+        # positions, so each row is a single column. Rows without a vintage
+        # year (20XX or 19XX) are dropped before joining.
+        for (row_text,) in rows_from_words(words, [], require=_VINTAGE_WORD_RE):
+            vintage_match = _VINTAGE_WORD_RE.search(row_text)
             if not vintage_match:
                 continue
 
@@ -215,19 +237,18 @@ class TexasTRSAdapter(PensionFundAdapter):
                 continue
 
             # Extract fund name (text before the vintage year)
-            vy_pos = row_text.find(vintage_match.group(0))
+            vy_pos = vintage_match.start()
             fund_name = row_text[:vy_pos].strip().rstrip(",")
 
             if not fund_name or len(fund_name) < 3:
                 continue
 
             # Skip summary/total rows
-            if any(kw in fund_name.lower() for kw in ["total", "subtotal", "summary", "benchmark"]):
+            if _SKIP_ROW_RE.search(fund_name):
                 continue
 
             # Extract dollar amounts after the vintage year
-            after_vy = row_text[vy_pos + 4:]
-            amounts = re.findall(r"[\$]?([\d,]+\.?\d*)", after_vy)
+            amounts = _AMOUNT_RE.findall(row_text, vintage_match.end())
 
             commitment_mm = None
             capital_called_mm = None
@@ -249,27 +270,20 @@ class TexasTRSAdapter(PensionFundAdapter):
             if len(amounts) >= 6:
                 net_multiple = parse_multiple(amounts[5])
 
-            records.append({
-                "fund_name_raw": fund_name,
-                "general_partner": None,
-                "vintage_year": vintage_year,
-                "asset_class": "Private Equity",
-                "sub_strategy": None,
-                "commitment_mm": commitment_mm,
-                "capital_called_mm": capital_called_mm,
-                "capital_distributed_mm": capital_distributed_mm,
-                "remaining_value_mm": remaining_value_mm,
-                "net_irr": net_irr,
-                "net_multiple": net_multiple,
-                "dpi": None,
-                "as_of_date": None,
-                "source_url": TRS_SOURCE_URL,
-                "source_document": "TRS IMC Board Book",
-                "extraction_method": "deterministic_pdf",
-                "extraction_confidence": 0.90,
-            })
-
-        return records
+            yield PEFundRecord(
+                fund_name_raw=fund_name,
+                vintage_year=vintage_year,
+                commitment_mm=commitment_mm,
+                capital_called_mm=capital_called_mm,
+                capital_distributed_mm=capital_distributed_mm,
+                remaining_value_mm=remaining_value_mm,
+                net_irr=net_irr,
+                net_multiple=net_multiple,
+                source_url=TRS_SOURCE_URL,
+                source_document="TRS IMC Board Book",
+                extraction_method="deterministic_pdf",
+                extraction_confidence=0.90,
+            )
 
     def _parse_acfr_summary(self, pdf) -> list[dict]:
         """Extract summary-level PE data from the ACFR.
@@ -288,10 +302,7 @@ class TexasTRSAdapter(PensionFundAdapter):
                 continue
 
             # Extract PE totals
-            pe_match = re.search(
-                r"Private\s+Equity\s+[$]?\s*([\d,]+)\s+[$]?\s*([\d,]+)",
-                text,
-            )
+            pe_match = _ACFR_PE_RE.search(text)
             if pe_match:
                 nav_raw = pe_match.group(1).replace(",", "")
                 unfunded_raw = pe_match.group(2).replace(",", "")
@@ -336,7 +347,7 @@ class TexasTRSAdapter(PensionFundAdapter):
         """Parse a dollar amount, assuming values in millions."""
         if not text:
             return None
-        cleaned = text.replace(",", "").replace("$", "").strip()
+        cleaned = text.translate(_AMOUNT_STRIP).strip()
         if not cleaned:
             return None
         try:
@@ -14,17 +14,20 @@ Parsing strategy: Word-level extraction with column assignment by x-position.
 import io
 import logging
 import re
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 import pdfplumber
-import requests
 
-from src.adapters.base import PensionFundAdapter
+from src.adapters.base import PensionFundAdapter, rows_from_words
+from src.adapters.record import PEFundRecord
 from src.utils.normalization import (
     parse_dollar_amount, parse_percentage, parse_multiple,
     extract_as_of_date_from_text,
 )
+from src.utils.http import download_to_file
+from src.utils.pdf_parser import extract_row_words, find_pages, map_pdf_pages, words_to_text
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,13 @@ CACHE_DIR = Path("data/cache/wsib")
 # Total Value: 525-558, Multiple: 558-595, Gain/Loss: 595-620, IRR: 620+
 WSIB_COL_BOUNDARIES = [265, 310, 355, 395, 445, 485, 525, 558, 595, 620]
 
+# Data rows have an initial date (M/D/YYYY) or N/A in the date column
+_DATE_ROW_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}|N/A")
+_DATE_YEAR_RE = re.compile(r"/(\d{4})$")
+
+# Category headers and subtotal rows ("total" also covers subtotals)
+_SKIP_ROW_RE = re.compile(r"total|strategy|summary", re.IGNORECASE)
+
 
 class WSIBAdapter(PensionFundAdapter):
     """Adapter for WSIB Private Equity IRR report."""
@@ -49,9 +59,11 @@ class WSIBAdapter(PensionFundAdapter):
     data_source_type = "pdf"
     disclosure_quality = "excellent"
     source_url = WSIB_REPORT_URL
+    parse_cache_dir = CACHE_DIR
 
-    def __init__(self, use_cache: bool = False):
+    def __init__(self, use_cache: bool = False, workers: int = 1):
         self.use_cache = use_cache
+        self.workers = workers
         self._cache_path = CACHE_DIR / "pe_irr_063025.pdf"
 
     def fetch_source(self) -> bytes:
@@ -61,67 +73,58 @@ class WSIBAdapter(PensionFundAdapter):
             return self._cache_path.read_bytes()
 
         logger.info(f"Fetching WSIB PE data from {WSIB_REPORT_URL}")
-        resp = requests.get(WSIB_REPORT_URL, timeout=30)
-        resp.raise_for_status()
-        data = resp.content
-
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        self._cache_path.write_bytes(data)
+        # Stream into the cache file; an unchanged report answers 304 and
+        # the cached copy is reused without re-downloading it
+        download_to_file(WSIB_REPORT_URL, self._cache_path, timeout=30, conditional=True)
         logger.info(f"Cached WSIB data to {self._cache_path}")
 
-        return data
+        return self._cache_path.read_bytes()
 
     def parse(self, raw_data: bytes) -> list[dict]:
-        """Parse WSIB PE IRR report PDF using word-level extraction."""
-        records = []
-        as_of_date = None
-
+        """Parse WSIB PE IRR report PDF using word-level extraction.
+
+        The first page's words are extracted once and used for both the
+        as-of date in the report header and the page's own rows. A date in
+        that header is used even if other pages carry a different one; the
+        rest of the document is only searched when the header has none. The
+        remaining pages with a date in their pdfium text are parsed
+        independently (in parallel when ``workers > 1``).
+        """
         with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
-            # Gather all text to find as-of date
-            all_text = ""
-            for page in pdf.pages:
-                text = page.extract_text() or ""
-                all_text += text + "\n"
-            as_of_date = extract_as_of_date_from_text(all_text)
-
-            for page in pdf.pages:
-                page_records = self._parse_page_by_words(page, as_of_date)
-                records.extend(page_records)
+            first_words = extract_row_words(pdf.pages[0])
+            pdf.pages[0].close()
+            as_of_date = extract_as_of_date_from_text(words_to_text(first_words))
+            if as_of_date is None:
+                # Only scan the whole document's text if the header doesn't have it
+                all_text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+                as_of_date = extract_as_of_date_from_text(all_text)
+
+            first_records = self._parse_words(first_words, as_of_date)
+            # Pages without a data-row date (M/D/YYYY or N/A) have no fund rows
+            table_pages = find_pages(raw_data, _DATE_ROW_RE, range(1, len(pdf.pages)))
+            page_records = map_pdf_pages(
+                self._parse_page_by_words, raw_data, table_pages,
+                as_of_date, workers=self.workers, pdf=pdf, close_pages=True,
+            )
+        records = [
+            r.to_dict() for r in chain(first_records, chain.from_iterable(page_records))
+        ]
 
         logger.info(f"Parsed {len(records)} WSIB PE commitment records")
         return records
 
-    def _parse_page_by_words(self, page, as_of_date: Optional[str]) -> list[dict]:
+    def _parse_page_by_words(self, page, as_of_date: Optional[str]) -> Iterator[PEFundRecord]:
         """Parse a page using word positions to assign columns."""
-        words = page.extract_words()
+        return self._parse_words(extract_row_words(page), as_of_date)
+
+    def _parse_words(self, words: list[dict], as_of_date: Optional[str]) -> Iterator[PEFundRecord]:
+        """Parse the fund rows of one page from its extracted words."""
         if not words:
-            return []
-
-        # Group words by row
-        row_tolerance = 3
-        rows_dict = {}
-        for w in words:
-            top = round(w["top"] / row_tolerance) * row_tolerance
-            if top not in rows_dict:
-                rows_dict[top] = []
-            rows_dict[top].append(w)
-
-        records = []
-        for top, row_words in sorted(rows_dict.items()):
-            row_words.sort(key=lambda w: w["x0"])
-
-            # Assign words to columns (11 columns)
-            columns = [[] for _ in range(11)]
-            for w in row_words:
-                x = w["x0"]
-                col_idx = 0
-                for i, boundary in enumerate(WSIB_COL_BOUNDARIES):
-                    if x >= boundary:
-                        col_idx = i + 1
-                columns[col_idx].append(w["text"])
-
-            col_texts = [" ".join(wl).strip() for wl in columns]
+            return
 
+        # Group words into rows and assign them to the 11 columns; rows
+        # without a date or N/A word are dropped before column assignment
+        for col_texts in rows_from_words(words, WSIB_COL_BOUNDARIES, require=_DATE_ROW_RE):
             fund_name = col_texts[0]
             date_text = col_texts[1]
             commitment_text = col_texts[2]
@@ -135,17 +138,16 @@ class WSIBAdapter(PensionFundAdapter):
             irr_text = col_texts[10]
 
             # Skip non-data rows: must have a date (M/D/YYYY) or N/A
-            if not date_text or not re.match(r'\d{1,2}/\d{1,2}/\d{4}|N/A', date_text):
+            if not date_text or not _DATE_ROW_RE.match(date_text):
                 continue
 
             # Skip category headers and subtotals
-            if not fund_name or any(x in fund_name.lower() for x in
-                                     ["subtotal", "total", "strategy", "summary"]):
+            if not fund_name or _SKIP_ROW_RE.search(fund_name):
                 continue
 
             # Extract vintage year from date
             vintage_year = None
-            year_match = re.search(r'/(\d{4})$', date_text)
+            year_match = _DATE_YEAR_RE.search(date_text)
             if year_match:
                 vintage_year = int(year_match.group(1))
 
@@ -169,24 +171,18 @@ class WSIBAdapter(PensionFundAdapter):
                 if irr_clean:
                     net_irr = parse_percentage(irr_text)
 
-            records.append({
-                "fund_name_raw": fund_name,
-                "general_partner": None,
-                "vintage_year": vintage_year,
-                "asset_class": "Private Equity",
-                "sub_strategy": None,
-                "commitment_mm": commitment_mm,
-                "capital_called_mm": capital_called_mm,
-                "capital_distributed_mm": capital_distributed_mm,
-                "remaining_value_mm": remaining_value_mm,
-                "net_irr": net_irr,
-                "net_multiple": net_multiple,
-                "dpi": None,
-                "as_of_date": as_of_date,
-                "source_url": WSIB_REPORT_URL,
-                "source_document": "WSIB Private Equity IRR Report",
-                "extraction_method": "deterministic_pdf",
-                "extraction_confidence": 0.90,
-            })
-
-        return records
+            yield PEFundRecord(
+                fund_name_raw=fund_name,
+                vintage_year=vintage_year,
+                commitment_mm=commitment_mm,
+                capital_called_mm=capital_called_mm,
+                capital_distributed_mm=capital_distributed_mm,
+                remaining_value_mm=remaining_value_mm,
+                net_irr=net_irr,
+                net_multiple=net_multiple,
+                as_of_date=as_of_date,
+                source_url=WSIB_REPORT_URL,
+                source_document="WSIB Private Equity IRR Report",
+                extraction_method="deterministic_pdf",
+                extraction_confidence=0.90,
+            )
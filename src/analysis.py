@@ -7,9 +7,16 @@ Outputs are saved to data/exports/demo/.
 """
 
 import csv
+import json
 import logging
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Iterable, Mapping
 
 from src.database import Database
 
@@ -17,6 +24,32 @@ logger = logging.getLogger(__name__)
 
 DEMO_DIR = Path("data/exports/demo")
 
+# Write buffer for CSV exports; fewer write() syscalls than the 8 KiB default
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+# Fund name tails stripped by _extract_gp_from_fund_name(), in order:
+# legal suffixes (L.P., L.P.1, LLC, SCSp, ...)
+_GP_LEGAL_SUFFIXES = (
+    "LLC", "Ltd", "SCSp", "S.C.Sp.", "S.C.Sp", "Cooperatief U.A.", "Cooperatief U.A",
+    # L.P. with or without dots, optionally followed by a series number
+    *(lp + n for lp in ("L.P.", "L.P", "LP.", "LP") for n in ("", *string.digits)),
+)
+_GP_SUFFIX_RE = re.compile(
+    r',?\s*(' + '|'.join(map(re.escape, _GP_LEGAL_SUFFIXES)) + r')$', re.I
+)
+# Trailing roman numerals and fund numbers (Fund IV, Partners III-B, ...)
+_GP_FUND_NUMBER_RE = re.compile(r'\s+(Fund\s+)?[IVXLC]+(-[A-Z0-9]+)?(\s+\(.*\))?\s*$')
+# "Fund" at the end with no number ("KKR 2006 Fund")
+_GP_FUND_WORD_RE = re.compile(r'\s+Fund\s*$')
+# Trailing year ("Partners 2022")
+_GP_YEAR_RE = re.compile(r'\s+\d{4}\s*$')
+# Trailing single-letter class designators (A-D)
+_GP_CLASS_RE = re.compile(r'\s+[A-D]\s*$')
+# Last characters (lowercased) of names _GP_SUFFIX_RE can match; "$" also
+# matches before a trailing newline
+_GP_SUFFIX_LAST_CHARS = frozenset({suffix[-1].lower() for suffix in _GP_LEGAL_SUFFIXES} | {"\n"})
+_GP_CLASS_LETTERS = frozenset("ABCD")
+
 # Human-readable column names for demo exports
 FRIENDLY_HEADERS = {
     "fund_name": "Fund Name",
@@ -51,36 +84,69 @@ FRIENDLY_HEADERS = {
 }
 
 
-def _write_csv(filepath: Path, rows: list[dict], fieldnames: list[str],
+def _format_irr(val):
+    return "" if val is None else f"{val * 100:.1f}%"
+
+
+def _format_mm(val):
+    if val is None:
+        return ""
+    return f"{val:,.1f}" if isinstance(val, (int, float)) else val
+
+
+def _format_multiple(val):
+    if val is None:
+        return ""
+    return f"{val:.2f}x" if isinstance(val, (int, float)) else val
+
+
+def _format_plain(val):
+    return "" if val is None else val
+
+
+def _column_formatter(field: str, irr_fields: frozenset, mm_fields: frozenset,
+                      mult_fields: frozenset):
+    """Pick the value formatter for one output column."""
+    if field in irr_fields:
+        return _format_irr
+    if field in mm_fields:
+        return _format_mm
+    if field in mult_fields:
+        return _format_multiple
+    return _format_plain
+
+
+def _write_csv(filepath: Path, rows: Iterable[Mapping], fieldnames: list[str],
                irr_fields: list[str] = None, mm_fields: list[str] = None,
                mult_fields: list[str] = None):
-    """Write CSV with friendly headers and formatted values."""
-    irr_fields = irr_fields or []
-    mm_fields = mm_fields or []
-    mult_fields = mult_fields or []
+    """Write CSV with friendly headers and formatted values.
+
+    ``rows`` may be a cursor or any other iterable of mappings (dicts or
+    sqlite3.Row); rows are formatted and written one at a time. Every row
+    must have every field in ``fieldnames``: values are read with
+    ``row[field]`` (sqlite3.Row has no ``.get()``), so a missing column
+    raises instead of silently becoming an empty cell. Each column's
+    formatter is chosen once, up front, rather than per cell.
+    """
+    irr_fields = frozenset(irr_fields or ())
+    mm_fields = frozenset(mm_fields or ())
+    mult_fields = frozenset(mult_fields or ())
+    columns = [
+        (field, _column_formatter(field, irr_fields, mm_fields, mult_fields))
+        for field in fieldnames
+    ]
 
     friendly = [FRIENDLY_HEADERS.get(f, f) for f in fieldnames]
 
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    row_count = 0
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(friendly)
         for row in rows:
-            out = []
-            for field in fieldnames:
-                val = row.get(field)
-                if val is None:
-                    out.append("")
-                elif field in irr_fields:
-                    out.append(f"{val * 100:.1f}%")
-                elif field in mm_fields and isinstance(val, (int, float)):
-                    out.append(f"{val:,.1f}")
-                elif field in mult_fields and isinstance(val, (int, float)):
-                    out.append(f"{val:.2f}x")
-                else:
-                    out.append(val)
-            writer.writerow(out)
-
-    logger.info(f"Wrote {len(rows)} rows to {filepath}")
+            writer.writerow([fmt(row[field]) for field, fmt in columns])
+            row_count += 1
+
+    logger.info(f"Wrote {row_count} rows to {filepath}")
     return filepath
 
 
@@ -94,20 +160,10 @@ def generate_emerging_manager_commitments(db: Database) -> Path:
         JOIN funds f ON c.fund_id = f.id
         JOIN pension_funds p ON c.pension_fund_id = p.id
         WHERE f.vintage_year >= 2020
-        AND (
-            f.fund_name LIKE '% I' OR f.fund_name LIKE '% I %'
-            OR f.fund_name LIKE '% II' OR f.fund_name LIKE '% II %'
-            OR f.fund_name LIKE '%Fund 1 %' OR f.fund_name LIKE '%Fund 2 %'
-            OR f.fund_name LIKE '%Fund 1' OR f.fund_name LIKE '%Fund 2'
-        )
-        AND f.fund_name NOT LIKE '% III%'
-        AND f.fund_name NOT LIKE '% IV%'
-        AND f.fund_name NOT LIKE '% V %'
-        AND f.fund_name NOT LIKE '% VI%'
+        AND f.fund_number BETWEEN 1 AND 2
         ORDER BY f.vintage_year DESC, f.fund_name, p.name
-    """).fetchall()
+    """)
 
-    rows = [dict(r) for r in rows]
     filepath = DEMO_DIR / "emerging_manager_commitments.csv"
     return _write_csv(
         filepath, rows,
@@ -131,9 +187,8 @@ def generate_buyout_performance(db: Database) -> Path:
         AND f.asset_class = 'Private Equity'
         AND c.net_irr IS NOT NULL
         ORDER BY c.net_irr DESC, f.fund_name
-    """).fetchall()
+    """)
 
-    rows = [dict(r) for r in rows]
     filepath = DEMO_DIR / "pe_performance_2015_2020.csv"
     return _write_csv(
         filepath, rows,
@@ -143,86 +198,125 @@ def generate_buyout_performance(db: Database) -> Path:
     )
 
 
+@lru_cache(maxsize=8192)
 def _extract_gp_from_fund_name(name: str) -> str:
     """Extract the GP/firm name from a fund name.
 
     Most PE funds follow patterns like 'KKR North America Fund XI',
     'Blackstone Capital Partners VI', 'TPG Growth III'. We extract
-    the portion before fund number indicators.
+    the portion before fund number indicators. Memoized, since the same
+    fund name recurs once per pension system committed to it.
     """
-    import re
+    # Each pattern is anchored at the end of the name, so a cheap check of
+    # the last characters skips the regex when it can't match.
     # Strip common suffixes first (L.P., L.P.1, LLC, SCSp, etc.)
-    cleaned = re.sub(r',?\s*(L\.?P\.?\d?|LLC|Ltd|SCSp|S\.C\.Sp\.?|Cooperatief U\.A\.?)$', '', name, flags=re.I).strip()
+    cleaned = name
+    last = name[-1:].lower()
+    if last in _GP_SUFFIX_LAST_CHARS:
+        cleaned = _GP_SUFFIX_RE.sub('', name)
+    cleaned = cleaned.strip()
     # Remove trailing roman numerals, digits, and fund number patterns
     # Match: Fund IV, Partners III, Capital V, etc. at end
-    cleaned = re.sub(
-        r'\s+(Fund\s+)?[IVXLC]+(-[A-Z0-9]+)?(\s+\(.*\))?\s*$', '', cleaned
-    ).strip()
+    cleaned = _GP_FUND_NUMBER_RE.sub('', cleaned).strip()
     # Handle "Fund" at end with no number (e.g., "KKR 2006 Fund", "KKR Millennium Fund")
-    cleaned = re.sub(r'\s+Fund\s*$', '', cleaned).strip()
+    if cleaned.endswith("Fund"):
+        cleaned = _GP_FUND_WORD_RE.sub('', cleaned).strip()
     # Also handle "Partners 2022" style
-    cleaned = re.sub(r'\s+\d{4}\s*$', '', cleaned).strip()
+    if cleaned[-4:].isdigit():
+        cleaned = _GP_YEAR_RE.sub('', cleaned).strip()
     # Remove trailing single letters (A, B, C class designators)
-    cleaned = re.sub(r'\s+[A-D]\s*$', '', cleaned).strip()
+    if cleaned[-1:] in _GP_CLASS_LETTERS:
+        cleaned = _GP_CLASS_RE.sub('', cleaned).strip()
     # Collapse - trim
     return cleaned.strip() if cleaned else name
 
 
+class _GPBucket:
+    """Running totals for one fund family in generate_gp_penetration()."""
+
+    __slots__ = (
+        "fund_ids", "pension_ids", "pension_names", "total_mm", "irr_sum", "irr_count",
+        "multiple_sum", "multiple_count", "min_vintage", "max_vintage",
+    )
+
+    def __init__(self):
+        self.fund_ids = set()
+        self.pension_ids = set()
+        self.pension_names = set()
+        self.total_mm = 0.0
+        self.irr_sum = 0.0
+        self.irr_count = 0
+        self.multiple_sum = 0.0
+        self.multiple_count = 0
+        self.min_vintage = None
+        self.max_vintage = None
+
+
 def generate_gp_penetration(db: Database) -> Path:
     """Which fund families have raised capital from 3+ pension funds in our database?"""
-    # Get all funds with commitments
+    # Aggregate commitments per fund in SQL; only the GP grouping, which
+    # needs _extract_gp_from_fund_name(), is left to Python. Pension ids and
+    # display names come back as JSON arrays, so names may contain commas;
+    # a pension fund without a pension_funds row is shown by its id.
     rows = db.conn.execute("""
         SELECT f.id, f.fund_name, f.vintage_year,
-               c.pension_fund_id, c.commitment_mm, c.net_irr, c.net_multiple
+               json_group_array(DISTINCT c.pension_fund_id) as pension_ids,
+               json_group_array(DISTINCT COALESCE(p.name, c.pension_fund_id)) as pension_names,
+               SUM(c.commitment_mm) as total_mm,
+               SUM(c.net_irr) as irr_sum, COUNT(c.net_irr) as irr_count,
+               SUM(c.net_multiple) as multiple_sum,
+               COUNT(c.net_multiple) as multiple_count
         FROM commitments c
         JOIN funds f ON c.fund_id = f.id
+        LEFT JOIN pension_funds p ON c.pension_fund_id = p.id
         WHERE c.commitment_mm IS NOT NULL
-    """).fetchall()
+        GROUP BY f.id
+    """)
 
     # Group by derived GP name
-    from collections import defaultdict
-    gp_data = defaultdict(lambda: {
-        "fund_ids": set(), "pension_ids": set(), "fund_names": set(),
-        "total_mm": 0.0, "irrs": [], "multiples": [],
-        "vintages": [],
-    })
+    gp_data: dict[str, _GPBucket] = {}
 
     for r in rows:
         gp = _extract_gp_from_fund_name(r["fund_name"])
-        d = gp_data[gp]
-        d["fund_ids"].add(r["id"])
-        d["pension_ids"].add(r["pension_fund_id"])
-        d["fund_names"].add(r["fund_name"])
-        d["total_mm"] += r["commitment_mm"] or 0
-        if r["net_irr"] is not None:
-            d["irrs"].append(r["net_irr"])
-        if r["net_multiple"] is not None:
-            d["multiples"].append(r["net_multiple"])
-        if r["vintage_year"]:
-            d["vintages"].append(r["vintage_year"])
-
-    # Get pension fund names for display
-    pf_names = {}
-    for pf in db.conn.execute("SELECT id, name FROM pension_funds").fetchall():
-        pf_names[pf["id"]] = pf["name"]
+        d = gp_data.get(gp)
+        if d is None:
+            d = gp_data[gp] = _GPBucket()
+        d.fund_ids.add(r["id"])
+        d.pension_ids.update(json.loads(r["pension_ids"]))
+        d.pension_names.update(json.loads(r["pension_names"]))
+        d.total_mm += r["total_mm"]
+        if r["irr_count"]:
+            d.irr_sum += r["irr_sum"]
+            d.irr_count += r["irr_count"]
+        if r["multiple_count"]:
+            d.multiple_sum += r["multiple_sum"]
+            d.multiple_count += r["multiple_count"]
+        vintage = r["vintage_year"]
+        if vintage:
+            if d.min_vintage is None or vintage < d.min_vintage:
+                d.min_vintage = vintage
+            if d.max_vintage is None or vintage > d.max_vintage:
+                d.max_vintage = vintage
 
     # Filter to 3+ pension systems and build output rows
     output = []
     for gp, d in gp_data.items():
-        if len(d["pension_ids"]) >= 3:
+        if len(d.pension_ids) >= 3:
             output.append({
                 "general_partner": gp,
-                "pension_count": len(d["pension_ids"]),
-                "fund_count": len(d["fund_ids"]),
-                "total_commitment_mm": d["total_mm"],
-                "avg_irr": sum(d["irrs"]) / len(d["irrs"]) if d["irrs"] else None,
-                "avg_multiple": sum(d["multiples"]) / len(d["multiples"]) if d["multiples"] else None,
-                "earliest_vintage": min(d["vintages"]) if d["vintages"] else None,
-                "latest_vintage": max(d["vintages"]) if d["vintages"] else None,
-                "pensions": ", ".join(sorted(pf_names.get(pid, pid) for pid in d["pension_ids"])),
+                "pension_count": len(d.pension_ids),
+                "fund_count": len(d.fund_ids),
+                "total_commitment_mm": d.total_mm,
+                "avg_irr": d.irr_sum / d.irr_count if d.irr_count else None,
+                "avg_multiple": d.multiple_sum / d.multiple_count if d.multiple_count else None,
+                "earliest_vintage": d.min_vintage,
+                "latest_vintage": d.max_vintage,
+                "pensions": ", ".join(sorted(d.pension_names)),
             })
 
-    output.sort(key=lambda x: (-x["pension_count"], -x["total_commitment_mm"]))
+    # Most pensions first, then largest total: two stable sorts with C-level keys
+    output.sort(key=itemgetter("total_commitment_mm"), reverse=True)
+    output.sort(key=itemgetter("pension_count"), reverse=True)
 
     filepath = DEMO_DIR / "gp_penetration.csv"
     return _write_csv(
@@ -250,9 +344,8 @@ def generate_commitment_trends(db: Database) -> Path:
         AND c.commitment_mm < 5000
         GROUP BY c.vintage_year, COALESCE(f.sub_strategy, 'Unclassified')
         ORDER BY c.vintage_year, sub_strategy
-    """).fetchall()
+    """)
 
-    rows = [dict(r) for r in rows]
     filepath = DEMO_DIR / "commitment_trends.csv"
     fields = ["vintage_year", "sub_strategy", "fund_count", "avg_commitment_mm",
               "total_commitment_mm", "pension_count"]
@@ -274,9 +367,8 @@ def generate_vc_commitments_by_pension(db: Database) -> Path:
         JOIN pension_funds p ON c.pension_fund_id = p.id
         WHERE f.sub_strategy = 'Venture Capital'
         ORDER BY p.name, f.vintage_year DESC, f.fund_name
-    """).fetchall()
+    """)
 
-    rows = [dict(r) for r in rows]
     filepath = DEMO_DIR / "vc_commitments_by_pension.csv"
     return _write_csv(
         filepath, rows,
@@ -288,59 +380,52 @@ def generate_vc_commitments_by_pension(db: Database) -> Path:
 
 def generate_sample_data(db: Database) -> Path:
     """Curated 100-record sample showcasing cross-linking and full field coverage."""
-    # Get cross-linked fund IDs (appear in 2+ pension systems)
-    cross_fund_ids = db.conn.execute("""
-        SELECT fund_id FROM commitments
-        GROUP BY fund_id HAVING COUNT(DISTINCT pension_fund_id) >= 2
-    """).fetchall()
-    cross_fund_ids = {r["fund_id"] for r in cross_fund_ids}
-
-    # For each pension fund, get records prioritizing cross-linked ones with full fields
     pension_ids = ["calpers", "calstrs", "wsib", "oregon", "ny_common"]
-    all_selected = []
 
+    # One pass over the sampled pensions' commitments, flagging cross-linked
+    # funds (appearing in 2+ pension systems) and counting populated fields
+    rows = db.conn.execute("""
+        WITH cross_funds AS (
+            SELECT fund_id FROM commitments
+            GROUP BY fund_id HAVING COUNT(DISTINCT pension_fund_id) >= 2
+        )
+        SELECT c.*, f.fund_name, f.general_partner, f.asset_class,
+               f.sub_strategy, f.vintage_year as fund_vy,
+               p.name as pension_fund_name, p.state as pension_fund_state,
+               c.fund_id IN (SELECT fund_id FROM cross_funds) as is_cross,
+               (CASE WHEN c.net_irr IS NOT NULL THEN 1 ELSE 0 END
+               + CASE WHEN c.net_multiple IS NOT NULL THEN 1 ELSE 0 END) as performance_fields,
+               (CASE WHEN c.capital_called_mm IS NOT NULL THEN 1 ELSE 0 END
+               + CASE WHEN c.capital_distributed_mm IS NOT NULL THEN 1 ELSE 0 END) as cash_flow_fields
+        FROM commitments c
+        JOIN funds f ON c.fund_id = f.id
+        JOIN pension_funds p ON c.pension_fund_id = p.id
+        WHERE c.pension_fund_id IN ({})
+        AND c.commitment_mm IS NOT NULL
+    """.format(",".join("?" * len(pension_ids))), pension_ids)
+
+    cross_by_pension = {pf_id: [] for pf_id in pension_ids}
+    non_cross_by_pension = {pf_id: [] for pf_id in pension_ids}
+    for r in rows:
+        bucket = cross_by_pension if r["is_cross"] else non_cross_by_pension
+        bucket[r["pension_fund_id"]].append(r)
+
+    # For each pension fund, prioritize cross-linked records with full fields
+    all_selected = []
     for pf_id in pension_ids:
-        # First: cross-linked records with most fields populated
-        cross_rows = db.conn.execute("""
-            SELECT c.*, f.fund_name, f.general_partner, f.asset_class,
-                   f.sub_strategy, f.vintage_year as fund_vy,
-                   p.name as pension_fund_name, p.state as pension_fund_state
-            FROM commitments c
-            JOIN funds f ON c.fund_id = f.id
-            JOIN pension_funds p ON c.pension_fund_id = p.id
-            WHERE c.pension_fund_id = ?
-            AND c.fund_id IN ({})
-            AND c.commitment_mm IS NOT NULL
-            ORDER BY
-                (CASE WHEN c.net_irr IS NOT NULL THEN 1 ELSE 0 END
-                + CASE WHEN c.net_multiple IS NOT NULL THEN 1 ELSE 0 END
-                + CASE WHEN c.capital_called_mm IS NOT NULL THEN 1 ELSE 0 END
-                + CASE WHEN c.capital_distributed_mm IS NOT NULL THEN 1 ELSE 0 END) DESC,
-                c.commitment_mm DESC
-        """.format(",".join("?" * len(cross_fund_ids))),
-            [pf_id] + list(cross_fund_ids),
-        ).fetchall()
-        cross_rows = [dict(r) for r in cross_rows]
-
-        # Then: non-cross-linked records
-        non_cross_rows = db.conn.execute("""
-            SELECT c.*, f.fund_name, f.general_partner, f.asset_class,
-                   f.sub_strategy, f.vintage_year as fund_vy,
-                   p.name as pension_fund_name, p.state as pension_fund_state
-            FROM commitments c
-            JOIN funds f ON c.fund_id = f.id
-            JOIN pension_funds p ON c.pension_fund_id = p.id
-            WHERE c.pension_fund_id = ?
-            AND c.fund_id NOT IN ({})
-            AND c.commitment_mm IS NOT NULL
-            ORDER BY
-                (CASE WHEN c.net_irr IS NOT NULL THEN 1 ELSE 0 END
-                + CASE WHEN c.net_multiple IS NOT NULL THEN 1 ELSE 0 END) DESC,
-                c.commitment_mm DESC
-        """.format(",".join("?" * len(cross_fund_ids))),
-            [pf_id] + list(cross_fund_ids),
-        ).fetchall()
-        non_cross_rows = [dict(r) for r in non_cross_rows]
+        # First: cross-linked records with most fields populated. Ties on
+        # fields and size are broken by fund name, then id, so the sample
+        # doesn't depend on the order SQLite happens to return rows in.
+        cross_rows = sorted(
+            cross_by_pension[pf_id],
+            key=lambda r: (-(r["performance_fields"] + r["cash_flow_fields"]),
+                           -r["commitment_mm"], r["fund_name"], r["id"]),
+        )
+        # Then: non-cross-linked records with performance data
+        non_cross_rows = sorted(
+            non_cross_by_pension[pf_id],
+            key=lambda r: (-r["performance_fields"], -r["commitment_mm"], r["fund_name"], r["id"]),
+        )
 
         # Take up to 12 cross-linked + fill to 20
         selected = cross_rows[:12]
@@ -373,10 +458,113 @@ def generate_sample_data(db: Database) -> Path:
     )
 
 
+# DATASET_README.md body; generate_dataset_readme() fills in the stats and tables
+_README_TEMPLATE = """\
+# Alternative Investment Commitment Dataset
+
+## What This Dataset Contains
+
+This dataset contains **private equity, venture capital, and alternative investment**
+commitment data extracted from **{pension_count} major U.S. public pension fund** disclosures.
+It covers **{total_commitments:,} commitment records** across **{total_funds:,} unique funds**,
+with **{cross_2} funds cross-referenced** across two or more pension systems.
+
+The data is sourced entirely from public disclosures required under state transparency
+laws. No proprietary or paywalled data is included.
+
+## Pension Funds Covered
+
+{pension_table}
+
+## Cross-Referencing Value
+
+The dataset's unique value is **entity resolution across pension systems**.
+When CalPERS, CalSTRS, WSIB, and Oregon all report commitments to the same fund,
+we link those records together under a single canonical fund name.
+
+- **{cross_2} funds** appear in 2 or more pension systems
+- **{cross_3} funds** appear in 3 or more pension systems
+
+This allows you to:
+- See which GPs have the broadest LP relationships
+- Compare reported performance for the same fund across different LPs
+- Identify emerging managers who have won allocations from major pensions
+- Validate data accuracy by cross-checking the same fund across sources
+
+## Field Definitions
+
+| Field | Description |
+|---|---|
+| Pension Fund | The public pension system reporting this commitment |
+| State | U.S. state of the pension fund |
+| Fund Name | The canonical name of the private equity or alternative fund |
+| Asset Class | Broad category: Private Equity, Private Credit, Real Assets |
+| Sub-Strategy | Where classified: Venture Capital, Growth Equity, Buyout, Credit, etc. |
+| Vintage Year | Year the fund began investing (first capital call) |
+| Commitment ($M) | Total capital the pension committed to the fund, in millions |
+| Capital Called ($M) | Capital the GP has drawn down from the pension's commitment |
+| Distributions ($M) | Capital returned to the pension (realizations + income) |
+| Remaining Value ($M) | Current fair market value of unrealized holdings |
+| Net IRR (%) | Net internal rate of return after fees, as reported by the pension |
+| Net Multiple (x) | Total value to paid-in capital ratio (TVPI), net of fees |
+| As-Of Date | The reporting date for this data point |
+| Source URL | Direct link to the public document this data was extracted from |
+
+## Field Completeness
+
+Not all pension systems report all fields. Here is what to expect:
+
+{completeness_table}
+
+## Known Limitations
+
+- **NY Common Retirement Fund does not publish IRR or Net Multiple.** Their disclosure
+  includes commitment, contributed, distributed, and fair value, but not performance metrics.
+- **DPI (distributions to paid-in) is not available** from any source in this dataset.
+- **Data as-of dates vary by pension system.** CalPERS data may be as of June 2025
+  while CalSTRS data is as of March 2025. Comparing IRRs across systems requires
+  awareness of these timing differences.
+- **Sub-strategy classification is incomplete.** Many well-known buyout funds appear
+  without a sub-strategy label because not all pension disclosures categorize funds.
+  Roughly 70% of funds have no sub-strategy assigned.
+- **Texas TRS and Florida SBA have limited data.** Texas provides only a portfolio-level
+  summary. Florida's website blocks programmatic access; their data is not included
+  in the default extraction.
+- **Performance data is net of fees** as reported by each pension fund. Different
+  pensions may use slightly different calculation methodologies, which can produce
+  small differences (typically <2 percentage points) for the same fund.
+
+## Methodology
+
+1. **Source identification:** We identified public disclosure pages for each pension fund
+   and downloaded their most recent private equity portfolio reports.
+2. **Deterministic extraction:** All data was extracted using programmatic parsing
+   (HTML table parsing for CalPERS, PDF table extraction for all others). No AI/LLM
+   was used for data extraction, ensuring reproducibility and accuracy.
+3. **Entity resolution:** Fund names vary across pension systems (e.g., "KKR 2006 Fund"
+   vs "KKR 2006 Fund, L.P."). We use fuzzy matching with secondary signals (GP name,
+   vintage year, fund number) to link the same fund across systems.
+4. **Quality checks:** Every record is validated against reasonable ranges for commitment
+   size, IRR, and multiples. Outliers are flagged for manual review.
+
+## Files Included
+
+| File | Description |
+|---|---|
+| `sample_data.csv` | 100 curated records (20 per pension system) showcasing cross-linking |
+| `emerging_manager_commitments.csv` | First-time funds (Fund I/II, vintage 2020+) across all pensions |
+| `pe_performance_2015_2020.csv` | PE fund performance for mature 2015-2020 vintages |
+| `gp_penetration.csv` | Fund families (derived GP names) with commitments from 3+ pension systems |
+| `commitment_trends.csv` | Average commitment size by vintage year and strategy |
+| `vc_commitments_by_pension.csv` | Venture capital commitments by pension fund |
+| `DATASET_README.md` | This file |
+
+*Generated {generated}*"""
+
+
 def generate_dataset_readme(db: Database) -> Path:
     """Generate DATASET_README.md for non-technical audience."""
     # Gather stats
-    total_commitments = db.conn.execute("SELECT COUNT(*) FROM commitments").fetchone()[0]
     total_funds = db.conn.execute("SELECT COUNT(*) FROM funds").fetchone()[0]
 
     pf_stats = db.conn.execute("""
@@ -392,20 +580,18 @@ def generate_dataset_readme(db: Database) -> Path:
         ORDER BY record_count DESC
     """).fetchall()
 
-    cross_2 = db.conn.execute("""
-        SELECT COUNT(*) FROM (
-            SELECT fund_id FROM commitments
-            GROUP BY fund_id HAVING COUNT(DISTINCT pension_fund_id) >= 2
-        )
-    """).fetchone()[0]
-    cross_3 = db.conn.execute("""
-        SELECT COUNT(*) FROM (
-            SELECT fund_id FROM commitments
-            GROUP BY fund_id HAVING COUNT(DISTINCT pension_fund_id) >= 3
+    # Both cross-reference counts from one grouping of commitments by fund
+    cross_2, cross_3 = db.conn.execute("""
+        WITH per_fund AS (
+            SELECT COUNT(DISTINCT pension_fund_id) AS pension_count
+            FROM commitments GROUP BY fund_id
         )
-    """).fetchone()[0]
+        SELECT COALESCE(SUM(pension_count >= 2), 0),
+               COALESCE(SUM(pension_count >= 3), 0)
+        FROM per_fund
+    """).fetchone()
 
-    # Field completeness
+    # Field completeness, counted for every field in one scan
     fields_check = {
         "commitment_mm": "Commitment Amount",
         "vintage_year": "Vintage Year",
@@ -415,156 +601,102 @@ def generate_dataset_readme(db: Database) -> Path:
         "net_irr": "Net IRR",
         "net_multiple": "Net Multiple",
     }
+    populated_sql = ", ".join(
+        f"COALESCE(SUM({field} IS NOT NULL), 0)" for field in fields_check
+    )
+    total_commitments, *populated = db.conn.execute(
+        f"SELECT COUNT(*), {populated_sql} FROM commitments"
+    ).fetchone()
     completeness = {}
-    for field, label in fields_check.items():
-        cnt = db.conn.execute(
-            f"SELECT COUNT(*) FROM commitments WHERE {field} IS NOT NULL"
-        ).fetchone()[0]
+    for label, cnt in zip(fields_check.values(), populated):
         completeness[label] = f"{cnt / total_commitments * 100:.0f}%" if total_commitments > 0 else "N/A"
 
-    lines = []
-    lines.append("# Alternative Investment Commitment Dataset")
-    lines.append("")
-    lines.append("## What This Dataset Contains")
-    lines.append("")
-    lines.append("This dataset contains **private equity, venture capital, and alternative investment**")
-    lines.append(f"commitment data extracted from **{len(pf_stats)} major U.S. public pension fund** disclosures.")
-    lines.append(f"It covers **{total_commitments:,} commitment records** across **{total_funds:,} unique funds**,")
-    lines.append(f"with **{cross_2} funds cross-referenced** across two or more pension systems.")
-    lines.append("")
-    lines.append("The data is sourced entirely from public disclosures required under state transparency")
-    lines.append("laws. No proprietary or paywalled data is included.")
-    lines.append("")
-
-    lines.append("## Pension Funds Covered")
-    lines.append("")
-    lines.append("| Pension Fund | State | Total AUM | Records | Commitment Total | Vintages | Data As-Of |")
-    lines.append("|---|---|---:|---:|---:|---|---|")
+    pension_rows = [
+        "| Pension Fund | State | Total AUM | Records | Commitment Total | Vintages | Data As-Of |",
+        "|---|---|---:|---:|---:|---|---|",
+    ]
     for pf in pf_stats:
-        pf = dict(pf)
-        aum = f"${pf['total_aum_mm']/1000:,.0f}B" if pf.get('total_aum_mm') else "N/A"
-        total = f"${pf['total_commitment_mm']:,.0f}M" if pf.get('total_commitment_mm') else "N/A"
-        vintages = f"{pf['min_vintage']}-{pf['max_vintage']}" if pf.get('min_vintage') else "N/A"
-        lines.append(
+        aum = f"${pf['total_aum_mm']/1000:,.0f}B" if pf['total_aum_mm'] else "N/A"
+        total = f"${pf['total_commitment_mm']:,.0f}M" if pf['total_commitment_mm'] else "N/A"
+        vintages = f"{pf['min_vintage']}-{pf['max_vintage']}" if pf['min_vintage'] else "N/A"
+        pension_rows.append(
             f"| {pf['name']} | {pf['state']} | {aum} | {pf['record_count']:,} | "
-            f"{total} | {vintages} | {pf.get('as_of_date', 'N/A')} |"
+            f"{total} | {vintages} | {pf['as_of_date']} |"
         )
-    lines.append("")
-
-    lines.append("## Cross-Referencing Value")
-    lines.append("")
-    lines.append("The dataset's unique value is **entity resolution across pension systems**.")
-    lines.append("When CalPERS, CalSTRS, WSIB, and Oregon all report commitments to the same fund,")
-    lines.append("we link those records together under a single canonical fund name.")
-    lines.append("")
-    lines.append(f"- **{cross_2} funds** appear in 2 or more pension systems")
-    lines.append(f"- **{cross_3} funds** appear in 3 or more pension systems")
-    lines.append("")
-    lines.append("This allows you to:")
-    lines.append("- See which GPs have the broadest LP relationships")
-    lines.append("- Compare reported performance for the same fund across different LPs")
-    lines.append("- Identify emerging managers who have won allocations from major pensions")
-    lines.append("- Validate data accuracy by cross-checking the same fund across sources")
-    lines.append("")
-
-    lines.append("## Field Definitions")
-    lines.append("")
-    lines.append("| Field | Description |")
-    lines.append("|---|---|")
-    lines.append("| Pension Fund | The public pension system reporting this commitment |")
-    lines.append("| State | U.S. state of the pension fund |")
-    lines.append("| Fund Name | The canonical name of the private equity or alternative fund |")
-    lines.append("| Asset Class | Broad category: Private Equity, Private Credit, Real Assets |")
-    lines.append("| Sub-Strategy | Where classified: Venture Capital, Growth Equity, Buyout, Credit, etc. |")
-    lines.append("| Vintage Year | Year the fund began investing (first capital call) |")
-    lines.append("| Commitment ($M) | Total capital the pension committed to the fund, in millions |")
-    lines.append("| Capital Called ($M) | Capital the GP has drawn down from the pension's commitment |")
-    lines.append("| Distributions ($M) | Capital returned to the pension (realizations + income) |")
-    lines.append("| Remaining Value ($M) | Current fair market value of unrealized holdings |")
-    lines.append("| Net IRR (%) | Net internal rate of return after fees, as reported by the pension |")
-    lines.append("| Net Multiple (x) | Total value to paid-in capital ratio (TVPI), net of fees |")
-    lines.append("| As-Of Date | The reporting date for this data point |")
-    lines.append("| Source URL | Direct link to the public document this data was extracted from |")
-    lines.append("")
-
-    lines.append("## Field Completeness")
-    lines.append("")
-    lines.append("Not all pension systems report all fields. Here is what to expect:")
-    lines.append("")
-    lines.append("| Field | Populated |")
-    lines.append("|---|---:|")
-    for label, pct in completeness.items():
-        lines.append(f"| {label} | {pct} |")
-    lines.append("")
-
-    lines.append("## Known Limitations")
-    lines.append("")
-    lines.append("- **NY Common Retirement Fund does not publish IRR or Net Multiple.** Their disclosure")
-    lines.append("  includes commitment, contributed, distributed, and fair value, but not performance metrics.")
-    lines.append("- **DPI (distributions to paid-in) is not available** from any source in this dataset.")
-    lines.append("- **Data as-of dates vary by pension system.** CalPERS data may be as of June 2025")
-    lines.append("  while CalSTRS data is as of March 2025. Comparing IRRs across systems requires")
-    lines.append("  awareness of these timing differences.")
-    lines.append("- **Sub-strategy classification is incomplete.** Many well-known buyout funds appear")
-    lines.append("  without a sub-strategy label because not all pension disclosures categorize funds.")
-    lines.append("  Roughly 70% of funds have no sub-strategy assigned.")
-    lines.append("- **Texas TRS and Florida SBA have limited data.** Texas provides only a portfolio-level")
-    lines.append("  summary. Florida's website blocks programmatic access; their data is not included")
-    lines.append("  in the default extraction.")
-    lines.append("- **Performance data is net of fees** as reported by each pension fund. Different")
-    lines.append("  pensions may use slightly different calculation methodologies, which can produce")
-    lines.append("  small differences (typically <2 percentage points) for the same fund.")
-    lines.append("")
-
-    lines.append("## Methodology")
-    lines.append("")
-    lines.append("1. **Source identification:** We identified public disclosure pages for each pension fund")
-    lines.append("   and downloaded their most recent private equity portfolio reports.")
-    lines.append("2. **Deterministic extraction:** All data was extracted using programmatic parsing")
-    lines.append("   (HTML table parsing for CalPERS, PDF table extraction for all others). No AI/LLM")
-    lines.append("   was used for data extraction, ensuring reproducibility and accuracy.")
-    lines.append("3. **Entity resolution:** Fund names vary across pension systems (e.g., \"KKR 2006 Fund\"")
-    lines.append("   vs \"KKR 2006 Fund, L.P.\"). We use fuzzy matching with secondary signals (GP name,")
-    lines.append("   vintage year, fund number) to link the same fund across systems.")
-    lines.append("4. **Quality checks:** Every record is validated against reasonable ranges for commitment")
-    lines.append("   size, IRR, and multiples. Outliers are flagged for manual review.")
-    lines.append("")
-
-    lines.append("## Files Included")
-    lines.append("")
-    lines.append("| File | Description |")
-    lines.append("|---|---|")
-    lines.append("| `sample_data.csv` | 100 curated records (20 per pension system) showcasing cross-linking |")
-    lines.append("| `emerging_manager_commitments.csv` | First-time funds (Fund I/II, vintage 2020+) across all pensions |")
-    lines.append("| `pe_performance_2015_2020.csv` | PE fund performance for mature 2015-2020 vintages |")
-    lines.append("| `gp_penetration.csv` | Fund families (derived GP names) with commitments from 3+ pension systems |")
-    lines.append("| `commitment_trends.csv` | Average commitment size by vintage year and strategy |")
-    lines.append("| `vc_commitments_by_pension.csv` | Venture capital commitments by pension fund |")
-    lines.append("| `DATASET_README.md` | This file |")
-    lines.append("")
-
-    lines.append(f"*Generated {datetime.now().strftime('%B %d, %Y')}*")
+    completeness_rows = ["| Field | Populated |", "|---|---:|"]
+    completeness_rows.extend(f"| {label} | {pct} |" for label, pct in completeness.items())
+
+    readme = _README_TEMPLATE.format(
+        pension_count=len(pf_stats),
+        total_commitments=total_commitments,
+        total_funds=total_funds,
+        cross_2=cross_2,
+        cross_3=cross_3,
+        pension_table="\n".join(pension_rows),
+        completeness_table="\n".join(completeness_rows),
+        generated=datetime.now().strftime('%B %d, %Y'),
+    )
 
     filepath = DEMO_DIR / "DATASET_README.md"
-    filepath.write_text("\n".join(lines), encoding="utf-8")
+    filepath.write_text(readme, encoding="utf-8")
     logger.info(f"Wrote DATASET_README.md to {filepath}")
     return filepath
 
 
-def run_all(db: Database) -> dict:
-    """Generate all demo analysis outputs."""
+# Output name and generator for each demo export, in run_all() result order
+_GENERATORS = (
+    ("emerging_managers", generate_emerging_manager_commitments),
+    ("pe_performance", generate_buyout_performance),
+    ("gp_penetration", generate_gp_penetration),
+    ("commitment_trends", generate_commitment_trends),
+    ("vc_commitments", generate_vc_commitments_by_pension),
+    ("sample_data", generate_sample_data),
+    ("dataset_readme", generate_dataset_readme),
+)
+
+
+def _run_generator(generate, db_path: Path) -> Path:
+    """Run one export generator on its own database connection.
+
+    sqlite3 connections can't be shared across threads, so each generator
+    running in the pool reads through a connection of its own.
+    """
+    db = Database(db_path)
+    try:
+        return generate(db)
+    finally:
+        db.close()
+
+
+def run_all(db: Database, workers: int = 4) -> dict:
+    """Generate all demo analysis outputs.
+
+    The exports are independent read-only queries writing to separate
+    files, so with ``workers > 1`` they run concurrently in a thread pool,
+    each on its own connection to ``db``'s file (the database uses WAL, so
+    readers don't block each other). Only committed data is visible to
+    those connections.
+
+    Args:
+        db: Database to export from.
+        workers: Number of exports to run at once (1 = run serially on
+            ``db``'s own connection).
+
+    Returns:
+        Dict mapping each output name to the path written.
+    """
     DEMO_DIR.mkdir(parents=True, exist_ok=True)
 
-    results = {}
-    results["emerging_managers"] = generate_emerging_manager_commitments(db)
-    results["pe_performance"] = generate_buyout_performance(db)
-    results["gp_penetration"] = generate_gp_penetration(db)
-    results["commitment_trends"] = generate_commitment_trends(db)
-    results["vc_commitments"] = generate_vc_commitments_by_pension(db)
-    results["sample_data"] = generate_sample_data(db)
-    results["dataset_readme"] = generate_dataset_readme(db)
+    # An in-memory database can't be reopened from other connections
+    if workers <= 1 or str(db.db_path) == ":memory:":
+        return {name: generate(db) for name, generate in _GENERATORS}
 
-    return results
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis") as executor:
+        futures = {
+            name: executor.submit(_run_generator, generate, db.db_path)
+            for name, generate in _GENERATORS
+        }
+        return {name: future.result() for name, future in futures.items()}
 
 
 if __name__ == "__main__":
@@ -11,25 +11,46 @@ rule-based NLP — no LLM required. Handles:
   - Sentiment signals from dissenting statements and public comment
 """
 
+import io
 import logging
+import os
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator
 
-import pdfplumber
-import spacy
+from src.utils.pdf_parser import iter_page_text
 
 logger = logging.getLogger(__name__)
 
 # ── Load spaCy model ─────────────────────────────────────────────────────
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.warning("spaCy model not found — run: python -m spacy download en_core_web_sm")
-    nlp = None
+# Only the entity recognizer's output is used; skip the other components
+NER_DISABLED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the spaCy model on first use, once per process.
+
+    Returns None (after logging a warning) if spaCy or the model is missing.
+    """
+    try:
+        import spacy
+    except ImportError:
+        logger.warning("spaCy not installed — run: pip install spacy")
+        return None
+    try:
+        return spacy.load("en_core_web_sm", disable=NER_DISABLED_COMPONENTS)
+    except OSError:
+        logger.warning("spaCy model not found — run: python -m spacy download en_core_web_sm")
+        return None
 
 
 # ── Data classes ─────────────────────────────────────────────────────────
@@ -47,7 +68,7 @@ class EventType(str, Enum):
     MOTION = "motion"
 
 
-@dataclass
+@dataclass(slots=True)
 class BoardEvent:
     """A single structured event extracted from board minutes."""
     event_type: EventType
@@ -59,7 +80,7 @@ class BoardEvent:
     raw_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Attendee:
     name: str
     title: str = ""
@@ -67,7 +88,7 @@ class Attendee:
     role: str = ""  # "member", "staff", "presenter", "consultant", "public"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeetingMinutes:
     """Complete parsed output of a single board meeting."""
     pension_fund: str
@@ -81,25 +102,33 @@ class MeetingMinutes:
 
 # ── PDF text extraction ──────────────────────────────────────────────────
 
-def extract_text_from_pdf(path: str | Path) -> list[dict]:
-    """Extract text from PDF, returning list of {page, text} dicts."""
-    pages = []
-    with pdfplumber.open(path) as pdf:
-        for i, page in enumerate(pdf.pages):
-            text = page.extract_text() or ""
-            pages.append({"page": i + 1, "text": text})
-    return pages
+def extract_text_from_pdf(path: str | Path) -> Iterator[dict]:
+    """Extract text from PDF, yielding a {page, text} dict per page.
+
+    Uses pdfium's plain-text extraction rather than pdfplumber's layout
+    analysis: minutes are running prose, and only the raw text is needed.
+    Pages are yielded as they are extracted, so callers never hold a list
+    of every page's text alongside the joined document.
+    """
+    for i, text in enumerate(iter_page_text(Path(path).read_bytes())):
+        # pdfium ends lines with \r\n; the extractors expect \n
+        yield {"page": i + 1, "text": text.replace("\r\n", "\n")}
+
+
+# Line breaks to join, in one pass: mid-sentence (lowercase continuation
+# after a newline) and mid-name (e.g., "Menlo\nVentures"). Only the run of
+# lowercase letters before a mid-name break is consumed (and put back by
+# the replacement), so consecutive broken lines are all joined.
+LINE_BREAK_JOIN_RE = re.compile(r"(?<=\w)\n(?=[a-z])|(?<=[A-Z])([a-z]+)\n(?=[A-Z][a-z])")
+MULTI_SPACE_RE = re.compile(r"  +")
 
 
 def normalize_text(text: str) -> str:
     """Clean up PDF-extracted text: fix broken lines, normalize whitespace."""
-    # Join lines that break mid-sentence (lowercase continuation after newline)
-    text = re.sub(r"(\w)\n([a-z])", r"\1 \2", text)
-    # Join lines that break mid-name (e.g., "Menlo\nVentures")
-    text = re.sub(r"([A-Z][a-z]+)\n([A-Z][a-z]+)", r"\1 \2", text)
+    # Join lines that break mid-sentence or mid-name
+    text = LINE_BREAK_JOIN_RE.sub(r"\1 ", text)
     # Normalize multiple spaces
-    text = re.sub(r"  +", " ", text)
-    return text
+    return MULTI_SPACE_RE.sub(" ", text)
 
 
 # ── Section detection ────────────────────────────────────────────────────
@@ -130,10 +159,29 @@ KNOWN_SECTIONS = [
     "COMMITTEE REPORTS", "WRITTEN PUBLIC COMMENT",
 ]
 
+# Any known section keyword at the start of a line, with the rest of the line
+KNOWN_SECTIONS_RE = re.compile(
+    r"\n((?:" + "|".join(re.escape(name) for name in KNOWN_SECTIONS) + r")[^\n]*)",
+    re.IGNORECASE,
+)
+# Minimum distance in characters between the starts of two sections
+MIN_SECTION_GAP = 50
+
+# The same alternation in lowercase, for searching a pre-lowered copy
+KNOWN_SECTIONS_LOWER_RE = re.compile(
+    r"\n((?:" + "|".join(re.escape(name.lower()) for name in KNOWN_SECTIONS) + r")[^\n]*)",
+)
+
 
-def detect_sections(full_text: str) -> list[dict]:
+def detect_sections(full_text: str, full_text_lower: str | None = None) -> list[dict]:
     """Split document into sections based on headers.
 
+    Args:
+        full_text: Normalized document text.
+        full_text_lower: Optional ``full_text.lower()`` of the same length.
+            When given, known section keywords are matched against it
+            without case folding and titles are sliced from ``full_text``.
+
     Returns list of {title, start_pos, end_pos, text} dicts.
     """
     header_positions = []
@@ -147,20 +195,29 @@ def detect_sections(full_text: str) -> list[dict]:
             header_positions.append((match.start(), title))
 
     # Also look for known section keywords preceded by newlines
-    for section_name in KNOWN_SECTIONS:
-        for match in re.finditer(
-            rf"\n({re.escape(section_name)}[^\n]*)", full_text, re.IGNORECASE
-        ):
+    if full_text_lower is not None:
+        for match in KNOWN_SECTIONS_LOWER_RE.finditer(full_text_lower):
+            title = full_text[match.start(1):match.end(1)].strip()
+            header_positions.append((match.start(), title))
+    else:
+        for match in KNOWN_SECTIONS_RE.finditer(full_text):
             header_positions.append((match.start(), match.group(1).strip()))
 
-    # Deduplicate and sort by position
+    # Deduplicate and sort by position. A header starting within
+    # MIN_SECTION_GAP of the last accepted one is the same header found by
+    # another pattern (or a title-only section), so it is dropped before
+    # its title is compared; repeated titles (running page headers) too.
     seen = set()
     unique = []
+    last_pos = -MIN_SECTION_GAP
     for pos, title in sorted(header_positions):
+        if pos - last_pos < MIN_SECTION_GAP:
+            continue
         norm = title.upper()[:40]
         if norm not in seen:
             seen.add(norm)
             unique.append((pos, title))
+            last_pos = pos
 
     # Build sections
     sections = []
@@ -205,62 +262,76 @@ ORG_PATTERNS = re.compile(
 )
 
 
+# Roster blocks, each running up to the next roster heading
+MEMBERS_PRESENT_RE = re.compile(
+    r"Members Present:\s*(.*?)(?=Members Absent:|Also Present:|Staff Present:|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+STAFF_PRESENT_RE = re.compile(
+    r"(?:Also|Staff) Present:\s*(.*?)(?=(?:Members Absent|Consultants Present|"
+    r"PERS Present|Legal Counsel|Staff Participating|CALL TO ORDER|$))",
+    re.DOTALL | re.IGNORECASE,
+)
+CONSULTANTS_PRESENT_RE = re.compile(
+    r"Consultants Present:\s*(.*?)(?=PERS Present|Legal Counsel|$)",
+    re.DOTALL | re.IGNORECASE,
+)
+COMMA_SPLIT_RE = re.compile(r",\s*")
+
+
+def _parse_roster_line(line: str, role: str, with_org: bool) -> Attendee | None:
+    """Parse one "Name, Title[, Organization]" roster line.
+
+    Returns None for blank or too-short lines.
+    """
+    name = line.strip().rstrip(",")
+    if len(name) < 3:
+        return None
+    title = ""
+    org = ""
+    title_match = TITLE_PATTERNS.search(name)
+    if title_match:
+        title = title_match.group(0).strip().lstrip(",").strip()
+        name = name[:title_match.start()].strip().rstrip(",")
+    if with_org:
+        org_match = ORG_PATTERNS.search(name)
+        if org_match:
+            org = org_match.group(0).strip().lstrip(",").strip()
+            name = name[:org_match.start()].strip().rstrip(",")
+    return Attendee(name=name, title=title, organization=org, role=role)
+
+
+def _parse_roster_block(block: str, role: str, with_org: bool = False) -> list[Attendee]:
+    """Parse a one-attendee-per-line roster block.
+
+    Args:
+        block: Text of the block, after its "... Present:" heading.
+        role: Role recorded on every attendee.
+        with_org: Also split a trailing organization off each line.
+    """
+    parsed = (_parse_roster_line(line, role, with_org) for line in block.strip().split("\n"))
+    return [attendee for attendee in parsed if attendee is not None]
+
+
 def extract_attendance(text: str) -> list[Attendee]:
     """Extract attendance roster from meeting minutes header."""
     attendees = []
 
     # Find "Members Present:" block
-    members_match = re.search(
-        r"Members Present:\s*(.*?)(?=Members Absent:|Also Present:|Staff Present:|$)",
-        text, re.DOTALL | re.IGNORECASE,
-    )
+    members_match = MEMBERS_PRESENT_RE.search(text)
     if members_match:
-        block = members_match.group(1)
-        for line in block.strip().split("\n"):
-            name = line.strip().rstrip(",")
-            if not name or len(name) < 3:
-                continue
-            title = ""
-            title_match = TITLE_PATTERNS.search(name)
-            if title_match:
-                title = title_match.group(0).strip().lstrip(",").strip()
-                name = name[:title_match.start()].strip().rstrip(",")
-            attendees.append(Attendee(name=name, title=title, role="member"))
+        attendees.extend(_parse_roster_block(members_match.group(1), "member"))
 
     # Find "Also Present:" / "Staff Present:" block
-    staff_match = re.search(
-        r"(?:Also|Staff) Present:\s*(.*?)(?=(?:Members Absent|Consultants Present|"
-        r"PERS Present|Legal Counsel|Staff Participating|CALL TO ORDER|$))",
-        text, re.DOTALL | re.IGNORECASE,
-    )
+    staff_match = STAFF_PRESENT_RE.search(text)
     if staff_match:
-        block = staff_match.group(1)
-        for line in block.strip().split("\n"):
-            name = line.strip().rstrip(",")
-            if not name or len(name) < 3:
-                continue
-            title = ""
-            org = ""
-            title_match = TITLE_PATTERNS.search(name)
-            if title_match:
-                title = title_match.group(0).strip().lstrip(",").strip()
-                name = name[:title_match.start()].strip().rstrip(",")
-            org_match = ORG_PATTERNS.search(name)
-            if org_match:
-                org = org_match.group(0).strip().lstrip(",").strip()
-                name = name[:org_match.start()].strip().rstrip(",")
-            attendees.append(Attendee(
-                name=name, title=title, organization=org, role="staff",
-            ))
+        attendees.extend(_parse_roster_block(staff_match.group(1), "staff", with_org=True))
 
     # Find "Consultants Present:" block (Oregon style)
-    cons_match = re.search(
-        r"Consultants Present:\s*(.*?)(?=PERS Present|Legal Counsel|$)",
-        text, re.DOTALL | re.IGNORECASE,
-    )
+    cons_match = CONSULTANTS_PRESENT_RE.search(text)
     if cons_match:
         block = cons_match.group(1)
-        for name in re.split(r",\s*", block.strip()):
+        for name in COMMA_SPLIT_RE.split(block.strip()):
             name = name.strip()
             if name and len(name) > 2:
                 attendees.append(Attendee(name=name, role="consultant"))
@@ -303,9 +374,8 @@ HISTORY_RE = re.compile(
 )
 
 
-def extract_investment_decisions(text: str, section: str = "") -> list[BoardEvent]:
+def extract_investment_decisions(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract investment commitment events from text."""
-    events = []
 
     for match in INVESTMENT_MOTION_RE.finditer(text):
         amount_str = match.group(1).replace(",", "")
@@ -317,13 +387,13 @@ def extract_investment_decisions(text: str, section: str = "") -> list[BoardEven
 
         # Look for fund description nearby
         desc = ""
-        fund_desc_match = FUND_DESC_RE.search(text[max(0, match.end() - 50):match.end() + 500])
+        fund_desc_match = FUND_DESC_RE.search(text, max(0, match.end() - 50), match.end() + 500)
         if fund_desc_match:
             desc = fund_desc_match.group(2).strip()
 
         # Look for commitment history
         history = {}
-        hist_match = HISTORY_RE.search(text[max(0, match.start() - 200):match.end() + 800])
+        hist_match = HISTORY_RE.search(text, max(0, match.start() - 200), match.end() + 800)
         if hist_match:
             history = {
                 "relationship_since": int(hist_match.group(1)),
@@ -333,7 +403,7 @@ def extract_investment_decisions(text: str, section: str = "") -> list[BoardEven
                 "prior_fund_count": int(hist_match.group(5)),
             }
 
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.INVESTMENT_COMMITMENT,
             summary=f"Approved investment of up to ${amount:.0f}M in {fund_name}",
             details={
@@ -344,21 +414,19 @@ def extract_investment_decisions(text: str, section: str = "") -> list[BoardEven
             },
             section=section,
             raw_text=match.group(0),
-        ))
+        )
 
     for match in MANAGER_SELECT_RE.finditer(text):
         manager_name = match.group(1).strip()
         role = match.group(2).strip()
 
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.MANAGER_SELECTION,
             summary=f"Selected {manager_name} as {role}",
             details={"manager_name": manager_name, "role": role},
             section=section,
             raw_text=match.group(0),
-        ))
-
-    return events
+        )
 
 
 # ── Motion / vote extraction ─────────────────────────────────────────────
@@ -384,6 +452,8 @@ VOTE_ACCLAMATION_RE = re.compile(
     re.IGNORECASE,
 )
 
+MOTION_CARRIED_RE = re.compile(r"motion\s+carried", re.IGNORECASE)
+
 # "seconded" extraction
 SECONDED_RE = re.compile(
     r"(\w[\w .]+?)\s+seconded\s+(?:the\s+)?motion",
@@ -391,35 +461,35 @@ SECONDED_RE = re.compile(
 )
 
 
-def extract_motions(text: str, section: str = "") -> list[BoardEvent]:
+def extract_motions(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract formal motions and their vote outcomes."""
-    events = []
 
     for match in MOTION_RE.finditer(text):
         mover = match.group(1).strip()
         action = match.group(2).strip()
 
-        # Look for seconded and vote outcome nearby (search further for outcome)
-        context = text[match.start():min(match.end() + 800, len(text))]
+        # Look for seconded and vote outcome nearby (search further for outcome),
+        # bounding the searches with pos/endpos rather than slicing a copy
+        start, end = match.start(), match.end() + 800
 
         seconder = ""
-        sec_match = SECONDED_RE.search(context)
+        sec_match = SECONDED_RE.search(text, start, end)
         if sec_match:
             seconder = sec_match.group(1).strip()
 
         outcome = "unknown"
         dissenter = ""
-        if VOTE_UNANIMOUS_RE.search(context):
+        if VOTE_UNANIMOUS_RE.search(text, start, end):
             outcome = "carried_unanimously"
         else:
-            dissent_match = VOTE_WITH_DISSENT_RE.search(context)
+            dissent_match = VOTE_WITH_DISSENT_RE.search(text, start, end)
             if dissent_match:
                 outcome = "carried_with_dissent"
                 dissenter = dissent_match.group(1).strip()
-            elif re.search(r"motion\s+carried", context, re.IGNORECASE):
+            elif MOTION_CARRIED_RE.search(text, start, end):
                 outcome = "carried"
 
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.MOTION,
             summary=f"Motion by {mover}: {action[:100]}",
             details={
@@ -430,10 +500,8 @@ def extract_motions(text: str, section: str = "") -> list[BoardEvent]:
                 "dissenter": dissenter,
             },
             section=section,
-            raw_text=context[:500],
-        ))
-
-    return events
+            raw_text=text[start:start + 500],
+        )
 
 
 # ── Personnel change extraction ──────────────────────────────────────────
@@ -469,55 +537,59 @@ CHAIR_TRANSITION_RE = re.compile(
 )
 
 
-def extract_personnel_changes(text: str, section: str = "") -> list[BoardEvent]:
-    """Extract personnel-related events."""
-    events = []
+def extract_personnel_changes(text: str, section: str = "") -> Iterator[BoardEvent]:
+    """Extract personnel-related events.
 
-    for match in ELECTION_RE.finditer(text):
+    Each pattern only runs when its verb appears in the text; their leading
+    name groups make a scan that finds nothing expensive.
+    """
+    lower = text.lower()
+
+    has_election = any(verb in lower for verb in ("nominated", "declared", "elected", "appointed"))
+    for match in ELECTION_RE.finditer(text) if has_election else ():
         person = match.group(1).strip()
         role = match.group(2).strip()
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.PERSONNEL_CHANGE,
             summary=f"{person} elected/appointed as {role}",
             details={"person": person, "new_role": role, "action": "elected"},
             section=section,
             raw_text=match.group(0),
-        ))
+        )
 
-    for match in APPOINTMENT_RE.finditer(text):
+    for match in APPOINTMENT_RE.finditer(text) if "appoint" in lower else ():
         person = match.group(1).strip()
         committee = match.group(2).strip()
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.COMMITTEE_ASSIGNMENT,
             summary=f"{person} appointed to {committee}",
             details={"person": person, "committee": committee, "action": "appointed"},
             section=section,
             raw_text=match.group(0),
-        ))
+        )
 
-    for match in REMOVAL_RE.finditer(text):
+    for match in REMOVAL_RE.finditer(text) if "removed" in lower else ():
         person = match.group(1).strip()
         committee = match.group(2).strip()
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.COMMITTEE_ASSIGNMENT,
             summary=f"{person} removed from {committee}",
             details={"person": person, "committee": committee, "action": "removed"},
             section=section,
             raw_text=match.group(0),
-        ))
+        )
 
-    for match in CHAIR_TRANSITION_RE.finditer(text):
+    has_transition = "outgoing" in lower or "incoming" in lower
+    for match in CHAIR_TRANSITION_RE.finditer(text) if has_transition else ():
         person = match.group(1).strip()
         direction = "outgoing" if "Outgoing" in match.group(0) else "incoming"
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.PERSONNEL_CHANGE,
             summary=f"{person} — {direction} Chair",
             details={"person": person, "action": direction, "role": "Chair"},
             section=section,
             raw_text=match.group(0),
-        ))
-
-    return events
+        )
 
 
 # ── Performance metrics extraction ───────────────────────────────────────
@@ -541,35 +613,32 @@ BENCHMARK_RE = re.compile(
 )
 
 
-def extract_performance_metrics(text: str, section: str = "") -> list[BoardEvent]:
+def extract_performance_metrics(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract performance reporting metrics."""
-    events = []
 
     for match in RETURN_RE.finditer(text):
         pct = float(match.group(1))
         period = match.group(2).strip() if match.group(2) else ""
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.PERFORMANCE_REPORT,
             summary=f"Return of {pct}%{' for ' + period if period else ''}",
             details={"return_pct": pct, "period": period},
             section=section,
             raw_text=match.group(0),
-        ))
+        )
 
     for match in AUM_RE.finditer(text):
         amount = float(match.group(1).replace(",", ""))
         unit = match.group(2).lower()
         if unit in ("billion", "b"):
             amount *= 1000
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.PERFORMANCE_REPORT,
             summary=f"AUM: ${amount:,.0f}M",
             details={"aum_mm": amount},
             section=section,
             raw_text=match.group(0),
-        ))
-
-    return events
+        )
 
 
 # ── Strategic / policy decision extraction ───────────────────────────────
@@ -594,21 +663,18 @@ STRATEGIC_KEYWORDS = re.compile(
 )
 
 
-def extract_strategic_decisions(text: str, section: str = "") -> list[BoardEvent]:
+def extract_strategic_decisions(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract strategic and policy decisions."""
-    events = []
 
     for match in POLICY_APPROVAL_RE.finditer(text):
         policy = match.group(1).strip()
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.POLICY_APPROVAL,
             summary=f"Approved: {policy}",
             details={"policy": policy},
             section=section,
             raw_text=match.group(0),
-        ))
-
-    return events
+        )
 
 
 # ── Dissent / sentiment extraction ───────────────────────────────────────
@@ -629,6 +695,12 @@ DISSENT_SKIP_SECTIONS = re.compile(
     re.IGNORECASE,
 )
 
+# End of a dissenting statement: next motion, Chair remark or section header
+STATEMENT_END_RE = re.compile(
+    r"\n(?:The motion|Chair \w+ (?:moved|expressed)|"
+    r"\[The Board|\n[A-Z][A-Z ]{5,}\n)"
+)
+
 # Sentiment word lists (pension-specific)
 NEGATIVE_SIGNALS = [
     "risk", "concern", "underperform", "loss", "volatile", "misguided",
@@ -642,41 +714,45 @@ POSITIVE_SIGNALS = [
 ]
 
 
-def extract_dissent_and_sentiment(text: str, section: str = "") -> list[BoardEvent]:
+def _signal_pattern(signals: list[str]) -> re.Pattern:
+    # A lookahead finds every occurrence of every signal, even overlapping ones
+    return re.compile("(?=(" + "|".join(re.escape(w.lower()) for w in signals) + "))")
+
+
+NEGATIVE_SIGNALS_RE = _signal_pattern(NEGATIVE_SIGNALS)
+POSITIVE_SIGNALS_RE = _signal_pattern(POSITIVE_SIGNALS)
+
+
+def extract_dissent_and_sentiment(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract dissenting statements and significant sentiment signals."""
-    events = []
 
     # Skip proxy voting / shareholder proposal sections entirely
     if DISSENT_SKIP_SECTIONS.search(section):
-        return events
+        return
 
     for match in DISSENT_SIGNAL_RE.finditer(text):
         person = match.group(1).strip()
 
         # Skip if this looks like proxy voting content
-        context_around = text[max(0, match.start() - 200):match.end() + 200]
-        if DISSENT_SKIP_SECTIONS.search(context_around):
+        if DISSENT_SKIP_SECTIONS.search(text, max(0, match.start() - 200), match.end() + 200):
             continue
 
         # Grab the full statement (look for the dissenter's text block)
         statement_start = match.end()
         # Find next section header or motion as boundary
-        end_match = re.search(
-            r"\n(?:The motion|Chair \w+ (?:moved|expressed)|"
-            r"\[The Board|\n[A-Z][A-Z ]{5,}\n)",
-            text[statement_start:statement_start + 5000],
-        )
-        statement_end = statement_start + (end_match.start() if end_match else 2000)
+        end_match = STATEMENT_END_RE.search(text, statement_start, statement_start + 5000)
+        statement_end = end_match.start() if end_match else statement_start + 2000
         statement = text[statement_start:statement_end].strip()
 
-        # Score sentiment
-        neg_count = sum(1 for w in NEGATIVE_SIGNALS if w.lower() in statement.lower())
-        pos_count = sum(1 for w in POSITIVE_SIGNALS if w.lower() in statement.lower())
+        # Score sentiment: number of distinct signal words in the statement
+        statement_lower = statement.lower()
+        neg_count = len(set(NEGATIVE_SIGNALS_RE.findall(statement_lower)))
+        pos_count = len(set(POSITIVE_SIGNALS_RE.findall(statement_lower)))
         sentiment = "negative" if neg_count > pos_count else (
             "positive" if pos_count > neg_count else "neutral"
         )
 
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.DISSENT,
             summary=f"Dissenting statement by {person}",
             details={
@@ -688,9 +764,7 @@ def extract_dissent_and_sentiment(text: str, section: str = "") -> list[BoardEve
             },
             section=section,
             raw_text=statement[:1000],
-        ))
-
-    return events
+        )
 
 
 # ── Public comment extraction ────────────────────────────────────────────
@@ -703,21 +777,18 @@ PUBLIC_COMMENT_RE = re.compile(
 )
 
 
-def extract_public_comments(text: str, section: str = "") -> list[BoardEvent]:
+def extract_public_comments(text: str, section: str = "") -> Iterator[BoardEvent]:
     """Extract public comment summaries."""
-    events = []
 
     for match in PUBLIC_COMMENT_RE.finditer(text):
         comment = match.group(0).strip()
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.PUBLIC_COMMENT_SUMMARY,
             summary=f"Public comment: {comment[:150]}...",
             details={"full_text": comment},
             section=section,
             raw_text=comment,
-        ))
-
-    return events
+        )
 
 
 # ── Oregon-style commitment reports (from meeting minutes tables) ────────
@@ -733,16 +804,14 @@ OREGON_COMMITMENT_RE = re.compile(
 
 
 def extract_oregon_commitments(text: str, section: str = "",
-                               pension_fund: str = "") -> list[BoardEvent]:
+                               pension_fund: str = "") -> Iterator[BoardEvent]:
     """Extract Oregon-style commitment listings from Committee Reports.
 
     Only applies to Oregon Investment Council documents.
     """
     # Only run this on Oregon documents
     if pension_fund and pension_fund != "Oregon":
-        return []
-
-    events = []
+        return
 
     for match in OREGON_COMMITMENT_RE.finditer(text):
         fund_name = match.group(1).strip()
@@ -759,57 +828,97 @@ def extract_oregon_commitments(text: str, section: str = "",
         if amount < 1 or amount > 5000:
             continue
 
-        events.append(BoardEvent(
+        yield BoardEvent(
             event_type=EventType.INVESTMENT_COMMITMENT,
             summary=f"Commitment: ${amount:.0f}M to {fund_name}",
             details={"fund_name": fund_name, "amount_mm": amount},
             section=section,
             raw_text=match.group(0),
-        ))
-
-    return events
+        )
 
 
 # ── Entity extraction with spaCy ─────────────────────────────────────────
 
-def extract_entities(text: str) -> dict[str, list[str]]:
-    """Use spaCy NER to extract named entities from text."""
+# spaCy entity label -> extract_entities() result key
+ENTITY_LABEL_KEYS = {
+    "PERSON": "persons",
+    "ORG": "organizations",
+    "MONEY": "money",
+    "DATE": "dates",
+    "PERCENT": "percentages",
+}
+
+# Characters of each chunk passed to spaCy, to bound memory use
+ENTITY_CHUNK_LIMIT = 100000
+
+
+def _collect_entities(docs: Iterable) -> dict[str, list[str]]:
+    """Gather the entities of spaCy docs by type, in order of first appearance."""
+    # Dicts as ordered sets: deduplicate while preserving order
+    found = {key: {} for key in ENTITY_LABEL_KEYS.values()}
+    for doc in docs:
+        for ent in doc.ents:
+            key = ENTITY_LABEL_KEYS.get(ent.label_)
+            if key is not None:
+                found[key][ent.text] = None
+    return {key: list(values) for key, values in found.items()}
+
+
+def extract_entities(texts: str | Iterable[str]) -> dict[str, list[str]]:
+    """Use spaCy NER to extract named entities from text.
+
+    Accepts a single string or an iterable of chunks (e.g. page or section
+    texts), which are run through ``nlp.pipe()`` in batches. Each chunk is
+    truncated to 100,000 characters to bound memory use.
+
+    Returns:
+        Dict of entity lists keyed by type, deduplicated in order of first
+        appearance.
+    """
+    nlp = _get_nlp()
     if nlp is None:
         return {}
+    if isinstance(texts, str):
+        texts = [texts]
+
+    chunks = (text[:ENTITY_CHUNK_LIMIT] for text in texts)
+    return _collect_entities(nlp.pipe(chunks, batch_size=32))
+
+
+def extract_entities_many(
+    texts: Iterable[str], n_process: int | None = None, batch_size: int = 64,
+) -> Iterator[dict[str, list[str]]]:
+    """Extract entities from many documents with one multi-process spaCy pipe.
 
-    doc = nlp(text[:100000])  # Limit to avoid memory issues
-
-    entities = {
-        "persons": [],
-        "organizations": [],
-        "money": [],
-        "dates": [],
-        "percentages": [],
-    }
-
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            entities["persons"].append(ent.text)
-        elif ent.label_ == "ORG":
-            entities["organizations"].append(ent.text)
-        elif ent.label_ == "MONEY":
-            entities["money"].append(ent.text)
-        elif ent.label_ == "DATE":
-            entities["dates"].append(ent.text)
-        elif ent.label_ == "PERCENT":
-            entities["percentages"].append(ent.text)
-
-    # Deduplicate while preserving order
-    for key in entities:
-        seen = set()
-        deduped = []
-        for item in entities[key]:
-            if item not in seen:
-                seen.add(item)
-                deduped.append(item)
-        entities[key] = deduped
-
-    return entities
+    Unlike calling extract_entities() per document, the documents share
+    batches and the worker processes stay up for the whole run. Drivers
+    using this must guard their entry point with ``if __name__ ==
+    "__main__":`` since workers may be spawned.
+
+    Args:
+        texts: Document texts; each is truncated like extract_entities().
+        n_process: Worker processes. Defaults to the
+            BOARD_MINUTES_NER_PROCESSES environment variable, else one less
+            than the CPU count (at least 1).
+        batch_size: Documents per batch sent to each worker.
+
+    Yields:
+        One extract_entities()-style dict per input text, in input order
+        (empty dicts if spaCy is unavailable).
+    """
+    nlp = _get_nlp()
+    if nlp is None:
+        for _ in texts:
+            yield {}
+        return
+    if n_process is None:
+        n_process = int(os.environ.get(
+            "BOARD_MINUTES_NER_PROCESSES", max(1, (os.cpu_count() or 1) - 1),
+        ))
+
+    chunks = (text[:ENTITY_CHUNK_LIMIT] for text in texts)
+    for doc in nlp.pipe(chunks, batch_size=batch_size, n_process=n_process):
+        yield _collect_entities((doc,))
 
 
 # ── Meeting date extraction ──────────────────────────────────────────────
@@ -828,10 +937,10 @@ MEETING_DATE_ALT_RE = re.compile(
 
 def extract_meeting_date(text: str) -> str:
     """Extract the meeting date from document header."""
-    match = MEETING_DATE_RE.search(text[:2000])
+    match = MEETING_DATE_RE.search(text, 0, 2000)
     if match:
         return match.group(1).strip()
-    match = MEETING_DATE_ALT_RE.search(text[:2000])
+    match = MEETING_DATE_ALT_RE.search(text, 0, 2000)
     if match:
         return match.group(0).strip()
     return ""
@@ -848,17 +957,96 @@ PENSION_FUND_PATTERNS = {
 }
 
 
-def identify_pension_fund(text: str) -> str:
-    """Identify which pension fund this document belongs to."""
-    header = text[:3000]
-    for name, pattern in PENSION_FUND_PATTERNS.items():
-        if pattern.search(header):
-            return name
-    return "Unknown"
+# All of PENSION_FUND_PATTERNS in one scan: group "fN" is the Nth pattern.
+# The lookahead tests every position, so no match hides another.
+_PENSION_FUND_NAMES = list(PENSION_FUND_PATTERNS)
+PENSION_FUND_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<f{i}>{pattern.pattern})" for i, pattern in enumerate(PENSION_FUND_PATTERNS.values())
+    ) + ")",
+    re.IGNORECASE,
+)
+# The patterns are plain literals, so lowering them matches a pre-lowered copy
+PENSION_FUND_LOWER_RE = re.compile(
+    "(?=" + "|".join(
+        f"(?P<f{i}>{pattern.pattern.lower()})"
+        for i, pattern in enumerate(PENSION_FUND_PATTERNS.values())
+    ) + ")",
+)
+
+
+def identify_pension_fund(text: str, text_lower: str | None = None) -> str:
+    """Identify which pension fund this document belongs to.
+
+    If the header mentions several funds, the first in PENSION_FUND_PATTERNS
+    order wins. A pre-lowered copy of ``text`` may be passed as
+    ``text_lower`` to skip case folding.
+    """
+    best = len(_PENSION_FUND_NAMES)
+    if text_lower is not None:
+        matches = PENSION_FUND_LOWER_RE.finditer(text_lower, 0, 3000)
+    else:
+        matches = PENSION_FUND_RE.finditer(text, 0, 3000)
+    for match in matches:
+        best = min(best, int(match.lastgroup[1:]))
+        if best == 0:
+            break
+    return _PENSION_FUND_NAMES[best] if best < len(_PENSION_FUND_NAMES) else "Unknown"
 
 
 # ── Main parsing pipeline ────────────────────────────────────────────────
 
+# Section extractors, in event order, each with words (lowercase) that at
+# least one of its patterns requires. A section containing none of them
+# can't produce events, so the extractor's regexes are skipped.
+SECTION_EXTRACTORS = [
+    (extract_investment_decisions, ("invest", "commit", "select")),
+    (extract_motions, ("moved",)),
+    (extract_personnel_changes, (
+        "nominated", "declared", "elected", "appoint", "removed", "outgoing", "incoming",
+    )),
+    (extract_performance_metrics, ("percent", "assets", "aum")),
+    (extract_strategic_decisions, ("approve",)),
+    (extract_dissent_and_sentiment, ("statement", "expressed", "voting", "vote")),
+    (extract_public_comments, ("comment",)),
+]
+
+
+@lru_cache(maxsize=16)
+def _ingest(
+    pdf_path: Path, mtime_ns: int, size: int,
+) -> tuple[str, str | None, int, tuple[dict, ...]]:
+    """Extract, normalize and section a minutes PDF.
+
+    Deterministic for a given file, so results are cached in-process. The
+    modification time and size are part of the key so an edited file is
+    read again; neither is used otherwise.
+
+    Returns:
+        (full_text, full_text_lower, page_count, sections). Callers must
+        not modify the cached section dicts.
+    """
+    # Extract raw text, appending each page as it is streamed
+    buf = io.StringIO()
+    page_count = 0
+    for page in extract_text_from_pdf(pdf_path):
+        if page_count:
+            buf.write("\n\n")
+        buf.write(page["text"])
+        page_count += 1
+    full_text = normalize_text(buf.getvalue())
+    del buf
+    # Lowercased once for the case-insensitive fast paths. Offsets into it
+    # only line up with full_text when lowering kept every character's
+    # length (a few, like "İ", grow), so otherwise fall back to IGNORECASE.
+    full_text_lower = full_text.lower()
+    if len(full_text_lower) != len(full_text):
+        full_text_lower = None
+
+    sections = tuple(detect_sections(full_text, full_text_lower))
+    return full_text, full_text_lower, page_count, sections
+
+
 def parse_meeting_minutes(pdf_path: str | Path) -> MeetingMinutes:
     """Parse a board meeting minutes PDF into structured data.
 
@@ -868,25 +1056,24 @@ def parse_meeting_minutes(pdf_path: str | Path) -> MeetingMinutes:
     pdf_path = Path(pdf_path)
     logger.info(f"Parsing board minutes: {pdf_path.name}")
 
-    # Extract raw text
-    pages = extract_text_from_pdf(pdf_path)
-    full_text = "\n\n".join(p["text"] for p in pages)
-    full_text = normalize_text(full_text)
+    # Extract text and sections (cached while the file is unchanged)
+    stat = pdf_path.stat()
+    full_text, full_text_lower, page_count, sections = _ingest(
+        pdf_path.resolve(), stat.st_mtime_ns, stat.st_size,
+    )
 
     # Identify basics
-    pension_fund = identify_pension_fund(full_text)
+    pension_fund = identify_pension_fund(full_text, full_text_lower)
     meeting_date = extract_meeting_date(full_text)
 
     logger.info(f"  Pension fund: {pension_fund}")
     logger.info(f"  Meeting date: {meeting_date}")
-    logger.info(f"  Pages: {len(pages)}, Characters: {len(full_text):,}")
+    logger.info(f"  Pages: {page_count}, Characters: {len(full_text):,}")
 
     # Extract attendance
     attendees = extract_attendance(full_text)
     logger.info(f"  Attendees found: {len(attendees)}")
 
-    # Detect sections
-    sections = detect_sections(full_text)
     logger.info(f"  Sections detected: {len(sections)}")
 
     # Extract events from each section
@@ -895,34 +1082,37 @@ def parse_meeting_minutes(pdf_path: str | Path) -> MeetingMinutes:
     for sec in sections:
         sec_text = sec["text"]
         sec_title = sec["title"]
-
-        all_events.extend(extract_investment_decisions(sec_text, sec_title))
-        all_events.extend(extract_motions(sec_text, sec_title))
-        all_events.extend(extract_personnel_changes(sec_text, sec_title))
-        all_events.extend(extract_performance_metrics(sec_text, sec_title))
-        all_events.extend(extract_strategic_decisions(sec_text, sec_title))
-        all_events.extend(extract_dissent_and_sentiment(sec_text, sec_title))
-        all_events.extend(extract_public_comments(sec_text, sec_title))
-        all_events.extend(extract_oregon_commitments(
-            sec_text, sec_title, pension_fund=pension_fund,
-        ))
+        if full_text_lower is not None:
+            sec_lower = full_text_lower[sec["start_pos"]:sec["end_pos"]]
+        else:
+            sec_lower = sec_text.lower()
+
+        for extractor, keywords in SECTION_EXTRACTORS:
+            if any(word in sec_lower for word in keywords):
+                all_events.extend(extractor(sec_text, sec_title))
+        # Oregon commitment listings always carry a dollar amount
+        if "$" in sec_text:
+            all_events.extend(extract_oregon_commitments(
+                sec_text, sec_title, pension_fund=pension_fund,
+            ))
 
     # Also run full-text extraction for things that might span sections
+    # (skipping funds already found, with the same event type, per section)
     full_events = extract_investment_decisions(full_text, "full_document")
+    seen_funds = {(e.event_type, e.details.get("fund_name")) for e in all_events}
     for evt in full_events:
-        if not any(
-            e.details.get("fund_name") == evt.details.get("fund_name")
-            for e in all_events if e.event_type == evt.event_type
-        ):
+        key = (evt.event_type, evt.details.get("fund_name"))
+        if key not in seen_funds:
+            seen_funds.add(key)
             all_events.append(evt)
 
     logger.info(f"  Events extracted: {len(all_events)}")
+    counts = Counter(e.event_type for e in all_events)
     for evt_type in EventType:
-        count = sum(1 for e in all_events if e.event_type == evt_type)
-        if count > 0:
-            logger.info(f"    {evt_type.value}: {count}")
+        if counts[evt_type] > 0:
+            logger.info(f"    {evt_type.value}: {counts[evt_type]}")
 
-    return MeetingMinutes(
+    minutes = MeetingMinutes(
         pension_fund=pension_fund,
         meeting_date=meeting_date,
         document_path=str(pdf_path),
@@ -931,6 +1121,37 @@ def parse_meeting_minutes(pdf_path: str | Path) -> MeetingMinutes:
         sections=[{"title": s["title"], "length": len(s["text"])} for s in sections],
         raw_text=full_text,
     )
+    intern_minutes_strings(minutes)
+    return minutes
+
+
+# Event detail fields holding names that recur across meetings
+INTERNED_DETAIL_KEYS = ("fund_name", "manager_name", "person", "committee", "new_role", "role")
+
+
+def intern_minutes_strings(minutes: MeetingMinutes) -> None:
+    """Intern the names in parsed minutes that recur across meetings, in place.
+
+    Fund, manager and person names, section titles and attendee fields
+    repeat across a corpus; interning keeps one copy of each when many
+    MeetingMinutes are held at once. Minutes unpickled from a worker
+    process arrive as fresh copies and need interning again.
+    """
+    minutes.pension_fund = sys.intern(minutes.pension_fund)
+    for sec in minutes.sections:
+        sec["title"] = sys.intern(sec["title"])
+    for a in minutes.attendees:
+        a.name = sys.intern(a.name)
+        a.title = sys.intern(a.title)
+        a.organization = sys.intern(a.organization)
+        a.role = sys.intern(a.role)
+    for evt in minutes.events:
+        evt.section = sys.intern(evt.section)
+        details = evt.details
+        for key in INTERNED_DETAIL_KEYS:
+            value = details.get(key)
+            if isinstance(value, str):
+                details[key] = sys.intern(value)
 
 
 # ── Human-readable report ────────────────────────────────────────────────
@@ -947,8 +1168,11 @@ def format_report(minutes: MeetingMinutes) -> str:
     lines.append(f"{'─' * 70}")
 
     # Attendance summary
-    members = [a for a in minutes.attendees if a.role == "member"]
-    staff = [a for a in minutes.attendees if a.role == "staff"]
+    attendees_by_role = {}
+    for a in minutes.attendees:
+        attendees_by_role.setdefault(a.role, []).append(a)
+    members = attendees_by_role.get("member", [])
+    staff = attendees_by_role.get("staff", [])
     if members:
         lines.append(f"\nATTENDANCE ({len(members)} members, {len(staff)} staff)")
         lines.append(f"  Members: {', '.join(a.name for a in members[:10])}")
@@ -992,29 +1216,25 @@ def format_report(minutes: MeetingMinutes) -> str:
     managers = event_groups.get(EventType.MANAGER_SELECTION, [])
     if managers:
         lines.append(f"\nMANAGER SELECTIONS ({len(managers)})")
-        for evt in managers:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in managers)
 
     # Personnel changes
     personnel = event_groups.get(EventType.PERSONNEL_CHANGE, [])
     if personnel:
         lines.append(f"\nPERSONNEL CHANGES ({len(personnel)})")
-        for evt in personnel:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in personnel)
 
     # Committee assignments
     committees = event_groups.get(EventType.COMMITTEE_ASSIGNMENT, [])
     if committees:
         lines.append(f"\nCOMMITTEE ASSIGNMENTS ({len(committees)})")
-        for evt in committees:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in committees)
 
     # Policy approvals
     policies = event_groups.get(EventType.POLICY_APPROVAL, [])
     if policies:
         lines.append(f"\nPOLICY APPROVALS ({len(policies)})")
-        for evt in policies:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in policies)
 
     # Motions
     motions = event_groups.get(EventType.MOTION, [])
@@ -1031,8 +1251,7 @@ def format_report(minutes: MeetingMinutes) -> str:
     perf = event_groups.get(EventType.PERFORMANCE_REPORT, [])
     if perf:
         lines.append(f"\nPERFORMANCE METRICS ({len(perf)})")
-        for evt in perf:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in perf)
 
     # Dissent / sentiment
     dissent = event_groups.get(EventType.DISSENT, [])
@@ -1049,8 +1268,7 @@ def format_report(minutes: MeetingMinutes) -> str:
     pub = event_groups.get(EventType.PUBLIC_COMMENT_SUMMARY, [])
     if pub:
         lines.append(f"\nPUBLIC COMMENT THEMES ({len(pub)})")
-        for evt in pub:
-            lines.append(f"  * {evt.summary}")
+        lines.extend(f"  * {evt.summary}" for evt in pub)
 
     lines.append(f"\n{'=' * 70}")
     lines.append(f"Total events extracted: {len(minutes.events)}")
@@ -1063,8 +1281,6 @@ def format_report(minutes: MeetingMinutes) -> str:
 
 def main():
     """Parse all board meeting minutes in data/cache/board_minutes/."""
-    import sys
-
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
@@ -1083,18 +1299,24 @@ def main():
 
     print(f"Found {len(pdfs)} board meeting documents.\n")
 
+    # Documents are independent and parsing is CPU-bound regex work, so
+    # they are parsed in worker processes; reports print in file order
+    workers = min(os.cpu_count() or 1, 8, len(pdfs))
     all_minutes = []
-    for pdf_path in pdfs:
-        try:
-            minutes = parse_meeting_minutes(pdf_path)
-            all_minutes.append(minutes)
-            report = format_report(minutes)
-            print(report)
-            print()
-        except Exception as e:
-            logger.error(f"Failed to parse {pdf_path.name}: {e}")
-            import traceback
-            traceback.print_exc()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(parse_meeting_minutes, pdf_path) for pdf_path in pdfs]
+        for pdf_path, future in zip(pdfs, futures):
+            try:
+                minutes = future.result()
+                intern_minutes_strings(minutes)
+                all_minutes.append(minutes)
+                report = format_report(minutes)
+                print(report)
+                print()
+            except Exception as e:
+                logger.error(f"Failed to parse {pdf_path.name}: {e}")
+                import traceback
+                traceback.print_exc()
 
     # Summary across all meetings
     if len(all_minutes) > 1:
@@ -43,8 +43,9 @@ def cli(ctx, db):
 @click.option("--fund", default=None, help="Run a specific fund adapter (e.g., calpers)")
 @click.option("--force", is_flag=True, help="Run even if source data hasn't changed")
 @click.option("--all", "run_all", is_flag=True, help="Run all adapters (including Texas TRS, Florida SBA)")
+@click.option("--workers", default=1, type=int, help="Worker processes for parsing multi-page PDFs")
 @click.pass_context
-def run(ctx, fund, force, run_all):
+def run(ctx, fund, force, run_all, workers):
     """Run the extraction pipeline."""
     db = Database(ctx.obj["db_path"])
     try:
@@ -52,15 +53,15 @@ def run(ctx, fund, force, run_all):
 
         if fund:
             try:
-                adapter = get_adapter(fund)
+                adapter = get_adapter(fund, workers=workers)
             except KeyError as e:
                 click.echo(f"Error: {e}", err=True)
                 sys.exit(1)
             adapters = [adapter]
         elif run_all:
-            adapters = get_all_adapters()
+            adapters = get_all_adapters(workers=workers)
         else:
-            adapters = get_default_adapters()
+            adapters = get_default_adapters(workers=workers)
 
         if not adapters:
             click.echo("No adapters available.")
@@ -216,26 +217,23 @@ def spot_check(ctx, count):
         db.migrate()
 
         # Get per-pension-fund commitment IDs for stratified sampling
-        pf_rows = db.conn.execute(
-            """SELECT DISTINCT p.id, p.name
-            FROM pension_funds p
-            JOIN commitments c ON c.pension_fund_id = p.id
+        ids_by_pf = {}
+        for row in db.conn.execute(
+            """SELECT c.pension_fund_id, c.id
+            FROM commitments c
+            JOIN pension_funds p ON c.pension_fund_id = p.id
             ORDER BY p.name"""
-        ).fetchall()
+        ):
+            ids_by_pf.setdefault(row["pension_fund_id"], []).append(row["id"])
 
-        if not pf_rows:
+        if not ids_by_pf:
             click.echo("No commitments in database.")
             return
 
-        per_pf = max(1, count // len(pf_rows))
+        per_pf = max(1, count // len(ids_by_pf))
         sampled_ids = []
 
-        for pf in pf_rows:
-            ids = db.conn.execute(
-                "SELECT id FROM commitments WHERE pension_fund_id = ?",
-                (pf["id"],),
-            ).fetchall()
-            ids = [r["id"] for r in ids]
+        for ids in ids_by_pf.values():
             sampled_ids.extend(random.sample(ids, min(per_pf, len(ids))))
 
         # Trim to exact count
@@ -244,16 +242,22 @@ def spot_check(ctx, count):
 
         click.echo(f"=== Spot-Check: {len(sampled_ids)} Random Records ===\n")
 
-        for i, cid in enumerate(sampled_ids, 1):
-            row = db.conn.execute(
-                """SELECT c.*, f.fund_name, p.name as pension_fund_name
+        # Fetch all sampled records in one query, then print in sample order
+        placeholders = ",".join("?" * len(sampled_ids))
+        rows_by_id = {
+            row["id"]: row
+            for row in db.conn.execute(
+                f"""SELECT c.*, f.fund_name, p.name as pension_fund_name
                 FROM commitments c
                 JOIN funds f ON c.fund_id = f.id
                 JOIN pension_funds p ON c.pension_fund_id = p.id
-                WHERE c.id = ?""",
-                (cid,),
-            ).fetchone()
+                WHERE c.id IN ({placeholders})""",
+                sampled_ids,
+            )
+        }
 
+        for i, cid in enumerate(sampled_ids, 1):
+            row = rows_by_id.get(cid)
             if not row:
                 continue
 
@@ -275,13 +279,43 @@ def spot_check(ctx, count):
         db.close()
 
 
+def _fund_name_keys(names) -> dict:
+    """Map each distinct fund name to its (normalized lowercase name, fund number).
+
+    Aliases and canonical names recur across review items, so each is
+    normalized once rather than per row.
+    """
+    from src.utils.normalization import extract_fund_number, normalize_fund_name
+
+    return {
+        name: (normalize_fund_name(name).lower(), extract_fund_number(name))
+        for name in set(names)
+    }
+
+
+def _fuzzy_scores(pairs: list) -> tuple[list, list]:
+    """Score (alias, canonical) name pairs in one batch.
+
+    Returns:
+        (token_sort_ratio, ratio) score lists scaled to 0-1, one entry per
+        pair, computed by rapidfuzz's C pairwise scorer.
+    """
+    import numpy as np
+    from rapidfuzz import fuzz, process
+
+    left = [a for a, _ in pairs]
+    right = [c for _, c in pairs]
+    scores = []
+    for scorer in (fuzz.token_sort_ratio, fuzz.ratio):
+        batch = process.cpdist(left, right, scorer=scorer, dtype=np.float64)
+        scores.append((batch / 100.0).tolist())
+    return scores[0], scores[1]
+
+
 @cli.command("resolve-fuzzy")
 @click.pass_context
 def resolve_fuzzy(ctx):
     """Auto-resolve high-confidence fuzzy match review items."""
-    from rapidfuzz import fuzz
-    from src.utils.normalization import extract_fund_number, normalize_fund_name
-
     db = Database(ctx.obj["db_path"])
     try:
         db.migrate()
@@ -293,22 +327,21 @@ def resolve_fuzzy(ctx):
 
         click.echo(f"Found {len(items)} unresolved fuzzy_match review items.\n")
         auto_resolved = 0
-        remaining = 0
-
-        for item in items:
-            alias = item.get("alias") or ""
-            canonical = item.get("canonical_name") or ""
-
-            if not alias or not canonical:
-                remaining += 1
-                continue
+        # Items missing either name can't be scored and stay for review
+        scorable = [item for item in items if item.get("alias") and item.get("canonical_name")]
+        remaining = len(items) - len(scorable)
+        keys = _fund_name_keys(
+            name for item in scorable for name in (item["alias"], item["canonical_name"])
+        )
+        toks, stds = _fuzzy_scores([
+            (keys[item["alias"]][0], keys[item["canonical_name"]][0]) for item in scorable
+        ])
 
-            norm_alias = normalize_fund_name(alias).lower()
-            norm_canon = normalize_fund_name(canonical).lower()
-            tok = fuzz.token_sort_ratio(norm_alias, norm_canon) / 100.0
-            std = fuzz.ratio(norm_alias, norm_canon) / 100.0
-            anum = extract_fund_number(alias)
-            cnum = extract_fund_number(canonical)
+        for item, tok, std in zip(scorable, toks, stds):
+            alias = item["alias"]
+            canonical = item["canonical_name"]
+            anum = keys[alias][1]
+            cnum = keys[canonical][1]
 
             # Auto-resolve if high confidence match
             nums_ok = (not anum and not cnum) or (anum == cnum)
@@ -333,9 +366,6 @@ def resolve_fuzzy(ctx):
 @click.pass_context
 def audit_links(ctx):
     """Audit fuzzy-matched fund links across pension systems."""
-    from rapidfuzz import fuzz
-    from src.utils.normalization import extract_fund_number, normalize_fund_name
-
     db = Database(ctx.obj["db_path"])
     try:
         db.migrate()
@@ -356,13 +386,13 @@ def audit_links(ctx):
         click.echo(f"=== Fuzzy Match Audit ({len(aliases)} aliases) ===\n")
 
         suspect_count = 0
-        for a in aliases:
-            norm_alias = normalize_fund_name(a["alias"]).lower()
-            norm_canon = normalize_fund_name(a["fund_name"]).lower()
-            tok = fuzz.token_sort_ratio(norm_alias, norm_canon) / 100.0
-            std = fuzz.ratio(norm_alias, norm_canon) / 100.0
-            anum = extract_fund_number(a["alias"])
-            cnum = extract_fund_number(a["fund_name"])
+        keys = _fund_name_keys(name for a in aliases for name in (a["alias"], a["fund_name"]))
+        toks, stds = _fuzzy_scores([
+            (keys[a["alias"]][0], keys[a["fund_name"]][0]) for a in aliases
+        ])
+        for a, tok, std in zip(aliases, toks, stds):
+            anum = keys[a["alias"]][1]
+            cnum = keys[a["fund_name"]][1]
 
             # Flag anything that looks potentially wrong
             suspect = False
@@ -6,9 +6,12 @@ Schema designed to migrate to PostgreSQL trivially.
 
 import sqlite3
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+from src.utils.normalization import extract_fund_number_value
 
 
 DEFAULT_DB_PATH = Path("data/pension_tracker.db")
@@ -24,6 +27,7 @@ CREATE TABLE IF NOT EXISTS funds (
     asset_class TEXT,
     sub_strategy TEXT,
     fund_size_mm REAL,
+    fund_number INTEGER,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -148,6 +152,8 @@ CREATE TABLE IF NOT EXISTS consulting_firm_aliases (
 CREATE INDEX IF NOT EXISTS idx_commitments_fund_id ON commitments(fund_id);
 CREATE INDEX IF NOT EXISTS idx_commitments_pension_fund_id ON commitments(pension_fund_id);
 CREATE INDEX IF NOT EXISTS idx_commitments_as_of_date ON commitments(as_of_date);
+CREATE INDEX IF NOT EXISTS idx_funds_vintage_asset_class ON funds(vintage_year, asset_class);
+CREATE INDEX IF NOT EXISTS idx_funds_sub_strategy ON funds(sub_strategy);
 CREATE INDEX IF NOT EXISTS idx_fund_aliases_fund_id ON fund_aliases(fund_id);
 CREATE INDEX IF NOT EXISTS idx_review_queue_resolved ON review_queue(resolved);
 CREATE INDEX IF NOT EXISTS idx_consulting_engagements_firm ON consulting_engagements(consulting_firm_id);
@@ -155,6 +161,15 @@ CREATE INDEX IF NOT EXISTS idx_consulting_engagements_pension ON consulting_enga
 CREATE INDEX IF NOT EXISTS idx_consulting_firm_aliases_firm ON consulting_firm_aliases(consulting_firm_id);
 """
 
+# Bump when extract_fund_number_value() changes so migrate() refills fund_number
+FUND_NUMBER_VERSION = 2
+
+# Indexes on columns added after the initial schema; created once
+# _add_missing_columns() has brought older databases up to date
+POST_MIGRATION_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_funds_vintage_number ON funds(vintage_year, fund_number);
+"""
+
 
 def generate_id() -> str:
     """Generate a UUID for use as a primary key."""
@@ -168,6 +183,7 @@ class Database:
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: Optional[sqlite3.Connection] = None
+        self._in_transaction = False
 
     @property
     def conn(self) -> sqlite3.Connection:
@@ -175,9 +191,38 @@ class Database:
             self._conn = sqlite3.connect(str(self.db_path))
             self._conn.row_factory = sqlite3.Row
             self._conn.execute("PRAGMA journal_mode=WAL")
+            # WAL keeps the database consistent without a sync per commit
+            self._conn.execute("PRAGMA synchronous=NORMAL")
             self._conn.execute("PRAGMA foreign_keys=ON")
         return self._conn
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into a single transaction.
+
+        The write helpers normally commit after every row; inside this
+        block those commits are deferred and the block commits once on
+        exit, or rolls back if it raises. Nested blocks join the outer one.
+        """
+        if self._in_transaction:
+            yield
+            return
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
+
+    def _commit(self):
+        """Commit, unless a transaction() block will commit on exit."""
+        if not self._in_transaction:
+            self.conn.commit()
+
     def close(self):
         if self._conn is not None:
             self._conn.close()
@@ -186,8 +231,30 @@ class Database:
     def migrate(self):
         """Create all tables if they don't exist. Safe to run repeatedly."""
         self.conn.executescript(SCHEMA_SQL)
+        self._add_missing_columns()
+        self.conn.executescript(POST_MIGRATION_INDEX_SQL)
         self.conn.commit()
 
+    def _add_missing_columns(self):
+        """Add columns introduced after a database was created, with backfill.
+
+        ``fund_number`` is also recomputed when the database was filled by
+        an older version of extract_fund_number_value() (tracked in
+        ``PRAGMA user_version``).
+        """
+        fund_columns = {r["name"] for r in self.conn.execute("PRAGMA table_info(funds)")}
+        if "fund_number" not in fund_columns:
+            self.conn.execute("ALTER TABLE funds ADD COLUMN fund_number INTEGER")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < FUND_NUMBER_VERSION:
+            self.conn.executemany(
+                "UPDATE funds SET fund_number = ? WHERE id = ?",
+                [
+                    (extract_fund_number_value(r["fund_name"]), r["id"])
+                    for r in self.conn.execute("SELECT id, fund_name FROM funds")
+                ],
+            )
+            self.conn.execute(f"PRAGMA user_version = {FUND_NUMBER_VERSION}")
+
     # ---- Pension Funds ----
 
     def upsert_pension_fund(
@@ -220,7 +287,7 @@ class Database:
             (id, name, full_name, state, total_aum_mm, website_url,
              data_source_type, disclosure_quality, now, now),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def get_pension_fund(self, id: str) -> Optional[dict]:
@@ -249,15 +316,20 @@ class Database:
         sub_strategy: Optional[str] = None,
         fund_size_mm: Optional[float] = None,
     ) -> str:
-        """Insert or update a fund record."""
+        """Insert or update a fund record.
+
+        The fund's series number (``fund_number``) is derived from
+        ``fund_name``.
+        """
         now = datetime.now(timezone.utc).isoformat()
         self.conn.execute(
             """INSERT INTO funds (id, fund_name, fund_name_raw, general_partner,
                 general_partner_normalized, vintage_year, asset_class, sub_strategy,
-                fund_size_mm, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                fund_size_mm, fund_number, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(id) DO UPDATE SET
                 fund_name=excluded.fund_name,
+                fund_number=excluded.fund_number,
                 general_partner=excluded.general_partner,
                 general_partner_normalized=excluded.general_partner_normalized,
                 vintage_year=excluded.vintage_year,
@@ -268,9 +340,9 @@ class Database:
             """,
             (id, fund_name, fund_name_raw, general_partner,
              general_partner_normalized, vintage_year, asset_class, sub_strategy,
-             fund_size_mm, now, now),
+             fund_size_mm, extract_fund_number_value(fund_name), now, now),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def get_fund(self, id: str) -> Optional[dict]:
@@ -348,7 +420,7 @@ class Database:
              source_document, source_page, extraction_method, extraction_confidence,
              now, now, now),
         )
-        self.conn.commit()
+        self._commit()
         # Return the actual ID (may be existing if upserted)
         row = self.conn.execute(
             """SELECT id FROM commitments
@@ -412,7 +484,7 @@ class Database:
                 VALUES (?, ?, ?, ?)""",
                 (id, fund_id, alias, source_pension_fund_id),
             )
-            self.conn.commit()
+            self._commit()
         except sqlite3.IntegrityError:
             # Alias already exists for this source
             row = self.conn.execute(
@@ -452,7 +524,7 @@ class Database:
                 "INSERT INTO gp_aliases (id, canonical_name, alias) VALUES (?, ?, ?)",
                 (id, canonical_name, alias),
             )
-            self.conn.commit()
+            self._commit()
         except sqlite3.IntegrityError:
             row = self.conn.execute(
                 "SELECT id FROM gp_aliases WHERE alias = ?", (alias,)
@@ -484,7 +556,7 @@ class Database:
             VALUES (?, ?, ?, 'running', ?, ?)""",
             (id, pension_fund_id, now, source_url, source_hash),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def complete_extraction_run(
@@ -506,7 +578,7 @@ class Database:
             (now, status, records_extracted, records_updated, records_flagged,
              errors, run_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_last_extraction_run(self, pension_fund_id: str) -> Optional[dict]:
         """Get the most recent extraction run for a pension fund."""
@@ -546,7 +618,7 @@ class Database:
             VALUES (?, ?, ?, ?)""",
             (id, commitment_id, flag_type, flag_detail),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def get_review_queue(self, resolved: Optional[bool] = None) -> list[dict]:
@@ -567,7 +639,7 @@ class Database:
         self.conn.execute(
             "UPDATE review_queue SET resolved = TRUE WHERE id = ?", (id,)
         )
-        self.conn.commit()
+        self._commit()
 
     def clear_review_items_by_type(self, flag_type: str) -> int:
         """Delete all unresolved review items of a given type. Returns count deleted."""
@@ -575,7 +647,7 @@ class Database:
             "DELETE FROM review_queue WHERE flag_type = ? AND resolved = FALSE",
             (flag_type,),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def bulk_resolve_review_items(self, flag_type: str) -> int:
@@ -584,7 +656,7 @@ class Database:
             "UPDATE review_queue SET resolved = TRUE WHERE flag_type = ? AND resolved = FALSE",
             (flag_type,),
         )
-        self.conn.commit()
+        self._commit()
         return cursor.rowcount
 
     def get_fuzzy_match_details(self) -> list[dict]:
@@ -633,7 +705,7 @@ class Database:
             (id, name, name_normalized, firm_type, headquarters,
              website_url, notes, now, now),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def get_consulting_firm(self, id: str) -> Optional[dict]:
@@ -666,7 +738,7 @@ class Database:
                 VALUES (?, ?, ?)""",
                 (id, consulting_firm_id, alias),
             )
-            self.conn.commit()
+            self._commit()
         except sqlite3.IntegrityError:
             row = self.conn.execute(
                 "SELECT id FROM consulting_firm_aliases WHERE alias = ?",
@@ -733,7 +805,7 @@ class Database:
                  contract_term_years, source_url, source_document, source_page,
                  extraction_method, extraction_confidence, now, existing["id"]),
             )
-            self.conn.commit()
+            self._commit()
             return existing["id"]
 
         # Insert new record
@@ -749,7 +821,7 @@ class Database:
              contract_term_years, source_url, source_document, source_page,
              extraction_method, extraction_confidence, now, now),
         )
-        self.conn.commit()
+        self._commit()
         return id
 
     def get_consulting_engagements_joined(
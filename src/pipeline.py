@@ -6,6 +6,8 @@ and quality checking across all pension fund sources.
 
 import logging
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 
 from src.adapters.base import PensionFundAdapter
 from src.database import Database
@@ -17,8 +19,9 @@ logger = logging.getLogger(__name__)
 class Pipeline:
     """Orchestrates the full data extraction pipeline."""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, fetch_workers: int = 4):
         self.db = db
+        self.fetch_workers = fetch_workers
         self.db.migrate()
         self.registry = FundRegistry(db)
         self.consulting_registry = ConsultingFirmRegistry(db)
@@ -30,6 +33,10 @@ class Pipeline:
     ) -> dict:
         """Run the extraction pipeline for the given adapters.
 
+        Source documents are fetched concurrently (up to ``fetch_workers`` at
+        a time) while adapters are parsed and stored one after another, so
+        network waits overlap with each other and with parsing.
+
         Args:
             adapters: List of adapter instances to run.
             force: If True, run even if source data hasn't changed.
@@ -39,39 +46,55 @@ class Pipeline:
         """
         results = {}
 
-        for adapter in adapters:
-            adapter_name = adapter.pension_fund_id
-            logger.info(f"=== Starting pipeline for {adapter.pension_fund_name} ===")
-
-            try:
-                result = self._run_adapter(adapter, force=force)
-                results[adapter_name] = result
-                logger.info(
-                    f"=== Completed {adapter.pension_fund_name}: "
-                    f"{result['records_extracted']} extracted, "
-                    f"{result['records_updated']} updated, "
-                    f"{result['records_flagged']} flagged ==="
-                )
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
-                logger.error(f"Pipeline failed for {adapter.pension_fund_name}: {e}")
-                results[adapter_name] = {
-                    "status": "error",
-                    "error": error_msg,
-                    "records_extracted": 0,
-                    "records_updated": 0,
-                    "records_flagged": 0,
-                }
+        workers = max(1, min(self.fetch_workers, len(adapters)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as executor:
+            fetches = [executor.submit(adapter.fetch_source) for adapter in adapters]
+            for adapter, fetch in zip(adapters, fetches):
+                results[adapter.pension_fund_id] = self._run_one(adapter, force, fetch)
 
         return results
 
+    def _run_one(self, adapter: PensionFundAdapter, force: bool, fetch: Future) -> dict:
+        """Run one adapter, turning any failure into an error result."""
+        logger.info(f"=== Starting pipeline for {adapter.pension_fund_name} ===")
+
+        try:
+            result = self._run_adapter(adapter, force=force, fetch=fetch)
+            logger.info(
+                f"=== Completed {adapter.pension_fund_name}: "
+                f"{result['records_extracted']} extracted, "
+                f"{result['records_updated']} updated, "
+                f"{result['records_flagged']} flagged ==="
+            )
+            return result
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {e}\n{traceback.format_exc()}"
+            logger.error(f"Pipeline failed for {adapter.pension_fund_name}: {e}")
+            return {
+                "status": "error",
+                "error": error_msg,
+                "records_extracted": 0,
+                "records_updated": 0,
+                "records_flagged": 0,
+            }
+        finally:
+            # Release the parsed PDF (and its cached page layouts)
+            adapter.close_pdf()
+
     def _run_adapter(
         self,
         adapter: PensionFundAdapter,
         force: bool = False,
+        fetch: Optional[Future] = None,
     ) -> dict:
         """Run a single adapter through the pipeline.
 
+        Args:
+            adapter: Adapter to run.
+            force: If True, run even if source data hasn't changed.
+            fetch: Future for an already-started ``adapter.fetch_source()``
+                call; the source is fetched here if not given.
+
         Returns:
             Dict with extraction results.
         """
@@ -79,8 +102,8 @@ class Pipeline:
         info = adapter.get_pension_fund_info()
         self.db.upsert_pension_fund(**info)
 
-        # Fetch source data
-        raw_data = adapter.fetch_source()
+        # Fetch source data (re-raises the fetch's exception, if any)
+        raw_data = fetch.result() if fetch is not None else adapter.fetch_source()
         source_hash = adapter.get_source_hash(raw_data)
 
         # Check if data has changed since last run
@@ -108,82 +131,87 @@ class Pipeline:
 
         try:
             # Parse the data
-            records = adapter.parse(raw_data)
+            records = adapter.parse_cached(raw_data, force=force)
             logger.info(f"Parsed {len(records)} records from {adapter.pension_fund_name}")
 
-            records_extracted = 0
-            records_updated = 0
-            records_flagged = 0
-
-            for record in records:
-                # Entity resolution
-                fund_id, match_type = self.registry.resolve(
-                    fund_name_raw=record["fund_name_raw"],
-                    general_partner=record.get("general_partner"),
-                    vintage_year=record.get("vintage_year"),
-                    source_pension_fund_id=adapter.pension_fund_id,
-                )
-
-                # Compute DPI if not provided but derivable
-                dpi = record.get("dpi")
-                if dpi is None:
-                    called = record.get("capital_called_mm")
-                    distributed = record.get("capital_distributed_mm")
-                    if called is not None and distributed is not None and called > 0:
-                        dpi = round(distributed / called, 4)
-
-                # Insert/update commitment
-                commitment_id = self.db.upsert_commitment(
-                    pension_fund_id=adapter.pension_fund_id,
-                    fund_id=fund_id,
-                    source_url=record["source_url"],
-                    extraction_method=record["extraction_method"],
-                    commitment_mm=record.get("commitment_mm"),
-                    vintage_year=record.get("vintage_year"),
-                    capital_called_mm=record.get("capital_called_mm"),
-                    capital_distributed_mm=record.get("capital_distributed_mm"),
-                    remaining_value_mm=record.get("remaining_value_mm"),
-                    net_irr=record.get("net_irr"),
-                    net_multiple=record.get("net_multiple"),
-                    dpi=dpi,
-                    as_of_date=record.get("as_of_date"),
-                    source_document=record.get("source_document"),
-                    source_page=record.get("source_page"),
-                    extraction_confidence=record.get("extraction_confidence"),
-                )
-
-                records_extracted += 1
-
-                # Flag low-confidence extractions
-                confidence = record.get("extraction_confidence", 1.0)
-                if confidence < 0.85:
-                    self.db.add_review_item(
-                        commitment_id=commitment_id,
-                        flag_type="low_confidence",
-                        flag_detail=f"Extraction confidence {confidence:.2f} below threshold",
-                    )
-                    records_flagged += 1
-
-                # Flag fuzzy entity matches
-                if match_type == "fuzzy":
-                    self.db.add_review_item(
-                        commitment_id=commitment_id,
-                        flag_type="fuzzy_match",
-                        flag_detail=f"Fund '{record['fund_name_raw']}' fuzzy-matched to {fund_id}",
+            # Store the records as one transaction: a finished adapter stays
+            # committed if a later one fails, and a failure part-way through
+            # this one rolls back its partial rows (the error run is then
+            # recorded below)
+            with self.db.transaction():
+                records_extracted = 0
+                records_updated = 0
+                records_flagged = 0
+
+                for record in records:
+                    # Entity resolution
+                    fund_id, match_type = self.registry.resolve(
+                        fund_name_raw=record["fund_name_raw"],
+                        general_partner=record.get("general_partner"),
+                        vintage_year=record.get("vintage_year"),
+                        source_pension_fund_id=adapter.pension_fund_id,
                     )
-                    records_flagged += 1
 
-            # Consulting data extraction phase
-            consulting_extracted = self._extract_consulting_data(adapter)
+                    # Compute DPI if not provided but derivable
+                    dpi = record.get("dpi")
+                    if dpi is None:
+                        called = record.get("capital_called_mm")
+                        distributed = record.get("capital_distributed_mm")
+                        if called is not None and distributed is not None and called > 0:
+                            dpi = round(distributed / called, 4)
+
+                    # Insert/update commitment
+                    commitment_id = self.db.upsert_commitment(
+                        pension_fund_id=adapter.pension_fund_id,
+                        fund_id=fund_id,
+                        source_url=record["source_url"],
+                        extraction_method=record["extraction_method"],
+                        commitment_mm=record.get("commitment_mm"),
+                        vintage_year=record.get("vintage_year"),
+                        capital_called_mm=record.get("capital_called_mm"),
+                        capital_distributed_mm=record.get("capital_distributed_mm"),
+                        remaining_value_mm=record.get("remaining_value_mm"),
+                        net_irr=record.get("net_irr"),
+                        net_multiple=record.get("net_multiple"),
+                        dpi=dpi,
+                        as_of_date=record.get("as_of_date"),
+                        source_document=record.get("source_document"),
+                        source_page=record.get("source_page"),
+                        extraction_confidence=record.get("extraction_confidence"),
+                    )
 
-            # Complete the extraction run
-            self.db.complete_extraction_run(
-                run_id=run_id,
-                status="completed",
-                records_extracted=records_extracted,
-                records_updated=records_updated,
-                records_flagged=records_flagged,
-            )
+                    records_extracted += 1
+
+                    # Flag low-confidence extractions
+                    confidence = record.get("extraction_confidence", 1.0)
+                    if confidence < 0.85:
+                        self.db.add_review_item(
+                            commitment_id=commitment_id,
+                            flag_type="low_confidence",
+                            flag_detail=f"Extraction confidence {confidence:.2f} below threshold",
+                        )
+                        records_flagged += 1
+
+                    # Flag fuzzy entity matches
+                    if match_type == "fuzzy":
+                        self.db.add_review_item(
+                            commitment_id=commitment_id,
+                            flag_type="fuzzy_match",
+                            flag_detail=f"Fund '{record['fund_name_raw']}' fuzzy-matched to {fund_id}",
+                        )
+                        records_flagged += 1
+
+                # Consulting data extraction phase
+                consulting_extracted = self._extract_consulting_data(adapter)
+
+                # Complete the extraction run
+                self.db.complete_extraction_run(
+                    run_id=run_id,
+                    status="completed",
+                    records_extracted=records_extracted,
+                    records_updated=records_updated,
+                    records_flagged=records_flagged,
+                )
 
             return {
                 "status": "completed",
@@ -195,6 +223,9 @@ class Pipeline:
             }
 
         except Exception as e:
+            # The registries cached funds and aliases the rollback discarded
+            self.registry = FundRegistry(self.db)
+            self.consulting_registry = ConsultingFirmRegistry(self.db)
             error_msg = f"{type(e).__name__}: {e}"
             self.db.complete_extraction_run(
                 run_id=run_id,
@@ -0,0 +1,122 @@
+"""HTTP utilities for fetching pension fund source documents.
+
+Provides a shared requests Session so adapters fetching from the same
+hosts reuse pooled keep-alive connections instead of paying a fresh
+TCP+TLS handshake per request.
+"""
+
+import logging
+import os
+import tempfile
+from email.utils import formatdate
+from pathlib import Path
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use.
+
+    The session keeps up to 10 pooled connections per host and retries
+    transient failures (connection errors and 5xx responses) up to three
+    times with exponential backoff.
+
+    Returns:
+        Shared requests.Session instance.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
+def download_to_file(
+    url: str,
+    dest: Path,
+    timeout: float = 30,
+    headers: Optional[dict] = None,
+    expected_prefix: Optional[bytes] = None,
+    chunk_size: int = 1 << 20,
+    conditional: bool = False,
+) -> Path:
+    """Stream a download to ``dest`` without holding the whole body in memory.
+
+    The body is written in chunks to a temporary file next to ``dest`` and
+    atomically moved into place, so an interrupted or rejected download
+    never replaces a good cached copy.
+
+    With ``conditional=True`` and an existing ``dest``, the request carries
+    ``If-None-Match`` (from the ETag saved beside ``dest`` by the previous
+    download) and ``If-Modified-Since`` (from ``dest``'s mtime). A 304
+    response leaves ``dest`` untouched and nothing is transferred.
+
+    Args:
+        url: URL to fetch.
+        dest: Destination file path (parent directories are created).
+        timeout: Request timeout in seconds.
+        headers: Optional extra request headers.
+        expected_prefix: If given, the body must start with these bytes
+            (e.g. b"%PDF-"), otherwise ValueError is raised.
+        chunk_size: Bytes per streamed chunk.
+        conditional: Skip the transfer if the server reports ``dest`` is
+            still current.
+
+    Returns:
+        The destination path.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    etag_path = dest.with_name(dest.name + ".etag")
+
+    headers = dict(headers or {})
+    if conditional and dest.exists():
+        headers["If-Modified-Since"] = formatdate(dest.stat().st_mtime, usegmt=True)
+        if etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+    with get_session().get(url, timeout=timeout, headers=headers, stream=True) as resp:
+        if conditional and resp.status_code == 304:
+            logger.info(f"{url} not modified, keeping {dest}")
+            return dest
+        resp.raise_for_status()
+        fd, tmp_name = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                first = True
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    if first and expected_prefix is not None:
+                        if not chunk.startswith(expected_prefix):
+                            raise ValueError(
+                                f"Download from {url} does not start with {expected_prefix!r}"
+                            )
+                    first = False
+                    f.write(chunk)
+            os.replace(tmp_name, dest)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        etag = resp.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+
+    return dest
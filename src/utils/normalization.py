@@ -8,6 +8,7 @@ import re
 from datetime import date, datetime
 from typing import Optional
 
+import pandas as pd
 from dateutil import parser as dateutil_parser
 
 
@@ -65,6 +66,16 @@ def parse_dollar_amount(value, context_in_millions: bool = False) -> Optional[fl
     if not s:
         return None
 
+    # Fast path: plain figures like "45,000,000" (the common case in PDF
+    # tables) need no sign or scale-suffix handling
+    try:
+        result = float(s.replace(",", ""))
+    except ValueError:
+        pass
+    else:
+        result *= 1.0 if context_in_millions else 1.0 / 1_000_000
+        return -result if negative else result
+
     # Check for negative sign
     if s.startswith("-"):
         negative = not negative
@@ -102,6 +113,46 @@ def parse_dollar_amount(value, context_in_millions: bool = False) -> Optional[fl
         return None
 
 
+# Characters dropped from plain dollar figures, and the plain-number shape
+# that can go straight to float() once they are gone
+_DOLLAR_STRIP = str.maketrans("", "", "$, ")
+PLAIN_NUMBER_RE = r"-?(?:\d+\.?\d*|\.\d+)"
+
+
+def parse_dollar_column(values: pd.Series) -> pd.Series:
+    """Vectorized parse_dollar_amount() for a column of raw-dollar strings.
+
+    Plain figures like "1,234,567" or "(45,000)" are converted in a single
+    pass. Anything else (scale suffixes, "-", "N/A", stray text) falls back
+    to parse_dollar_amount() cell by cell, so the result always matches the
+    scalar function.
+
+    Args:
+        values: Series of dollar strings in raw dollars.
+
+    Returns:
+        Float Series in millions, NaN where unparseable.
+    """
+    cleaned = (
+        values.str.strip()
+        .str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+        .str.translate(_DOLLAR_STRIP)
+    )
+    plain = cleaned.str.fullmatch(PLAIN_NUMBER_RE).fillna(False).astype(bool)
+
+    result = pd.Series(float("nan"), index=values.index)
+    result[plain] = cleaned[plain].astype(float) * (1.0 / 1_000_000)
+
+    other = ~plain
+    if other.any():
+        result[other] = pd.Series(
+            [parse_dollar_amount(text) for text in values[other]],
+            index=values.index[other],
+            dtype=float,
+        )
+    return result
+
+
 def parse_percentage(value) -> Optional[float]:
     """Parse a percentage string and return as a decimal fraction.
 
@@ -315,6 +366,47 @@ def normalize_fund_name(name: str) -> str:
     return s
 
 
+_ROMAN_VALUES = {
+    'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
+    'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10,
+    'XI': 11, 'XII': 12, 'XIII': 13, 'XIV': 14, 'XV': 15,
+    'XVI': 16, 'XVII': 17, 'XVIII': 18, 'XIX': 19, 'XX': 20,
+    'XXI': 21, 'XXII': 22, 'XXIII': 23, 'XXIV': 24, 'XXV': 25,
+}
+
+_FUND_NAME_TOKEN_SPLIT_RE = re.compile(r'[\s,\-\'\"()]+')
+
+# Words after which a standalone 'I' is a fund number
+_FUND_CONTEXT_WORDS = frozenset({
+    'fund', 'partners', 'capital', 'equity', 'ventures', 'opportunities',
+    'growth', 'credit', 'europe', 'asia', 'evergreen', 'springblue',
+})
+
+# Legal-form suffix ending a fund name ("Fund II, L.P.")
+_LEGAL_FORM_TAIL_RE = re.compile(r',?\s*(?:L\.?P\.?|LLC|Ltd\.?|Inc\.?)$', re.IGNORECASE)
+
+
+def _roman_token_value(tokens: list[str], i: int, bare_i: bool = False) -> Optional[int]:
+    """Value of ``tokens[i]`` as a fund-number Roman numeral, or None.
+
+    A standalone 'I' only counts after a fund-context word, unless
+    ``bare_i`` is set; 'V' after a word ending in 'v' is a split word.
+    """
+    upper = tokens[i].upper().rstrip('.')
+    value = _ROMAN_VALUES.get(upper)
+    if value is None:
+        return None
+    if upper == 'I':
+        # 'I' at start of name is not a fund number
+        if i == 0:
+            return None
+        if not bare_i and tokens[i - 1].lower().rstrip('.,') not in _FUND_CONTEXT_WORDS:
+            return None
+    elif upper == 'V' and i > 0 and tokens[i - 1].lower().endswith('v'):
+        return None
+    return value
+
+
 def extract_fund_number(name: str) -> Optional[str]:
     """Extract the primary Roman numeral fund number from a fund name.
 
@@ -328,52 +420,57 @@ def extract_fund_number(name: str) -> Optional[str]:
     if not name:
         return None
 
-    _ROMAN_VALUES = {
-        'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
-        'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10,
-        'XI': 11, 'XII': 12, 'XIII': 13, 'XIV': 14, 'XV': 15,
-        'XVI': 16, 'XVII': 17, 'XVIII': 18, 'XIX': 19, 'XX': 20,
-        'XXI': 21, 'XXII': 22, 'XXIII': 23, 'XXIV': 24, 'XXV': 25,
-    }
-
     # Split into tokens
-    tokens = re.split(r'[\s,\-\'\"()]+', name.strip())
+    tokens = _FUND_NAME_TOKEN_SPLIT_RE.split(name.strip())
 
     best_roman = None
     best_value = 0
 
     for i, token in enumerate(tokens):
-        upper = token.upper().rstrip('.')
-        if upper not in _ROMAN_VALUES:
-            continue
-
-        value = _ROMAN_VALUES[upper]
-
-        # Skip standalone 'I' unless preceded by a fund-context word
-        if upper == 'I' and i > 0:
-            prev = tokens[i - 1].lower().rstrip('.,')
-            fund_words = {'fund', 'partners', 'capital', 'equity', 'ventures',
-                          'opportunities', 'growth', 'credit', 'europe', 'asia',
-                          'evergreen', 'springblue'}
-            if prev not in fund_words:
-                continue
-        elif upper == 'I' and i == 0:
-            continue  # 'I' at start of name is not a fund number
-
-        # Skip 'V' if it could be part of a word
-        if upper == 'V' and i > 0:
-            prev = tokens[i - 1].lower()
-            if prev.endswith('v'):
-                continue  # part of a split word
-
+        value = _roman_token_value(tokens, i)
         # Take the largest Roman numeral found (the primary fund number)
-        if value > best_value:
+        if value is not None and value > best_value:
             best_value = value
-            best_roman = upper
+            best_roman = token.upper().rstrip('.')
 
     return best_roman
 
 
+def extract_fund_number_value(name: str) -> Optional[int]:
+    """Return a fund's series number as an integer.
+
+    Looks, in order, for a number right after "Fund" (Roman or Arabic, as
+    in "Genstar XI Opportunities Fund I" or "Orbit Capital Fund 2"), then
+    a Roman numeral ending the name ("GSC I", "Warburg Pincus XIV, L.P."),
+    and otherwise falls back to the largest numeral from
+    extract_fund_number(). Stored on each fund so first-time funds
+    (series 1 or 2) can be found with an indexed lookup.
+
+    Returns:
+        The series number, or None if the name has none.
+    """
+    if not name:
+        return None
+    tokens = [t for t in _FUND_NAME_TOKEN_SPLIT_RE.split(name.strip()) if t]
+
+    for i in range(1, len(tokens)):
+        if tokens[i - 1].lower().rstrip('.') in ('fund', 'fd'):
+            if tokens[i].isdigit() and len(tokens[i]) <= 2:
+                return int(tokens[i])
+            value = _roman_token_value(tokens, i)
+            if value is not None:
+                return value
+
+    tail = [t for t in _FUND_NAME_TOKEN_SPLIT_RE.split(_LEGAL_FORM_TAIL_RE.sub('', name.strip())) if t]
+    if tail:
+        value = _roman_token_value(tail, len(tail) - 1, bare_i=True)
+        if value is not None:
+            return value
+
+    roman = extract_fund_number(name)
+    return _ROMAN_VALUES[roman] if roman else None
+
+
 # Top GP -> default strategy mapping for when keyword-based classification fails.
 # These are the primary strategies for the largest/most common GPs.
 GP_DEFAULT_STRATEGY: dict[str, tuple[str, str]] = {
@@ -996,6 +1093,38 @@ def rejoin_split_number(text: str) -> str:
     return re.sub(r'(\d)\s+(\d)', r'\1\2', text)
 
 
+def join_number_tokens(tokens: list[str]) -> str:
+    """Join PDF word tokens for a numeric column, rejoining split digits.
+
+    Tokens are joined with spaces except where a token ending in a digit is
+    followed by one starting with a digit, so ['7', '0,000,000'] becomes
+    '70,000,000'. Gives the same result as rejoin_split_number() over the
+    space-joined (whitespace-free) tokens, without the extra regex pass:
+    like the regex, a single-digit token that was joined to its left
+    neighbour is not also joined to its right one, so ['1', '2', '3']
+    becomes '12 3'.
+
+    Args:
+        tokens: Word texts of one column, in left-to-right order.
+
+    Returns:
+        Joined column text.
+    """
+    if not tokens:
+        return ""
+    parts = [tokens[0]]
+    # Whether the last token's final digit was consumed by a join
+    consumed = False
+    for token in tokens[1:]:
+        if not consumed and parts[-1][-1:].isdecimal() and token[:1].isdecimal():
+            consumed = len(token) == 1
+        else:
+            parts.append(" ")
+            consumed = False
+        parts.append(token)
+    return "".join(parts)
+
+
 def extract_as_of_date_from_text(text: str) -> Optional[str]:
     """Extract an as-of date from PDF text.
 
@@ -3,13 +3,44 @@
 Uses pdfplumber for text extraction from table-structured PDFs.
 """
 
+import io
 import logging
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable, Iterator, Optional
 
 import pdfplumber
+import pypdfium2
+from pdfplumber.utils import cluster_objects
 
 logger = logging.getLogger(__name__)
 
+# Start method for page-parsing workers. The pipeline parses while its
+# fetch threads may still be downloading, and forking a multi-threaded
+# process can copy a lock one of those threads holds, so workers are
+# started from a clean server process (or spawned where that's missing).
+_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# PDF opened once per worker process by map_pdf_pages
+_worker_pdf = None
+
+# Ligatures expanded by pdfplumber's word extraction
+_LIGATURES = {
+    "\ufb00": "ff",
+    "\ufb03": "ffi",
+    "\ufb04": "ffl",
+    "\ufb01": "fi",
+    "\ufb02": "fl",
+    "\ufb06": "st",
+    "\ufb05": "st",
+}
+
 
 def extract_text_from_pdf(pdf_path: str | Path) -> str:
     """Extract all text from a PDF file.
@@ -44,3 +75,224 @@ def extract_text_by_page(pdf_path: str | Path) -> list[str]:
             text = page.extract_text()
             pages.append(text or "")
     return pages
+
+
+def iter_page_text(raw_data: bytes) -> Iterator[str]:
+    """Yield the plain text of each page using pdfium.
+
+    Much faster than pdfplumber's layout-aware extraction, which makes it
+    suited to locating the pages worth parsing in long documents. Word
+    spacing and line breaks can differ from pdfplumber's text.
+
+    Args:
+        raw_data: Raw PDF bytes.
+
+    Yields:
+        Text of each page, in page order.
+    """
+    pdf = pypdfium2.PdfDocument(raw_data)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def find_pages(raw_data: bytes, pattern: re.Pattern, pages: Optional[range] = None) -> list[int]:
+    """Return the indices of pages whose pdfium text matches ``pattern``.
+
+    A cheap prefilter for word-position parsing: pages that cannot contain
+    table rows (covers, notes, charts) are skipped without pdfminer layout
+    analysis. ``pattern`` should be a necessary condition for a data row
+    (e.g. a vintage year) that survives pdfium's looser spacing. If no page
+    matches, every page is returned, since pdfium's text layout can differ
+    from pdfplumber's.
+
+    Args:
+        raw_data: Raw PDF bytes.
+        pattern: Compiled regex searched in each page's text.
+        pages: Page indices to consider (default: all pages).
+
+    Returns:
+        Sorted 0-based indices of the matching pages.
+    """
+    texts = list(iter_page_text(raw_data))
+    candidates = range(len(texts)) if pages is None else pages
+    matched = [i for i in candidates if pattern.search(texts[i])]
+    return matched or list(candidates)
+
+
+def extract_row_words(
+    page, x_tolerance: float = 3, y_tolerance: float = 3
+) -> list[dict]:
+    """Group a page's characters into words carrying only text, x0 and top.
+
+    A lean equivalent of ``page.extract_words()`` with default settings for
+    the upright text found in pension fund tables: characters are clustered
+    into lines by ``top``, ordered left to right, and split into words at
+    whitespace or horizontal gaps wider than ``x_tolerance``. Skips the
+    per-word bbox/direction bookkeeping the adapters never read. Pages with
+    rotated text fall back to ``page.extract_words()``.
+
+    Args:
+        page: pdfplumber page.
+        x_tolerance: Max gap between characters of the same word.
+        y_tolerance: Max vertical distance between characters of one line.
+
+    Returns:
+        List of word dicts with "text", "x0" and "top" keys, in reading order.
+    """
+    chars = page.chars
+    if not chars:
+        return []
+    if not all(c["upright"] for c in chars):
+        return page.extract_words(x_tolerance=x_tolerance, y_tolerance=y_tolerance)
+
+    # Cluster distinct top positions into lines
+    line_of: dict[float, int] = {}
+    line = 0
+    last = None
+    for top in sorted({c["top"] for c in chars}):
+        if last is not None and top > last + y_tolerance:
+            line += 1
+        line_of[top] = line
+        last = top
+
+    words = []
+    current: list[dict] = []
+
+    def flush():
+        if current:
+            words.append({
+                "text": "".join(_LIGATURES.get(c["text"], c["text"] or "") for c in current),
+                "x0": min(c["x0"] for c in current),
+                "top": min(c["top"] for c in current),
+            })
+            current.clear()
+
+    prev_line = None
+    for char in sorted(chars, key=lambda c: (line_of[c["top"]], c["x0"])):
+        char_line = line_of[char["top"]]
+        if char_line != prev_line:
+            flush()
+            prev_line = char_line
+        if char["text"].isspace():
+            flush()
+            continue
+        if current:
+            prev = current[-1]
+            if (
+                char["x0"] < prev["x0"]
+                or char["x0"] > prev["x1"] + x_tolerance
+                or abs(char["top"] - prev["top"]) > y_tolerance
+            ):
+                flush()
+        current.append(char)
+    flush()
+
+    return words
+
+
+def words_to_text(words: list[dict], y_tolerance: float = 3) -> str:
+    """Rebuild a page's plain text from its already-extracted words.
+
+    Produces the same string as ``page.extract_text()`` (lines clustered
+    by ``top``, words joined by single spaces) without another pass over
+    the page's characters.
+
+    Args:
+        words: Word dicts from ``page.extract_words()``.
+        y_tolerance: Maximum ``top`` difference between words on one line.
+
+    Returns:
+        Page text with one line per text row.
+    """
+    get_top = itemgetter("top")
+    get_x0 = itemgetter("x0")
+    lines = cluster_objects(sorted(words, key=get_top), get_top, y_tolerance)
+    return "\n".join(
+        " ".join(w["text"] for w in sorted(line, key=get_x0)) for line in lines
+    )
+
+
+def _init_page_worker(raw_data: bytes):
+    """Open the PDF once in each worker process."""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(io.BytesIO(raw_data))
+
+
+def _parse_page(page_func: Callable, page, args: tuple, close_page: bool) -> list:
+    try:
+        return list(page_func(page, *args))
+    finally:
+        if close_page:
+            # Drop the page's cached chars and layout objects
+            page.close()
+
+
+def _run_page_task(page_func: Callable, page_index: int, args: tuple) -> list:
+    # Each page is parsed once per worker, so its objects are never reused
+    return _parse_page(page_func, _worker_pdf.pages[page_index], args, close_page=True)
+
+
+def map_pdf_pages(
+    page_func: Callable,
+    raw_data: bytes,
+    page_indices: list[int],
+    *args,
+    workers: int = 1,
+    pdf: Optional[pdfplumber.PDF] = None,
+    close_pages: bool = False,
+) -> list:
+    """Apply ``page_func(page, *args)`` to selected pages of a PDF.
+
+    ``page_func`` returns an iterable of results for its page (typically a
+    generator of records), which is drained while the page is still open.
+
+    With ``workers > 1`` pages are parsed in a process pool (pdfminer layout
+    analysis is CPU-bound and holds the GIL, so threads don't help). Each
+    worker opens the PDF once; ``page_func`` and ``args`` must be picklable,
+    e.g. a bound method of an adapter instance. Workers are not forked (see
+    _POOL_CONTEXT), so a script calling this needs an
+    ``if __name__ == "__main__"`` guard.
+
+    Args:
+        page_func: Callable taking a pdfplumber page followed by ``args`` and
+            returning an iterable of results.
+        raw_data: Raw PDF bytes.
+        page_indices: 0-based indices of the pages to process.
+        *args: Extra positional arguments passed to ``page_func``.
+        workers: Number of worker processes (1 = parse in this process).
+        pdf: Already-open document for ``raw_data`` to use when parsing in
+            this process, instead of opening a new one.
+        close_pages: Release each page's parsed objects once its results
+            are collected, keeping memory to about one page's worth. Leave
+            off when ``pdf`` is kept open to reuse page layouts later (see
+            PensionFundAdapter.get_pdf()). Worker processes always release.
+
+    Returns:
+        One list of results per page, in the same order as ``page_indices``.
+    """
+    if workers <= 1 or len(page_indices) <= 1:
+        if pdf is not None:
+            return [
+                _parse_page(page_func, pdf.pages[i], args, close_pages)
+                for i in page_indices
+            ]
+        with pdfplumber.open(io.BytesIO(raw_data)) as pdf:
+            return [_parse_page(page_func, pdf.pages[i], args, True) for i in page_indices]
+
+    logger.info(f"Parsing {len(page_indices)} PDF pages with {workers} workers")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_POOL_CONTEXT,
+        initializer=_init_page_worker,
+        initargs=(raw_data,),
+    ) as executor:
+        return list(executor.map(_run_page_task, repeat(page_func), page_indices, repeat(args)))
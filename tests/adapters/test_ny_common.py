@@ -105,3 +105,8 @@ class TestNYCommonAdapter:
         assert info["id"] == "ny_common"
         assert info["name"] == "New York State Common Retirement Fund"
         assert info["state"] == "NY"
+
+    def test_parallel_parse_matches_sequential(self, records):
+        raw = CACHE_FILE.read_bytes()
+        parallel = NYCommonAdapter(use_cache=True, workers=2).parse(raw)
+        assert parallel == records
@@ -0,0 +1,34 @@
+"""Tests for the compact PE fund record type."""
+
+import pickle
+
+import pytest
+
+from src.adapters.record import PEFundRecord
+
+
+class TestPEFundRecord:
+    def test_to_dict_has_all_record_fields_in_order(self):
+        record = PEFundRecord(fund_name_raw="Alpha Fund II", vintage_year=2019, commitment_mm=50.0)
+        d = record.to_dict()
+
+        assert list(d) == [
+            "fund_name_raw", "general_partner", "vintage_year", "asset_class",
+            "sub_strategy", "commitment_mm", "capital_called_mm",
+            "capital_distributed_mm", "remaining_value_mm", "net_irr",
+            "net_multiple", "dpi", "as_of_date", "source_url",
+            "source_document", "extraction_method", "extraction_confidence",
+        ]
+        assert d["fund_name_raw"] == "Alpha Fund II"
+        assert d["asset_class"] == "Private Equity"
+        assert d["commitment_mm"] == 50.0
+        assert d["dpi"] is None
+
+    def test_slotted(self):
+        record = PEFundRecord(fund_name_raw="Alpha Fund II")
+        with pytest.raises(AttributeError):
+            record.not_a_field = 1
+
+    def test_pickle_round_trip(self):
+        record = PEFundRecord(fund_name_raw="Alpha Fund II", net_irr=0.125)
+        assert pickle.loads(pickle.dumps(record)) == record
@@ -0,0 +1,25 @@
+"""Tests for the adapter registry."""
+
+import pytest
+
+from src.adapters import ADAPTER_REGISTRY, get_adapter, get_all_adapters, get_default_adapters
+
+
+class TestAdapterRegistry:
+    @pytest.mark.parametrize("name", sorted(ADAPTER_REGISTRY))
+    def test_every_adapter_accepts_workers(self, name):
+        adapter = get_adapter(name, use_cache=True, workers=3)
+        assert adapter.workers == 3
+        assert adapter.use_cache is True
+
+    def test_workers_defaults_to_one(self):
+        assert all(adapter.workers == 1 for adapter in get_all_adapters())
+
+    def test_default_adapters_pass_workers_through(self):
+        adapters = get_default_adapters(workers=2)
+        assert adapters
+        assert all(adapter.workers == 2 for adapter in adapters)
+
+    def test_unknown_adapter(self):
+        with pytest.raises(KeyError, match="Unknown adapter"):
+            get_adapter("nope")
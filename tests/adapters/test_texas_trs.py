@@ -57,3 +57,35 @@ class TestTexasTRSAdapter:
         assert info["id"] == "texas_trs"
         assert info["name"] == "Texas Teacher Retirement System"
         assert info["state"] == "TX"
+
+
+def _words(*rows):
+    """Word dicts for rows of (top, [(text, x0), ...])."""
+    return [
+        {"text": text, "x0": x0, "top": top}
+        for top, cells in rows for text, x0 in cells
+    ]
+
+
+class TestParsePEFundTable:
+    """Fund-table row parsing from word positions (no cache needed)."""
+
+    def test_parses_amounts_after_vintage(self, adapter):
+        words = _words(
+            (100, [("Alpha", 10), ("Fund", 40), ("II", 70), ("2019", 200),
+                   ("$125.0", 250), ("$98.3", 300), ("$40.1", 350),
+                   ("$110.2", 400), ("12.5%", 450), ("1.53x", 500)]),
+            (120, [("Total", 10), ("Private", 40), ("Equity", 80), ("2019", 200),
+                   ("$500.0", 250)]),
+        )
+        records = list(adapter._parse_pe_fund_table(words, ""))
+
+        assert len(records) == 1
+        r = records[0].to_dict()
+        assert r["fund_name_raw"] == "Alpha Fund II"
+        assert r["vintage_year"] == 2019
+        assert r["commitment_mm"] == 125.0
+        assert r["capital_called_mm"] == 98.3
+        assert r["capital_distributed_mm"] == 40.1
+        assert r["remaining_value_mm"] == 110.2
+        assert r["net_multiple"] == 1.53
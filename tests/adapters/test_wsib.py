@@ -104,3 +104,36 @@ class TestWSIBAdapter:
         assert info["id"] == "wsib"
         assert info["name"] == "WSIB"
         assert info["state"] == "WA"
+
+
+def _fund_row(name, y):
+    """One data row, each value placed in its WSIB column."""
+    values = ["6/30/2019", "10,000,000", "8,000,000", "2,000,000", "9,000,000",
+              "3,000,000", "12,000,000", "1.50", "4,000,000", "12.3%"]
+    xs = [270, 315, 360, 400, 450, 490, 530, 562, 598, 625]
+    return [(name, 20, y, 6)] + [(value, x, y, 6) for value, x in zip(values, xs)]
+
+
+class TestWSIBAsOfDate:
+    """The report date comes from the first page's header when it has one."""
+
+    def test_first_page_date_wins_over_later_pages(self, text_pdf_bytes):
+        raw = text_pdf_bytes(
+            [("Private Equity IRR Report Q2 2025", 20, 560, 6)] + _fund_row("Alpha Fund II", 500),
+            [("Values as of March 31, 2025", 20, 560, 6)] + _fund_row("Beta Fund III", 500),
+            page_size=(792, 612),
+        )
+        records = WSIBAdapter().parse(raw)
+
+        assert [r["fund_name_raw"] for r in records] == ["Alpha Fund II", "Beta Fund III"]
+        assert {r["as_of_date"] for r in records} == {"2025-06-30"}
+
+    def test_falls_back_to_later_pages(self, text_pdf_bytes):
+        raw = text_pdf_bytes(
+            [("Private Equity IRR Report", 20, 560, 6)] + _fund_row("Alpha Fund II", 500),
+            [("Values as of March 31, 2025", 20, 560, 6)] + _fund_row("Beta Fund III", 500),
+            page_size=(792, 612),
+        )
+        records = WSIBAdapter().parse(raw)
+
+        assert {r["as_of_date"] for r in records} == {"2025-03-31"}
@@ -0,0 +1,42 @@
+"""Shared test fixtures."""
+
+import ctypes
+import io
+
+import pypdfium2
+import pypdfium2.raw as pdfium_c
+import pytest
+
+
+def build_text_pdf(*pages, page_size=(612, 792)) -> bytes:
+    """Build a PDF in memory with Helvetica text placed at given positions.
+
+    Args:
+        *pages: One iterable of (text, x, y, size) items per page; x and y
+            are PDF user-space coordinates of the text's baseline origin.
+            An empty iterable gives a blank page.
+        page_size: (width, height) of every page in points.
+
+    Returns:
+        The PDF's bytes.
+    """
+    doc = pypdfium2.PdfDocument.new()
+    for items in pages:
+        page = doc.new_page(*page_size)
+        for text, x, y, size in items:
+            obj = pdfium_c.FPDFPageObj_NewTextObj(doc.raw, b"Helvetica", ctypes.c_float(size))
+            encoded = (text + "\0").encode("utf-16-le")
+            pdfium_c.FPDFText_SetText(obj, (ctypes.c_ushort * (len(encoded) // 2)).from_buffer_copy(encoded))
+            pdfium_c.FPDFPageObj_Transform(obj, 1, 0, 0, 1, x, y)
+            pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+        pdfium_c.FPDFPage_GenerateContent(page.raw)
+    buf = io.BytesIO()
+    doc.save(buf)
+    doc.close()
+    return buf.getvalue()
+
+
+@pytest.fixture
+def text_pdf_bytes():
+    """The build_text_pdf() PDF builder."""
+    return build_text_pdf
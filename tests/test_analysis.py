@@ -155,6 +155,16 @@ class TestAnalysisOutputFiles:
         assert "PensionA" in content
         assert "PensionB" in content
 
+    def test_parallel_run_matches_serial(self, db, tmp_path):
+        serial = {
+            name: path.read_bytes()
+            for name, path in analysis.run_all(db, workers=1).items()
+        }
+        parallel = analysis.run_all(db, workers=4)
+        assert list(parallel) == list(serial)
+        for name, path in parallel.items():
+            assert path.read_bytes() == serial[name], f"{name} differs when run in parallel"
+
 
 class TestAnalysisEmptyDatabase:
     """Test that analysis handles empty database gracefully."""
@@ -179,6 +189,60 @@ class TestAnalysisEmptyDatabase:
                 assert len(rows) == 0, f"{path.name} should have no data rows"
 
 
+class TestWriteCsv:
+    """Test the shared CSV writer."""
+
+    def test_formats_dict_and_sqlite_rows(self, db, tmp_path):
+        path = tmp_path / "out.csv"
+        rows = db.conn.execute(
+            "SELECT 'A' as fund_name, 0.125 as net_irr, 1500.0 as commitment_mm, "
+            "NULL as net_multiple"
+        )
+        analysis._write_csv(
+            path, list(rows) + [{"fund_name": "B", "net_irr": None,
+                                 "commitment_mm": "n/a", "net_multiple": 1.5}],
+            ["fund_name", "net_irr", "commitment_mm", "net_multiple"],
+            irr_fields=["net_irr"], mm_fields=["commitment_mm"], mult_fields=["net_multiple"],
+        )
+        with open(path, "r", encoding="utf-8") as f:
+            assert list(csv.reader(f)) == [
+                ["Fund Name", "Net IRR (%)", "Commitment ($M)", "Net Multiple (x)"],
+                ["A", "12.5%", "1,500.0", ""],
+                ["B", "", "n/a", "1.50x"],
+            ]
+
+    def test_single_field(self, tmp_path):
+        path = tmp_path / "out.csv"
+        analysis._write_csv(path, [{"fund_name": "A"}, {"fund_name": "B"}], ["fund_name"])
+        with open(path, "r", encoding="utf-8") as f:
+            assert list(csv.reader(f)) == [["Fund Name"], ["A"], ["B"]]
+
+    def test_missing_field_raises(self, tmp_path):
+        # Every caller selects all of its fieldnames; a gap is a bug, not a blank cell
+        with pytest.raises(KeyError):
+            analysis._write_csv(tmp_path / "out.csv", [{"fund_name": "A"}],
+                                ["fund_name", "net_irr"])
+
+
+class TestExtractGPFromFundName:
+    """Test GP name derivation from fund names."""
+
+    @pytest.mark.parametrize("suffix", analysis._GP_LEGAL_SUFFIXES)
+    def test_strips_every_legal_suffix(self, suffix):
+        assert analysis._extract_gp_from_fund_name(f"Acme Capital, {suffix}") == "Acme Capital"
+        assert analysis._extract_gp_from_fund_name(f"Acme Capital {suffix.lower()}") == "Acme Capital"
+
+    @pytest.mark.parametrize("name, expected", [
+        ("KKR North America Fund XII, L.P.", "KKR North America"),
+        ("Blackstone Capital Partners VI LP2", "Blackstone Capital Partners"),
+        ("KKR 2006 Fund", "KKR"),
+        ("Thoma Bravo Partners 2022", "Thoma Bravo Partners"),
+        ("Acme Growth Co", "Acme Growth Co"),
+    ])
+    def test_derives_gp(self, name, expected):
+        assert analysis._extract_gp_from_fund_name(name) == expected
+
+
 class TestAnalysisSummaryStats:
     """Test that summary statistics are reasonable."""
 
@@ -193,6 +257,41 @@ class TestAnalysisSummaryStats:
         assert any("KKR" in name for name in gp_names), \
             f"Expected KKR in GP penetration, got: {gp_names}"
 
+    def test_gp_penetration_aggregates_across_pensions(self, db, tmp_path):
+        path = analysis.generate_gp_penetration(db)
+        with open(path, "r", encoding="utf-8") as f:
+            rows = {r["General Partner"]: r for r in csv.DictReader(f)}
+
+        kkr = rows["KKR North America"]
+        assert kkr["# Pension Systems"] == "3"
+        assert kkr["# Funds"] == "1"
+        assert kkr["Total Commitment ($M)"] == "450.0"
+        assert kkr["Avg Net IRR (%)"] == "17.0%"
+        assert kkr["Avg Net Multiple (x)"] == "1.75x"
+        assert kkr["Pension Systems"] == "PensionA, PensionB, PensionC"
+
+    def test_gp_penetration_keeps_commas_in_pension_names(self, db, tmp_path):
+        db.upsert_pension_fund(id="pf1", name="Pension A, Inc.", state="CA")
+        path = analysis.generate_gp_penetration(db)
+        with open(path, "r", encoding="utf-8") as f:
+            rows = {r["General Partner"]: r for r in csv.DictReader(f)}
+
+        kkr = rows["KKR North America"]
+        assert kkr["# Pension Systems"] == "3"
+        assert kkr["Pension Systems"] == "Pension A, Inc., PensionB, PensionC"
+
+    def test_gp_penetration_shows_unregistered_pension_by_id(self, db, tmp_path):
+        db.conn.execute("PRAGMA foreign_keys=OFF")
+        db.conn.execute("DELETE FROM pension_funds WHERE id = 'pf3'")
+        path = analysis.generate_gp_penetration(db)
+        with open(path, "r", encoding="utf-8") as f:
+            rows = {r["General Partner"]: r for r in csv.DictReader(f)}
+
+        kkr = rows["KKR North America"]
+        assert kkr["# Pension Systems"] == "3"
+        assert kkr["Total Commitment ($M)"] == "450.0"
+        assert kkr["Pension Systems"] == "PensionA, PensionB, pf3"
+
     def test_pe_performance_includes_2015_2020_vintages(self, db, tmp_path):
         path = analysis.generate_buyout_performance(db)
         with open(path, "r", encoding="utf-8") as f:
@@ -235,3 +334,94 @@ class TestAnalysisSummaryStats:
         assert len(rows) >= 1
         # Should have vintage years as a column
         assert "Vintage Year" in reader.fieldnames
+
+
+class TestSampleData:
+    def test_ties_are_ordered_by_fund_name(self, tmp_path):
+        db = Database(tmp_path / "sample.db")
+        db.migrate()
+        try:
+            db.upsert_pension_fund(id="calpers", name="CalPERS", state="CA")
+            db.upsert_pension_fund(id="wsib", name="WSIB", state="WA")
+            # Inserted in reverse name order, all tied on fields and size
+            for fund_id, name in (("f3", "Gamma Fund I"), ("f2", "Beta Fund I"),
+                                  ("f1", "Alpha Fund I")):
+                db.upsert_fund(id=fund_id, fund_name=name, fund_name_raw=name)
+                for pf_id in ("calpers", "wsib"):
+                    db.upsert_commitment(
+                        pension_fund_id=pf_id, fund_id=fund_id, source_url="https://test.com",
+                        extraction_method="deterministic_pdf", commitment_mm=50.0,
+                        net_irr=0.1, net_multiple=1.2,
+                    )
+
+            path = analysis.generate_sample_data(db)
+            with open(path, "r", encoding="utf-8") as f:
+                rows = [(r["Pension Fund"], r["Fund Name"]) for r in csv.DictReader(f)]
+        finally:
+            db.close()
+
+        assert rows == [
+            (pension, name)
+            for pension in ("CalPERS", "WSIB")
+            for name in ("Alpha Fund I", "Beta Fund I", "Gamma Fund I")
+        ]
+
+
+class TestFundNumberMigration:
+    def test_migrate_backfills_fund_number_on_old_database(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        # funds table as created before the fund_number column existed
+        conn.execute(
+            "CREATE TABLE funds (id TEXT PRIMARY KEY, fund_name TEXT NOT NULL, "
+            "fund_name_raw TEXT NOT NULL, general_partner TEXT, "
+            "general_partner_normalized TEXT, vintage_year INTEGER, asset_class TEXT, "
+            "sub_strategy TEXT, fund_size_mm REAL, created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        conn.execute(
+            "INSERT INTO funds (id, fund_name, fund_name_raw, vintage_year) "
+            "VALUES ('f1', 'Nova Ventures II', 'Nova Ventures II', 2021)"
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(path)
+        db.migrate()
+        try:
+            assert db.get_fund("f1")["fund_number"] == 2
+        finally:
+            db.close()
+
+    def test_migrate_refills_stale_fund_number(self, tmp_path):
+        db = Database(tmp_path / "stale.db")
+        try:
+            db.migrate()
+            db.upsert_fund(id="f1", fund_name="Genstar XI Opportunities Fund I",
+                           fund_name_raw="Genstar XI Opportunities Fund I", vintage_year=2021)
+            # As filled by the previous extract_fund_number_value()
+            db.conn.execute("UPDATE funds SET fund_number = 11")
+            db.conn.execute("PRAGMA user_version = 1")
+            db.conn.commit()
+
+            db.migrate()
+            assert db.get_fund("f1")["fund_number"] == 1
+        finally:
+            db.close()
+
+    def test_emerging_managers_uses_fund_number(self, db, tmp_path):
+        db.upsert_fund(id="f5", fund_name="Vista Equity Fund 1",
+                       fund_name_raw="Vista Equity Fund 1, L.P.", vintage_year=2023,
+                       asset_class="Private Equity")
+        db.upsert_commitment(
+            pension_fund_id="pf2", fund_id="f5", source_url="https://test.com",
+            extraction_method="deterministic_pdf", commitment_mm=40.0,
+            vintage_year=2023, as_of_date="2025-06-30",
+        )
+        path = analysis.generate_emerging_manager_commitments(db)
+        with open(path, "r", encoding="utf-8") as f:
+            names = {r["Fund Name"] for r in csv.DictReader(f)}
+
+        assert "Vista Equity Fund 1" in names
+        assert "KKR North America XII" not in names
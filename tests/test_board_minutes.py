@@ -0,0 +1,201 @@
+"""Tests for board meeting minutes parsing."""
+
+import os
+
+import pytest
+
+from src import board_minutes
+from src.board_minutes import (
+    MIN_SECTION_GAP,
+    EventType,
+    _ingest,
+    detect_sections,
+    normalize_text,
+    parse_meeting_minutes,
+)
+
+
+def _line_pages(*pages):
+    """Pages of 10pt text lines, one list of lines per page, for build_text_pdf()."""
+    return [[(text, 50, 740 - 14 * i, 10) for i, text in enumerate(lines)] for lines in pages]
+
+
+MINUTES_PAGES = (
+    [
+        "Washington State Investment Board",
+        "Board Meeting Minutes",
+        "June 19, 2025",
+        "CALL TO ORDER",
+        "Chair Smith called the meeting to order at 9:30 a.m. with a quorum present.",
+        "PRIVATE MARKETS COMMITTEE REPORT",
+        "Treasurer Pellicciotti moved that the Board invest up to $175 million, plus fees "
+        "and expenses, in Menlo Ventures XVII, L.P.",
+        "Ms. Jones seconded the motion. The motion carried unanimously.",
+    ],
+    [
+        "PUBLIC COMMENT",
+        "No members of the public asked to address the Board at this meeting.",
+    ],
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_ingest_cache():
+    _ingest.cache_clear()
+    yield
+    _ingest.cache_clear()
+
+
+@pytest.fixture
+def minutes_pdf(tmp_path, text_pdf_bytes):
+    path = tmp_path / "minutes.pdf"
+    path.write_bytes(text_pdf_bytes(*_line_pages(*MINUTES_PAGES)))
+    return path
+
+
+@pytest.fixture
+def extractor_calls(monkeypatch):
+    """Record (extractor name, section title) for every gated extractor run."""
+    calls = []
+
+    def spy(extractor):
+        def wrapper(text, section=""):
+            calls.append((extractor.__name__, section))
+            return extractor(text, section)
+        return wrapper
+
+    monkeypatch.setattr(board_minutes, "SECTION_EXTRACTORS", [
+        (spy(extractor), keywords) for extractor, keywords in board_minutes.SECTION_EXTRACTORS
+    ])
+    return calls
+
+
+class TestParseMeetingMinutes:
+    def test_parses_basics(self, minutes_pdf):
+        minutes = parse_meeting_minutes(minutes_pdf)
+
+        assert minutes.pension_fund == "WSIB"
+        assert minutes.meeting_date == "June 19, 2025"
+        assert [s["title"] for s in minutes.sections] == [
+            "CALL TO ORDER", "PRIVATE MARKETS COMMITTEE REPORT", "PUBLIC COMMENT",
+        ]
+
+    def test_extracts_motion_and_commitment(self, minutes_pdf):
+        minutes = parse_meeting_minutes(minutes_pdf)
+
+        motions = [e for e in minutes.events if e.event_type == EventType.MOTION]
+        assert len(motions) == 1
+        assert motions[0].section == "PRIVATE MARKETS COMMITTEE REPORT"
+        assert motions[0].details["mover"] == "Treasurer Pellicciotti"
+        assert motions[0].details["outcome"] == "carried_unanimously"
+
+        commitments = [e for e in minutes.events if e.event_type == EventType.INVESTMENT_COMMITMENT]
+        assert len(commitments) == 1
+        assert commitments[0].details["amount_mm"] == 175.0
+        assert commitments[0].details["fund_name"].startswith("Menlo Ventures XVII")
+
+    def test_gated_extractors_fire_on_matching_sections(self, minutes_pdf, extractor_calls):
+        parse_meeting_minutes(minutes_pdf)
+
+        assert ("extract_motions", "PRIVATE MARKETS COMMITTEE REPORT") in extractor_calls
+        assert ("extract_investment_decisions", "PRIVATE MARKETS COMMITTEE REPORT") in extractor_calls
+        assert ("extract_public_comments", "PUBLIC COMMENT") in extractor_calls
+
+    def test_gated_extractors_skip_sections_without_keywords(self, minutes_pdf, extractor_calls):
+        parse_meeting_minutes(minutes_pdf)
+
+        # No extractor keyword appears in the call to order
+        assert not [call for call in extractor_calls if call[1] == "CALL TO ORDER"]
+        assert ("extract_motions", "PUBLIC COMMENT") not in extractor_calls
+        assert "extract_personnel_changes" not in {name for name, _ in extractor_calls}
+
+
+class TestIngestCache:
+    def test_unchanged_file_is_read_once(self, minutes_pdf):
+        first = parse_meeting_minutes(minutes_pdf)
+        second = parse_meeting_minutes(minutes_pdf)
+
+        info = _ingest.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert second.raw_text == first.raw_text
+        assert len(second.events) == len(first.events)
+
+    def test_edited_file_is_read_again(self, minutes_pdf, text_pdf_bytes):
+        parse_meeting_minutes(minutes_pdf)
+
+        stat = minutes_pdf.stat()
+        minutes_pdf.write_bytes(text_pdf_bytes(*_line_pages(
+            ["Oregon Investment Council", "Meeting Minutes", "May 1, 2025"],
+        )))
+        os.utime(minutes_pdf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        minutes = parse_meeting_minutes(minutes_pdf)
+
+        assert _ingest.cache_info().misses == 2
+        assert minutes.pension_fund == "Oregon"
+        assert minutes.meeting_date == "May 1, 2025"
+        assert minutes.events == []
+
+
+class TestDetectSections:
+    @staticmethod
+    def _two_headers(gap):
+        """Text whose two known headers start ``gap`` characters apart.
+
+        The headers are in title case so only the known-section pattern
+        (which matches from the preceding newline) finds them.
+        """
+        first = "\nCall to Order\n"
+        return first + "x" * (gap - len(first)) + "\nPublic Comment\nNone.\n"
+
+    @pytest.mark.parametrize("lowered", [False, True])
+    def test_headers_min_gap_apart_are_both_kept(self, lowered):
+        text = self._two_headers(MIN_SECTION_GAP)
+        sections = detect_sections(text, text.lower() if lowered else None)
+
+        assert [s["title"] for s in sections] == ["Call to Order", "Public Comment"]
+        assert sections[1]["start_pos"] - sections[0]["start_pos"] == MIN_SECTION_GAP
+
+    @pytest.mark.parametrize("lowered", [False, True])
+    def test_header_closer_than_min_gap_is_dropped(self, lowered):
+        text = self._two_headers(MIN_SECTION_GAP - 1)
+        sections = detect_sections(text, text.lower() if lowered else None)
+
+        assert [s["title"] for s in sections] == ["Call to Order"]
+        assert sections[0]["end_pos"] == len(text)
+
+    def test_same_header_found_by_two_patterns_is_one_section(self):
+        # Matched both as an all-caps line and as a known section keyword
+        sections = detect_sections("\nCALL TO ORDER\n" + "x" * 100)
+        assert [(s["title"], s["start_pos"]) for s in sections] == [("CALL TO ORDER", 0)]
+
+    def test_repeated_title_is_dropped(self):
+        text = ("\nCALL TO ORDER\n" + "x" * 100) * 2
+        assert [s["title"] for s in detect_sections(text)] == ["CALL TO ORDER"]
+
+
+class TestNormalizeText:
+    @pytest.mark.parametrize("raw, expected", [
+        # Mid-sentence break before a lowercase continuation
+        ("the Board\nvoted to approve", "the Board voted to approve"),
+        # Mid-name break
+        ("in Menlo\nVentures XVII", "in Menlo Ventures XVII"),
+        # Consecutive broken lines are all joined
+        ("Menlo\nVentures\nGrowth\nFund", "Menlo Ventures Growth Fund"),
+        ("Alpha\nBeta\nand others", "Alpha Beta and others"),
+        ("the\nnext\nline", "the next line"),
+    ])
+    def test_joins_broken_lines(self, raw, expected):
+        assert normalize_text(raw) == expected
+
+    @pytest.mark.parametrize("raw", [
+        "CALL TO ORDER\nThe meeting began.",
+        "adjourned.\nNext item",
+        "present\n\nPUBLIC COMMENT",
+        "seconded by\nIBM staff",
+        "Fund II\nBeta",
+    ])
+    def test_keeps_other_line_breaks(self, raw):
+        assert normalize_text(raw) == raw
+
+    def test_collapses_repeated_spaces(self):
+        assert normalize_text("Board   meeting  minutes") == "Board meeting minutes"
@@ -1,14 +1,21 @@
 """Tests for normalization utilities."""
 
+import math
+
+import pandas as pd
 import pytest
 from src.utils.normalization import (
     parse_dollar_amount,
+    parse_dollar_column,
     parse_percentage,
     parse_date,
     parse_multiple,
     parse_vintage_year,
     normalize_fund_name,
     normalize_gp_name,
+    join_number_tokens,
+    rejoin_split_number,
+    extract_fund_number_value,
 )
 
 
@@ -223,3 +230,82 @@ class TestNormalizeGpName:
     def test_basic(self):
         assert normalize_gp_name("Blackstone Group, L.P.") == "Blackstone Group"
         assert normalize_gp_name("KKR Mgmt LLC") == "KKR Management"
+
+
+class TestJoinNumberTokens:
+    def test_rejoins_split_digits(self):
+        assert join_number_tokens(["7", "0,000,000"]) == "70,000,000"
+
+    def test_keeps_space_between_non_digits(self):
+        assert join_number_tokens(["$", "1,200"]) == "$ 1,200"
+        assert join_number_tokens(["1.5", "x"]) == "1.5 x"
+
+    def test_empty(self):
+        assert join_number_tokens([]) == ""
+
+    def test_matches_rejoin_split_number(self):
+        for tokens in (["12", "345"], ["(1,000)"], ["N/A"], ["1", "(2)"],
+                       ["1", "2", "3"], ["1", "2", "3", "4"], ["1", "23", "4"],
+                       ["7", "0", "00,000", "x"]):
+            assert join_number_tokens(tokens) == rejoin_split_number(" ".join(tokens))
+
+    def test_single_digit_runs(self):
+        assert join_number_tokens(["1", "2", "3"]) == "12 3"
+        assert join_number_tokens(["1", "23", "4"]) == "1234"
+
+
+class TestExtractFundNumberValue:
+    def test_roman_numerals(self):
+        assert extract_fund_number_value("Nova Ventures I") == 1
+        assert extract_fund_number_value("Delta Partners II Parallel") == 2
+        assert extract_fund_number_value("Warburg Pincus XIV, L.P.") == 14
+
+    def test_arabic_fund_number(self):
+        assert extract_fund_number_value("Orbit Capital Fund 2 Feeder") == 2
+        assert extract_fund_number_value("Vista Equity Fund 1, L.P.") == 1
+
+    def test_no_number(self):
+        assert extract_fund_number_value("KKR Millennium Fund") is None
+        assert extract_fund_number_value("") is None
+
+    @pytest.mark.parametrize("name, expected", [
+        # A numeral ending the name counts, even a bare 'I'
+        ("2SP I", 1),
+        ("GSC I, L.P.", 1),
+        ("Base10 Series B I", 1),
+        ("Spectrum IX-A Discretionary Overage Progam II", 2),
+        # The number after "Fund" wins over a larger one elsewhere
+        ("Genstar XI Opportunities Fund I", 1),
+        ("Reverence Cap PTR Op Fd V (PE Fd III)", 5),
+        # Sub-vehicles keep their fund's number
+        ("Otro Capital Fund I-A", 1),
+        ("Ember Infrastructure Fund II-B", 2),
+        ("TA Select Opportunities Fund II-A", 2),
+        # Otherwise the largest numeral
+        ("Balderton Capital Growth II, S.", 2),
+        ("Delta Partners II Parallel", 2),
+        # A bare 'I' inside the name after a non-fund word is not a number
+        ("Madison CV I RUN", None),
+        ("ForCal I Investment Fund C.V.", None),
+    ])
+    def test_prefers_number_after_fund_or_at_end(self, name, expected):
+        assert extract_fund_number_value(name) == expected
+
+
+class TestParseDollarColumn:
+    def test_plain_figures(self):
+        result = parse_dollar_column(pd.Series(["45,000,000", "(1,500,000)", "$ 250,000"]))
+        assert result.tolist() == pytest.approx([45.0, -1.5, 0.25])
+
+    def test_matches_scalar_parser(self):
+        values = [
+            "1,234,567", "(45,000)", "$1.2M", "-", "", "N/A",
+            "(-500)", "$(500)", "12 345", ".5", "abc",
+        ]
+        result = parse_dollar_column(pd.Series(values))
+        for text, got in zip(values, result):
+            expected = parse_dollar_amount(text)
+            if expected is None:
+                assert math.isnan(got), text
+            else:
+                assert got == expected, text
@@ -0,0 +1,163 @@
+"""Tests for PDF parsing utilities."""
+
+import re
+from types import SimpleNamespace
+
+from pdfplumber.utils import extract_text, extract_words
+
+from src.adapters.base import rows_from_words
+from src.utils import pdf_parser
+from src.utils.pdf_parser import extract_row_words, find_pages, map_pdf_pages, words_to_text
+
+
+def _char(text, x0, top, width=4.0, size=6.0):
+    return {
+        "text": text, "x0": x0, "x1": x0 + width, "top": top,
+        "bottom": top + size, "doctop": top, "upright": True,
+        "size": size, "height": size, "width": width,
+    }
+
+
+def _line(text, x0, top):
+    return [_char(ch, x0 + i * 4.0, top) for i, ch in enumerate(text)]
+
+
+class FakePage:
+    def __init__(self, chars):
+        self.chars = chars
+
+    def extract_words(self, **kwargs):
+        return extract_words(self.chars, **kwargs)
+
+
+class TestExtractRowWords:
+    def test_matches_pdfplumber_words(self):
+        chars = (
+            _line("Alpha Fund II, L.P.", 20, 100)
+            + _line("2019", 245, 101)
+            + _line("7", 295, 100) + _line("0,000,000", 303, 100)
+            + _line("Beta Ventures", 20, 110)
+            + _line("(5.20)", 565, 111.5)
+        )
+        page = FakePage(chars)
+
+        expected = [(w["text"], w["x0"], w["top"]) for w in page.extract_words()]
+        actual = [(w["text"], w["x0"], w["top"]) for w in extract_row_words(page)]
+
+        assert actual == expected
+
+    def test_splits_on_gap_and_whitespace(self):
+        page = FakePage(_line("7", 295, 100) + _line("0,000 X", 303, 100))
+        assert [w["text"] for w in extract_row_words(page)] == ["7", "0,000", "X"]
+
+    def test_empty_page(self):
+        assert extract_row_words(FakePage([])) == []
+
+
+class TestWordsToText:
+    def test_matches_pdfplumber_text(self):
+        chars = (
+            _line("Private Equity", 20, 50)
+            + _line("Alpha Fund II", 20, 100) + _line("2019", 245, 101)
+            + _line("$12.5", 300, 99.5)
+            + _line("Beta", 20, 110)
+        )
+        page = FakePage(chars)
+        assert words_to_text(page.extract_words()) == extract_text(chars)
+
+    def test_empty(self):
+        assert words_to_text([]) == ""
+
+
+def _word(text, x0, top):
+    return {"text": text, "x0": x0, "top": top}
+
+
+class TestRowsFromWords:
+    def test_groups_rows_and_assigns_columns(self):
+        words = [
+            _word("2019", 120, 20.4), _word("Fund", 10, 19.8), _word("A", 40, 20.1),
+            _word("Fund", 10, 40), _word("B", 40, 40), _word("2020", 125, 40.2),
+        ]
+        rows = rows_from_words(words, [100])
+        assert rows == [["Fund A", "2019"], ["Fund B", "2020"]]
+
+    def test_require_skips_rows_without_match(self):
+        words = [_word("Total", 10, 10), _word("Fund", 10, 30), _word("2019", 120, 30)]
+        rows = rows_from_words(words, [100], require=re.compile(r"^\d{4}$"))
+        assert rows == [["Fund", "2019"]]
+
+    def test_number_columns_rejoin_split_digits(self):
+        words = [_word("Fund", 10, 10), _word("7", 110, 10), _word("0,000,000", 118, 10)]
+        assert rows_from_words(words, [100]) == [["Fund", "7 0,000,000"]]
+        assert rows_from_words(words, [100], number_columns={1}) == [["Fund", "70,000,000"]]
+
+
+def _one_line_pages(*page_texts):
+    """Pages of one line of 10pt text each, for build_text_pdf()."""
+    return [[(text, 50, 700, 10)] for text in page_texts]
+
+
+class TestFindPages:
+    YEAR_RE = re.compile(r"(?:19|20)\d{2}")
+
+    def test_returns_matching_pages(self, text_pdf_bytes):
+        raw = text_pdf_bytes(*_one_line_pages("Cover page", "Alpha Fund 2019 $12.5", "Notes", "Beta 2021"))
+        assert find_pages(raw, self.YEAR_RE) == [1, 3]
+
+    def test_restricts_to_given_pages(self, text_pdf_bytes):
+        raw = text_pdf_bytes(*_one_line_pages("Report 2025", "Alpha Fund 2019", "Notes"))
+        assert find_pages(raw, self.YEAR_RE, range(1, 3)) == [1]
+
+    def test_falls_back_to_all_pages_without_match(self, text_pdf_bytes):
+        raw = text_pdf_bytes(*_one_line_pages("Cover page", "Notes"))
+        assert find_pages(raw, self.YEAR_RE) == [0, 1]
+
+
+class _ClosablePage:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _page_words(page, suffix):
+    """Picklable page function for the process-pool test."""
+    return [word["text"] + suffix for word in page.extract_words()]
+
+
+class TestMapPdfPages:
+    def test_drains_page_generators_in_order(self):
+        pdf = SimpleNamespace(pages=[_ClosablePage(n) for n in range(3)])
+
+        def page_func(page, scale):
+            yield page.number * scale
+
+        assert map_pdf_pages(page_func, b"", [2, 0], 10, pdf=pdf) == [[20], [0]]
+
+    def test_close_pages_releases_parsed_pages(self):
+        pdf = SimpleNamespace(pages=[_ClosablePage(n) for n in range(3)])
+
+        map_pdf_pages(lambda page: [], b"", [0, 2], pdf=pdf, close_pages=True)
+
+        assert [p.closed for p in pdf.pages] == [True, False, True]
+
+    def test_keeps_pages_of_reused_document_by_default(self):
+        pdf = SimpleNamespace(pages=[_ClosablePage(0)])
+
+        map_pdf_pages(lambda page: [], b"", [0], pdf=pdf)
+
+        assert not pdf.pages[0].closed
+
+    def test_worker_pool_matches_in_process(self, text_pdf_bytes):
+        raw = text_pdf_bytes(*_one_line_pages("Alpha 2019", "Beta 2020", "Gamma 2021"))
+
+        pooled = map_pdf_pages(_page_words, raw, [2, 0, 1], "!", workers=2)
+
+        assert pooled == map_pdf_pages(_page_words, raw, [2, 0, 1], "!")
+        assert pooled == [["Gamma!", "2021!"], ["Alpha!", "2019!"], ["Beta!", "2020!"]]
+
+    def test_worker_pool_does_not_fork(self):
+        assert pdf_parser._POOL_CONTEXT.get_start_method() in ("forkserver", "spawn")
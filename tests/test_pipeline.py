@@ -1,5 +1,8 @@
 """Tests for the pipeline module."""
 
+import pickle
+import threading
+
 import pytest
 from pathlib import Path
 
@@ -215,3 +218,183 @@ class TestPipeline:
         engagements = db.get_consulting_engagements_joined(pension_fund_id="dummy")
         assert len(engagements) == 1
         assert engagements[0]["consulting_firm_name"] == "Test Consulting LLC"
+
+
+class TestTransaction:
+    def test_failed_adapter_rolls_back_only_its_own_rows(self, db, sample_records):
+        # The second record is missing its required source_url, so the
+        # adapter fails after its first commitment has been written
+        broken = [dict(sample_records[0]), dict(sample_records[1], fund_name_raw="Gamma Fund II")]
+        del broken[1]["source_url"]
+        good = DummyAdapter(records=sample_records)
+        bad = DummyAdapter(records=broken)
+        bad.pension_fund_id = "broken"
+
+        results = Pipeline(db).run([good, bad])
+
+        assert results["dummy"]["status"] == "completed"
+        assert results["broken"]["status"] == "error"
+        assert db.count_commitments("dummy") == 2
+        assert db.count_commitments("broken") == 0
+        assert db.get_last_extraction_run("broken")["status"] == "error"
+
+    def test_registry_forgets_rolled_back_funds(self, db, sample_records):
+        broken = [dict(sample_records[0], fund_name_raw="Gamma Fund II"), {"fund_name_raw": "X"}]
+        pipeline = Pipeline(db)
+        pipeline.run([DummyAdapter(records=broken)])
+
+        # The rolled-back fund must be created again, not resolved to a missing id
+        retry = DummyAdapter(records=[dict(sample_records[0], fund_name_raw="Gamma Fund II")])
+        results = pipeline.run([retry], force=True)
+        assert results["dummy"]["status"] == "completed"
+        assert db.count_commitments("dummy") == 1
+
+    def test_transaction_rolls_back_on_error(self, db, sample_records):
+        pipeline = Pipeline(db)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                pipeline.run([DummyAdapter(records=sample_records)])
+                raise RuntimeError("abort")
+
+        assert db.count_commitments() == 0
+
+    def test_nested_transaction_joins_outer(self, db, sample_records):
+        pipeline = Pipeline(db)
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                with db.transaction():
+                    pipeline.run([DummyAdapter(records=sample_records)])
+                raise RuntimeError("abort")
+
+        assert db.count_commitments() == 0
+
+
+class BarrierFetchAdapter(DummyAdapter):
+    """Adapter whose fetch only completes once every sibling fetch has started."""
+
+    def __init__(self, fund_id, barrier, **kwargs):
+        super().__init__(**kwargs)
+        self.pension_fund_id = fund_id
+        self._barrier = barrier
+
+    def fetch_source(self):
+        self._barrier.wait()
+        return b"test data"
+
+
+class TestConcurrentFetch:
+    def test_sources_are_fetched_concurrently(self, db):
+        # Sequential fetching would leave the barrier waiting and break it
+        barrier = threading.Barrier(3, timeout=5)
+        adapters = [BarrierFetchAdapter(f"fund{i}", barrier) for i in range(3)]
+
+        results = Pipeline(db, fetch_workers=3).run(adapters)
+
+        assert [r["status"] for r in results.values()] == ["completed"] * 3
+
+    def test_single_worker_still_runs_all_adapters(self, db):
+        adapters = [FailingFetchAdapter(), DummyAdapter()]
+
+        results = Pipeline(db, fetch_workers=1).run(adapters)
+
+        assert results["failing"]["status"] == "error"
+        assert "FileNotFoundError" in results["failing"]["error"]
+        assert results["dummy"]["status"] == "completed"
+
+
+class CountingAdapter(DummyAdapter):
+    """Adapter that counts parse() calls and caches parsed records."""
+
+    def __init__(self, cache_dir, **kwargs):
+        super().__init__(**kwargs)
+        self.parse_cache_dir = cache_dir
+        self.parse_calls = 0
+
+    def parse(self, raw_data) -> list[dict]:
+        self.parse_calls += 1
+        return self._records
+
+
+class TestParseCache:
+    def test_parse_cached_skips_reparse_of_same_bytes(self, tmp_path, sample_records):
+        adapter = CountingAdapter(tmp_path, records=sample_records)
+
+        first = adapter.parse_cached(b"same pdf bytes")
+        second = adapter.parse_cached(b"same pdf bytes")
+
+        assert adapter.parse_calls == 1
+        assert first == second == sample_records
+        assert len(list(tmp_path.glob("parsed_*.json"))) == 1
+
+    def test_parse_cached_reparses_changed_bytes(self, tmp_path, sample_records):
+        adapter = CountingAdapter(tmp_path, records=sample_records)
+
+        adapter.parse_cached(b"version 1")
+        adapter.parse_cached(b"version 2")
+
+        assert adapter.parse_calls == 2
+
+    def test_parse_cached_force_reparses_and_replaces(self, tmp_path, sample_records):
+        adapter = CountingAdapter(tmp_path, records=sample_records)
+        adapter.parse_cached(b"data")
+
+        adapter._records = sample_records[:1]
+        forced = adapter.parse_cached(b"data", force=True)
+        cached = adapter.parse_cached(b"data")
+
+        assert adapter.parse_calls == 2
+        assert forced == cached == sample_records[:1]
+
+    def test_parse_cached_reparses_after_parser_version_bump(self, tmp_path, sample_records):
+        adapter = CountingAdapter(tmp_path, records=sample_records)
+        adapter.parse_cached(b"data")
+
+        adapter.parser_version = 2
+        adapter.parse_cached(b"data")
+
+        assert adapter.parse_calls == 2
+
+    def test_forced_pipeline_run_reparses(self, db, tmp_path, sample_records):
+        adapter = CountingAdapter(tmp_path, records=sample_records)
+        pipeline = Pipeline(db)
+
+        pipeline.run([adapter])
+        pipeline.run([adapter], force=True)
+
+        assert adapter.parse_calls == 2
+
+    def test_parse_cached_without_cache_dir_always_parses(self, sample_records):
+        adapter = CountingAdapter(None, records=sample_records)
+
+        adapter.parse_cached(b"data")
+        adapter.parse_cached(b"data")
+
+        assert adapter.parse_calls == 2
+
+
+class TestGetPdf:
+    def test_reuses_document_for_same_bytes(self, sample_records, text_pdf_bytes):
+        adapter = DummyAdapter(records=sample_records)
+        raw = text_pdf_bytes([])
+
+        first = adapter.get_pdf(raw)
+        assert adapter.get_pdf(bytes(raw)) is first
+        assert len(first.pages) == 1
+        adapter.close_pdf()
+
+    def test_reopens_for_different_bytes(self, sample_records, text_pdf_bytes):
+        adapter = DummyAdapter(records=sample_records)
+
+        first = adapter.get_pdf(text_pdf_bytes([]))
+        second = adapter.get_pdf(text_pdf_bytes([]) + b"\n")
+        assert second is not first
+        adapter.close_pdf()
+        assert adapter._pdf is None
+
+    def test_open_document_is_not_pickled(self, sample_records, text_pdf_bytes):
+        adapter = DummyAdapter(records=sample_records)
+        adapter.get_pdf(text_pdf_bytes([]))
+
+        clone = pickle.loads(pickle.dumps(adapter))
+        assert clone._pdf is None
+        adapter.close_pdf()